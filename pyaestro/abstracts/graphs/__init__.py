@@ -1,7 +1,8 @@
-from pyaestro.abstracts.graphs._graph import Graph
+from pyaestro.abstracts.graphs._graph import Graph, KeyRemap
 
 __all__ = (
     "AcyclicGraph",
     "BidirectionalGraphMixin",
     "Graph",
+    "KeyRemap",
 )
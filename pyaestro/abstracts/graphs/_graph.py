@@ -1,20 +1,39 @@
 """A module of different graph types and other properties."""
+
 from __future__ import annotations
 
 import functools
 import json
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from os.path import abspath, dirname, join
 from types import TracebackType
-from typing import Callable, Dict, Hashable, Iterable, Type
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import jsonschema
 
 from pyaestro.bases import Specifiable
-from pyaestro.dataclasses import GraphEdge
+from pyaestro.dataclasses import GraphEdge, GraphEvent, GraphEventType
 from pyaestro.typing import Comparable
 
 SCHEMA_DIR = join(dirname(dirname(abspath(__file__))), "_schemas")
+# Either one key prefix per merged graph or a callable of (index, key).
+KeyRemap = Union[Sequence[Optional[str]], Callable[[int, Hashable], Hashable]]
+# Marks a result missing from the cache, since None is a valid result.
+_MISSING = object()
 
 
 class Graph(Specifiable, ABC):
@@ -33,7 +52,10 @@ class Graph(Specifiable, ABC):
                     f"Unable to call method '{method.__name__}' while in "
                     "read-only context."
                 )
-            return method(*args, **kwargs)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._mutated()
 
         return locked_function
 
@@ -45,10 +67,26 @@ class Graph(Specifiable, ABC):
         cls.remove_edge = cls._read_only(cls.remove_edge)
         cls.add_edge = cls._read_only(cls.add_edge)
         cls.delete_edges = cls._read_only(cls.delete_edges)
+        cls.merge = cls._read_only(cls.merge)
+
+    def __init__(
+        self, payloads: Optional[MutableMapping[Hashable, object]] = None
+    ):
+        """Initialize an empty graph.
 
-    def __init__(self):
-        self._vertices = {}
+        Args:
+            payloads (Optional[MutableMapping[Hashable, object]]): An empty
+            mapping to hold the values of vertices, such as a store that
+            spills rarely used values to disk. The structure of the graph is
+            kept separately, so traversals never read vertex values. Defaults
+            to a dict.
+        """
+        self._vertices = payloads if payloads is not None else {}
         self._locked = False
+        self._version = 0
+        self._results = {}
+        self._subscribers: List[Callable[[List[GraphEvent]], None]] = []
+        self._batch: Optional[Dict[Tuple[Hashable, ...], GraphEvent]] = None
 
     def __contains__(self, key: Hashable) -> bool:
         return self._vertices.__contains__(key)
@@ -61,6 +99,7 @@ class Graph(Specifiable, ABC):
 
     def __setitem__(self, key: Hashable, value: object) -> None:
         self._vertices[key] = value
+        self._emit(GraphEvent(GraphEventType.VERTEX_SET, key, value=value))
 
     def __delitem__(self, key: Hashable) -> None:
         try:
@@ -68,10 +107,47 @@ class Graph(Specifiable, ABC):
             del self._vertices[key]
         except KeyError as key_error:
             raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
+        self._emit(GraphEvent(GraphEventType.VERTEX_DELETED, key))
 
     def __repr__(self) -> str:
         return "{}()".format(type(self).__name__)
 
+    @property
+    def version(self) -> int:
+        """int: A counter that is incremented each time the graph mutates."""
+        return self._version
+
+    def _mutated(self) -> None:
+        """Record a mutation of the graph and invalidate cached results."""
+        self._version += 1
+        if self._results:
+            self._results.clear()
+
+    def memoize(self, key: Hashable, compute: Callable[[], object]) -> object:
+        """Return a cached result for 'key', computing it when missing.
+
+        Results are tied to the version of the graph they were computed at
+        and are discarded as soon as the graph is mutated.
+
+        Args:
+            key (Hashable): Key identifying an algorithm and its arguments.
+            compute (Callable[[], object]): Callable that produces the result
+            when it is not cached for the current version of the graph.
+
+        Returns:
+            object: The result of 'compute' for the current graph version.
+        """
+        cached = self._results.get(key, _MISSING)
+        if cached is not _MISSING and cached[0] == self._version:
+            return cached[1]
+
+        version = self._version
+        result = compute()
+        if version == self._version:
+            self._results[key] = (version, result)
+
+        return result
+
     def __iter__(self) -> Iterable[str]:
         for vertex in self._vertices.keys():
             yield vertex
@@ -79,6 +155,180 @@ class Graph(Specifiable, ABC):
     def __len__(self) -> int:
         return len(self._vertices)
 
+    def subscribe(self, callback: Callable[[List[GraphEvent]], None]) -> None:
+        """Subscribe to the change feed of the graph.
+
+        The callback receives a list of GraphEvent records after every
+        mutation, or a single coalesced list at the end of a batch.
+
+        Args:
+            callback (Callable[[List[GraphEvent]], None]): Callable invoked
+            with each list of change events.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(
+        self, callback: Callable[[List[GraphEvent]], None]
+    ) -> None:
+        """Remove a subscriber from the change feed of the graph.
+
+        Args:
+            callback (Callable[[List[GraphEvent]], None]): A callable that
+            was previously subscribed.
+
+        Raises:
+            ValueError: Raised when 'callback' is not subscribed.
+        """
+        self._subscribers.remove(callback)
+
+    @contextmanager
+    def batch(self) -> Iterator[Graph]:
+        """Collect change events and publish them once the context exits.
+
+        Events for the same vertex or edge are coalesced so that only the
+        latest is published, in the order the vertex or edge was first
+        changed. Nested batches are published by the outermost batch.
+
+        Returns:
+            Iterator[Graph]: A context yielding this graph.
+        """
+        outermost = self._batch is None
+        if outermost:
+            self._batch = {}
+
+        try:
+            yield self
+        finally:
+            if outermost:
+                events = list(self._batch.values())
+                self._batch = None
+                if events:
+                    self._publish(events)
+
+    def _emit(self, event: GraphEvent) -> None:
+        """Report a mutation to the change feed.
+
+        Args:
+            event (GraphEvent): The mutation that took place.
+        """
+        if not self._subscribers:
+            return
+
+        if self._batch is not None:
+            self._batch[event.target] = event
+        else:
+            self._publish([event])
+
+    def _publish(self, events: List[GraphEvent]) -> None:
+        for subscriber in list(self._subscribers):
+            subscriber(events)
+
+    def replay(self, events: Iterable[GraphEvent]) -> None:
+        """Apply a sequence of change events to the graph.
+
+        Events from a change feed may be replayed onto an empty graph to
+        rebuild the graph that produced them. Removals of vertices or edges
+        that do not exist are ignored, since coalescing may leave removals
+        of items created within the same batch.
+
+        Args:
+            events (Iterable[GraphEvent]): Change events to apply in order.
+        """
+        with self.batch():
+            for event in events:
+                self._apply_event(event)
+
+    def _apply_event(self, event: GraphEvent) -> None:
+        """Apply a single change event to the graph.
+
+        Events are applied through the public mutators of the graph, which
+        subclasses may bypass with a faster implementation.
+
+        Args:
+            event (GraphEvent): The change event to apply.
+        """
+        key, dest = event.key, event.destination
+        if event.kind is GraphEventType.VERTEX_SET:
+            self[key] = event.value
+        elif event.kind is GraphEventType.VERTEX_DELETED:
+            if key in self:
+                del self[key]
+        elif event.kind is GraphEventType.EDGE_SET:
+            self.add_edge(key, dest, event.value)
+        elif event.kind is GraphEventType.EDGE_REMOVED:
+            if key in self and any(
+                edge.destination == dest for edge in self.get_neighbors(key)
+            ):
+                self.remove_edge(key, dest)
+
+    @staticmethod
+    def _key_remappers(
+        graphs: Sequence[Graph], key_remap: Optional[KeyRemap]
+    ) -> List[Optional[Callable[[Hashable], Hashable]]]:
+        """Resolve a key remapping into one callable per merged graph.
+
+        Args:
+            graphs (Sequence[Graph]): Graphs that are being merged.
+            key_remap (Optional[KeyRemap]): The requested remapping.
+
+        Raises:
+            ValueError: Raised when the number of prefixes does not match the
+            number of graphs.
+
+        Returns:
+            List[Optional[Callable[[Hashable], Hashable]]]: A callable that
+            renames the keys of each graph, or None where keys are kept.
+        """
+        if key_remap is None:
+            return [None] * len(graphs)
+
+        if callable(key_remap):
+            return [
+                functools.partial(key_remap, index)
+                for index in range(len(graphs))
+            ]
+
+        if len(key_remap) != len(graphs):
+            raise ValueError(
+                f"Expected {len(graphs)} key prefixes, got {len(key_remap)}."
+            )
+        return [
+            None if prefix is None else lambda key, p=prefix: f"{p}{key}"
+            for prefix in key_remap
+        ]
+
+    def merge(
+        self, *graphs: Graph, key_remap: Optional[KeyRemap] = None
+    ) -> None:
+        """Merge the vertices and edges of other graphs into this graph.
+
+        Vertices that share a key are unified, with the value of the last
+        graph to contain the key taking precedence, and edges are unioned.
+
+        Args:
+            *graphs (Graph): Graphs whose contents are merged into this one.
+            key_remap (Optional[KeyRemap]): Either a sequence holding a key
+            prefix (or None) for each graph, or a callable taking the index
+            of a graph and one of its keys and returning the merged key.
+            Defaults to keeping keys as they are.
+
+        Raises:
+            ValueError: Raised when the number of prefixes does not match the
+            number of graphs.
+        """
+        remappers = self._key_remappers(graphs, key_remap)
+        with self.batch():
+            for graph, remap in zip(graphs, remappers):
+                remap = remap or (lambda key: key)
+                for key in graph:
+                    self[remap(key)] = graph[key]
+                for edge in graph.edges():
+                    self.add_edge(
+                        remap(edge.source),
+                        remap(edge.destination),
+                        edge.value,
+                    )
+
     def __enter__(self) -> Graph:
         self._locked = True
         return self
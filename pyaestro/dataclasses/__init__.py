@@ -1,3 +1,3 @@
-from pyaestro.dataclasses._graphs import GraphEdge
+from pyaestro.dataclasses._graphs import GraphEdge, GraphEvent, GraphEventType
 
-__all__ = ("GraphEdge",)
+__all__ = ("GraphEdge", "GraphEvent", "GraphEventType")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from enum import Enum
+from typing import Hashable, List, Optional, Tuple
 
 from pyaestro.typing import Comparable
 
@@ -17,3 +19,50 @@ class GraphEdge:
         if self.value < other.value:
             return True
         return False
+
+
+class GraphEventType(Enum):
+    """An enumeration of the mutations reported by a graph's change feed."""
+
+    VERTEX_SET = 0
+    VERTEX_DELETED = 1
+    EDGE_SET = 2
+    EDGE_REMOVED = 3
+    LAYER_ADDED = 4
+
+
+@dataclass
+class GraphEvent:
+    kind: GraphEventType
+    key: Hashable
+    destination: Hashable = None
+    value: object = None
+    #: Name of the layer of a layered graph that an edge event applies to.
+    layer: Optional[str] = None
+
+    @property
+    def target(self) -> Tuple[Hashable, ...]:
+        """Tuple[Hashable, ...]: The vertex, edge or layer of the event."""
+        if self.kind in (
+            GraphEventType.VERTEX_SET,
+            GraphEventType.VERTEX_DELETED,
+        ):
+            return (self.key,)
+        if self.kind is GraphEventType.LAYER_ADDED:
+            return (self.kind, self.key)
+        if self.layer is not None:
+            return (self.key, self.destination, self.layer)
+        return (self.key, self.destination)
+
+    def to_record(self) -> List:
+        """Convert the event into a JSON serializable list."""
+        record = [self.kind.name, self.key, self.destination, self.value]
+        if self.layer is not None:
+            record.append(self.layer)
+        return record
+
+    @classmethod
+    def from_record(cls, record: List) -> GraphEvent:
+        """Create an event from a list created by 'to_record'."""
+        kind, key, destination, value, *layer = record
+        return cls(GraphEventType[kind], key, destination, value, *layer)
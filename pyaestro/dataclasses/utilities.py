@@ -1,4 +1,5 @@
 """A module of data structures and other class important to workflow."""
+
 from multiprocessing import Condition, Lock
 
 
@@ -47,6 +48,46 @@ class MultiRdrWtrDict(dict):
         self._writers = 0
 
     def __getitem__(self, key):
+        self._acquire_read()
+        try:
+            return super().__getitem__(key)
+        finally:
+            self._release_read()
+
+    def items(self):
+        """Get a list of the items, copied while holding a read lock."""
+        self._acquire_read()
+        try:
+            return list(super().items())
+        finally:
+            self._release_read()
+
+    def values(self):
+        """Get a list of the values, copied while holding a read lock."""
+        self._acquire_read()
+        try:
+            return list(super().values())
+        finally:
+            self._release_read()
+
+    def __setitem__(self, key, value):
+        self._acquire_write()
+        try:
+            super().__setitem__(key, value)
+        finally:
+            self._release_write()
+
+    def update(self, *args, **kwargs):
+        """Insert several items while holding the write lock once."""
+        items = dict(*args, **kwargs)
+        self._acquire_write()
+        try:
+            super().update(items)
+        finally:
+            self._release_write()
+
+    def _acquire_read(self):
+        """Register a reader once no writer holds or waits for the lock."""
         self._g_lock.acquire()
         while self._w_wait or self._writers > 0:
             self._g_lock.wait()
@@ -54,27 +95,27 @@ class MultiRdrWtrDict(dict):
         self._readers += 1
         self._g_lock.release()
 
-        item = super().__getitem__(key)
-
+    def _release_read(self):
+        """Unregister a reader registered by _acquire_read."""
         self._g_lock.acquire()
         self._readers -= 1
+        # Both readers and writers may be waiting on the lock, so every
+        # waiter is woken to make sure a writer is among them.
         if self._readers == 0:
-            self._g_lock.notify()
+            self._g_lock.notify_all()
         self._g_lock.release()
 
-        return item
-
-    def __setitem__(self, key, value):
+    def _acquire_write(self):
+        """Take the lock once no readers are left, blocking new readers."""
         self._g_lock.acquire()
+        self._writers += 1
         self._w_wait = True
         while self._readers > 0:
             self._g_lock.wait()
 
-        super().__setitem__(key, value)
-
-        self._w_wait = False
+    def _release_write(self):
+        """Release the lock taken by _acquire_write and wake every waiter."""
         self._writers -= 1
-
-        if self._writers == 0:
-            self._g_lock.notifyAll()
+        self._w_wait = self._writers > 0
+        self._g_lock.notify_all()
         self._g_lock.release()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from enum import Enum
-from typing import List, Set, Union
+from typing import Iterable, Set
 
 
 class EdgeProperty(Enum):
@@ -12,14 +12,35 @@ class EdgeProperty(Enum):
 
     @classmethod
     def reconile_properties(
-        cls, properties: Union[List[EdgeProperty], Set[EdgeProperty]]
+        cls, properties: Iterable[EdgeProperty]
     ) -> Set[EdgeProperty]:
-        """[summary]
+        """Reduce a collection of edge properties to a consistent set.
+
+        Exactly one direction is kept in the result. FORWARD and BACKWARD
+        together are equivalent to BIDIRECTION, and FORWARD is assumed when
+        no direction is specified.
 
         Args:
-            properties (Union[List[EdgeProperty], Set[EdgeProperty]]):
+            properties (Iterable[EdgeProperty]): Requested edge properties.
+
+        Raises:
+            ValueError: Raised when the properties describe an acyclic set of
+            bidirectional edges, which would form a cycle per edge.
 
         Returns:
-            Set[EdgeProperty]: [description]
+            Set[EdgeProperty]: The reconciled set of edge properties.
         """
-        ...
+        reconciled = set(properties)
+        directions = {cls.FORWARD, cls.BACKWARD}
+
+        if directions <= reconciled:
+            reconciled.add(cls.BIDIRECTION)
+
+        if cls.BIDIRECTION in reconciled:
+            reconciled -= directions
+            if cls.ACYCLIC in reconciled:
+                raise ValueError("Bidirectional edges cannot be acyclic.")
+        elif cls.BACKWARD not in reconciled:
+            reconciled.add(cls.FORWARD)
+
+        return reconciled
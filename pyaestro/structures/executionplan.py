@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from ..graphs import MultiGraph, EdgeType
+from pyaestro.structures.constants import EdgeProperty
+from pyaestro.structures.graphs import MultiGraph
 
 
 class ExecutionPlan:
@@ -10,7 +11,9 @@ class ExecutionPlan:
 
         # Initialize the task graph
         self._task_graph = MultiGraph()
-        self._task_graph.add_layer("data", EdgeType.FORWARD_DIRECTIONAL)
+        self._task_graph.add_layer(
+            "data", {EdgeProperty.FORWARD, EdgeProperty.ACYCLIC}
+        )
 
     def add_task(self, task):
         ...
@@ -3,6 +3,18 @@ from pyaestro.structures.graphs._adjacency import (
     AdjacencyGraph,
     BidirectionalAdjGraph,
 )
+from pyaestro.structures.graphs._implicit import ImplicitGraph
+from pyaestro.structures.graphs._matrix import MatrixGraph
+from pyaestro.structures.graphs._multigraph import MultiGraph
+from pyaestro.structures.graphs._sharded import ShardedAdjGraph
 
 
-__all__ = ("AcyclicAdjGraph", "AdjacencyGraph", "BidirectionalAdjGraph")
+__all__ = (
+    "AcyclicAdjGraph",
+    "AdjacencyGraph",
+    "BidirectionalAdjGraph",
+    "ImplicitGraph",
+    "MatrixGraph",
+    "MultiGraph",
+    "ShardedAdjGraph",
+)
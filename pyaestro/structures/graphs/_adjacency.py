@@ -1,7 +1,28 @@
-from typing import Dict, Hashable, Iterable
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, insort
+from collections import deque
+from contextlib import contextmanager
+from hashlib import sha256
+from heapq import nsmallest
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from pyaestro.abstracts.graphs import Graph
-from pyaestro.dataclasses import GraphEdge
+from pyaestro.abstracts.graphs import Graph, KeyRemap
+from pyaestro.dataclasses import GraphEdge, GraphEvent, GraphEventType
 from pyaestro.structures.graphs.algorithms import (
     CycleCheckProtocol,
     DefaultCycleCheck,
@@ -9,25 +30,181 @@ from pyaestro.structures.graphs.algorithms import (
 from pyaestro.typing import Comparable
 
 
+def _canonical(value: object) -> str:
+    """Encode a value as text that does not depend on ordering or identity.
+
+    Sets are encoded in the order of their encoded members and mappings in
+    the order of their encoded keys, so keys of mixed types are supported
+    and equal values always encode equally, whatever their insertion order
+    or the hash seed of the interpreter.
+
+    Args:
+        value (object): A value built from None, bools, numbers, strings,
+        bytes, lists, tuples, sets and mappings.
+
+    Raises:
+        TypeError: Raised when 'value' contains an unsupported type.
+
+    Returns:
+        str: The canonical encoding of 'value'.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return json.dumps(value)
+    if isinstance(value, bytes):
+        return f"b'{value.hex()}'"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_canonical(item) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "set(" + ",".join(sorted(map(_canonical, value))) + ")"
+    if isinstance(value, Mapping):
+        items = sorted(
+            _canonical(key) + ":" + _canonical(item)
+            for key, item in value.items()
+        )
+        return "{" + ",".join(items) + "}"
+    raise TypeError(
+        f"Unable to fingerprint a value of type '{type(value).__name__}'."
+    )
+
+
 class AdjacencyGraph(Graph):
     """An adjacency list implementation of a directed graph."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        weight_index: bool = False,
+        payloads: Optional[MutableMapping[Hashable, object]] = None,
+    ):
+        """Initialize an empty graph.
+
+        Args:
+            weight_index (bool): Maintain a weight-ordered list of neighbors
+            for every vertex. Defaults to False.
+            payloads (Optional[MutableMapping[Hashable, object]]): An empty
+            mapping to hold the values of vertices. Defaults to a dict.
+        """
         self._adj_table = {}
-        super().__init__()
+        self._weight_index: Optional[Dict[Hashable, List[GraphEdge]]] = (
+            {} if weight_index else None
+        )
+        self._undo_log: Optional[
+            List[Tuple[Callable, Tuple, Tuple[Hashable]]]
+        ] = None
+        # Sources of the edges that lead into each vertex, when maintained.
+        self._reverse_index: Optional[Dict[Hashable, List[Hashable]]] = None
+        super().__init__(payloads)
 
     def __setitem__(self, key: Hashable, value: object) -> None:
+        if self._undo_log is not None:
+            if key in self._vertices:
+                undo = (AdjacencyGraph.__setitem__, (key, self._vertices[key]))
+            else:
+                undo = (AdjacencyGraph.__delitem__, (key,))
+            self._undo_log.append(undo + ((key,),))
+
         super().__setitem__(key, value)
         if key not in self._adj_table:
             self._adj_table[key] = {}
+            if self._weight_index is not None:
+                self._weight_index[key] = []
 
     def __delitem__(self, key: Hashable) -> None:
+        # Only read the old value when it is needed to undo the deletion, so
+        # that deleting a spilled value does not load it back into memory.
+        if self._undo_log is not None and key in self._vertices:
+            value = self._vertices[key]
+        else:
+            value = None
         try:
             super().__delitem__(key)
             del self._adj_table[key]
+            if self._weight_index is not None:
+                del self._weight_index[key]
         except KeyError as key_error:
             raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
 
+        if self._undo_log is not None:
+            self._undo_log.append(
+                (AdjacencyGraph.__setitem__, (key, value), (key,))
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[AdjacencyGraph]:
+        """Group mutations so that they are undone if an exception is raised.
+
+        While a transaction is open, each mutation records how to undo
+        itself. Leaving the context normally commits by discarding that log;
+        leaving it with an exception undoes the mutations made within it, in
+        reverse order, and re-raises. Transactions may be nested, in which
+        case an inner transaction only rolls back its own mutations.
+
+        Returns:
+            Iterator[AdjacencyGraph]: A context yielding this graph.
+        """
+        outermost = self._undo_log is None
+        if outermost:
+            self._undo_log = []
+        savepoint = len(self._undo_log)
+
+        try:
+            yield self
+        except BaseException:
+            self._rollback(savepoint)
+            raise
+        finally:
+            if outermost:
+                self._undo_log = None
+
+    def _rollback(self, savepoint: int) -> None:
+        """Undo logged mutations until the log is back to 'savepoint' long.
+
+        Args:
+            savepoint (int): Length of the undo log to roll back to.
+        """
+        undo_log = self._undo_log
+        # Suspend logging so the undo operations are not logged themselves.
+        self._undo_log = None
+        try:
+            while len(undo_log) > savepoint:
+                undo, args, touched = undo_log.pop()
+                undo(self, *args)
+                self._restored(touched)
+        finally:
+            self._undo_log = undo_log
+
+    def _restored(self, keys: Tuple[Hashable]) -> None:
+        """Notify the graph that a rollback, replay or merge modified vertices.
+
+        Args:
+            keys (Tuple[Hashable]): Vertices whose value or in-edges changed.
+        """
+
+    def _restore_edges(self, key: Hashable, adj_list: Dict) -> None:
+        """Re-add a set of edges removed from a vertex.
+
+        Args:
+            key (Hashable): Source vertex of the edges.
+            adj_list (Dict): Mapping of destinations to edge weights.
+        """
+        for dest, weight in adj_list.items():
+            AdjacencyGraph.add_edge(self, key, dest, weight)
+
+    def _unreverse_edge(self, a: Hashable, b: Hashable) -> None:
+        """Remove the edge (a, b) from the reverse index of vertex 'b'."""
+        sources = self._reverse_index[b]
+        sources.remove(a)
+        if not sources:
+            del self._reverse_index[b]
+
+    def _unindex_edge(self, a: Hashable, b: Hashable, weight: object) -> None:
+        """Remove the edge (a, b) from the weight index of vertex 'a'."""
+        ordered = self._weight_index[a]
+        edge = GraphEdge(a, b, weight)
+        i = bisect_left(ordered, edge)
+        while ordered[i].destination != b:
+            i += 1
+        del ordered[i]
+
     def edges(self) -> Iterable[GraphEdge]:
         """Iterate the edges of a graph.
 
@@ -57,6 +234,54 @@ class AdjacencyGraph(Graph):
         except KeyError as key_error:
             raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
 
+    def get_min_neighbor(self, node: Hashable) -> Optional[GraphEdge]:
+        """Get the neighbor of a node connected by the smallest weight.
+
+        This is O(1) when the graph maintains a weight index and linear in
+        the degree of the node otherwise.
+
+        Args:
+            node (Hashable): Key whose lightest neighbor should be returned.
+
+        Raises:
+            KeyError: Raised when 'node' does not exist in the graph.
+
+        Returns:
+            Optional[GraphEdge]: The lightest edge leaving 'node', or None if
+            'node' has no neighbors.
+        """
+        neighbors = self.get_ordered_neighbors(node, 1)
+        return neighbors[0] if neighbors else None
+
+    def get_ordered_neighbors(
+        self, node: Hashable, k: Optional[int] = None
+    ) -> List[GraphEdge]:
+        """Get the neighbors of a node in ascending order of weight.
+
+        Args:
+            node (Hashable): Key whose neighbors should be returned.
+            k (Optional[int]): Maximum number of neighbors to return.
+            Defaults to all neighbors.
+
+        Raises:
+            KeyError: Raised when 'node' does not exist in the graph.
+
+        Returns:
+            List[GraphEdge]: Up to 'k' edges leaving 'node', lightest first.
+        """
+        if self._weight_index is None:
+            neighbors = list(self.get_neighbors(node))
+            if k is None:
+                return sorted(neighbors)
+            return nsmallest(k, neighbors)
+
+        try:
+            ordered = self._weight_index[node]
+        except KeyError as key_error:
+            raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
+
+        return ordered[:k] if k is not None else list(ordered)
+
     def add_edge(
         self, a: Hashable, b: Hashable, weight: Comparable = 0
     ) -> None:
@@ -74,11 +299,29 @@ class AdjacencyGraph(Graph):
         """
 
         try:
-            # Add each edge
-            self._adj_table[a][b] = weight
+            adj_list = self._adj_table[a]
         except KeyError as key_error:
             raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
 
+        if self._undo_log is not None:
+            if b in adj_list:
+                undo = (AdjacencyGraph.add_edge, (a, b, adj_list[b]))
+            else:
+                undo = (AdjacencyGraph.remove_edge, (a, b))
+            self._undo_log.append(undo + ((b,),))
+
+        if self._weight_index is not None:
+            if b in adj_list:
+                self._unindex_edge(a, b, adj_list[b])
+            insort(self._weight_index[a], GraphEdge(a, b, weight))
+
+        if self._reverse_index is not None and b not in adj_list:
+            self._reverse_index.setdefault(b, []).append(a)
+
+        # Add each edge
+        adj_list[b] = weight
+        self._emit(GraphEvent(GraphEventType.EDGE_SET, a, b, weight))
+
     def remove_edge(self, a: Hashable, b: Hashable) -> None:
         """Remove a directed edge from node 'a' to node 'b' to the graph.
 
@@ -91,10 +334,21 @@ class AdjacencyGraph(Graph):
             do not exist in the graph.
         """
         try:
-            del self._adj_table[a][b]
+            weight = self._adj_table[a].pop(b)
         except KeyError as key_error:
             raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
 
+        if self._undo_log is not None:
+            self._undo_log.append(
+                (AdjacencyGraph.add_edge, (a, b, weight), (b,))
+            )
+
+        if self._weight_index is not None:
+            self._unindex_edge(a, b, weight)
+        if self._reverse_index is not None:
+            self._unreverse_edge(a, b)
+        self._emit(GraphEvent(GraphEventType.EDGE_REMOVED, a, b))
+
     def delete_edges(self, key: Hashable) -> None:
         """Delete all edges associated to a key from the Graph.
 
@@ -106,14 +360,302 @@ class AdjacencyGraph(Graph):
             graph.
         """
         try:
-            self._adj_table[key].clear()
+            adj_list = self._adj_table[key]
         except KeyError as key_error:
             raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
 
+        if self._undo_log is not None and adj_list:
+            self._undo_log.append(
+                (
+                    AdjacencyGraph._restore_edges,
+                    (key, dict(adj_list)),
+                    tuple(adj_list),
+                )
+            )
+
+        if self._subscribers:
+            for dest in adj_list:
+                self._emit(GraphEvent(GraphEventType.EDGE_REMOVED, key, dest))
+
+        if self._reverse_index is not None:
+            for dest in adj_list:
+                self._unreverse_edge(key, dest)
+        adj_list.clear()
+        if self._weight_index is not None:
+            self._weight_index[key].clear()
+
+    def _apply_event(self, event: GraphEvent) -> None:
+        """Apply a single change event to the graph.
+
+        Args:
+            event (GraphEvent): The change event to apply.
+        """
+        key, dest = event.key, event.destination
+        if event.kind is GraphEventType.VERTEX_SET:
+            AdjacencyGraph.__setitem__(self, key, event.value)
+        elif event.kind is GraphEventType.VERTEX_DELETED:
+            if key not in self._adj_table:
+                return
+            AdjacencyGraph.__delitem__(self, key)
+        elif event.kind is GraphEventType.EDGE_SET:
+            AdjacencyGraph.add_edge(self, key, dest, event.value)
+        elif event.kind is GraphEventType.EDGE_REMOVED:
+            if dest not in self._adj_table.get(key, ()):
+                return
+            AdjacencyGraph.remove_edge(self, key, dest)
+
+        self._restored(event.target)
+
+    def _union(
+        self, graphs: Tuple[Graph], key_remap: Optional[KeyRemap]
+    ) -> Tuple[Dict[Hashable, object], Dict[Hashable, Dict]]:
+        """Union the vertex and adjacency tables of several graphs.
+
+        Args:
+            graphs (Tuple[Graph]): Graphs to union.
+            key_remap (Optional[KeyRemap]): Remapping applied to the keys of
+            each graph.
+
+        Returns:
+            Tuple[Dict[Hashable, object], Dict[Hashable, Dict]]: The merged
+            vertex values and adjacency lists, keyed by remapped keys.
+        """
+        vertices: Dict[Hashable, object] = {}
+        adj_table: Dict[Hashable, Dict] = {}
+        remappers = self._key_remappers(graphs, key_remap)
+        for graph, remap in zip(graphs, remappers):
+            # Other kinds of graphs are read through the Graph interface.
+            if isinstance(graph, AdjacencyGraph):
+                values = graph._vertices
+            else:
+                values = {key: graph[key] for key in graph}
+            if isinstance(graph, AdjacencyGraph) and not (
+                isinstance(graph, BidirectionalAdjGraph) and graph.single_copy
+            ):
+                rows = graph._adj_table
+            else:
+                rows = {
+                    key: {
+                        edge.destination: edge.value
+                        for edge in graph.get_neighbors(key)
+                    }
+                    for key in values
+                }
+
+            if remap is None:
+                # Whole tables can be copied and updated in bulk.
+                vertices.update(values)
+                for src, row in rows.items():
+                    if src in adj_table:
+                        adj_table[src].update(row)
+                    else:
+                        adj_table[src] = dict(row)
+                continue
+
+            names = {key: remap(key) for key in values}
+            vertices.update(
+                (names[key], value) for key, value in values.items()
+            )
+            for src, row in rows.items():
+                renamed = {
+                    names[dest] if dest in names else remap(dest): weight
+                    for dest, weight in row.items()
+                }
+                src = names[src] if src in names else remap(src)
+                if src in adj_table:
+                    adj_table[src].update(renamed)
+                else:
+                    adj_table[src] = renamed
+
+        return vertices, adj_table
+
+    def merge(
+        self, *graphs: Graph, key_remap: Optional[KeyRemap] = None
+    ) -> None:
+        """Merge the vertices and edges of other graphs into this graph.
+
+        Vertices that share a key are unified, with the value of the last
+        graph to contain the key taking precedence, and edges are unioned.
+        Vertex and adjacency tables are merged in bulk instead of one edge
+        at a time, and the merge is undone as a whole by a transaction.
+
+        Args:
+            *graphs (Graph): Graphs whose contents are merged into this one.
+            key_remap (Optional[KeyRemap]): Either a sequence holding a key
+            prefix (or None) for each graph, or a callable taking the index
+            of a graph and one of its keys and returning the merged key.
+            Defaults to keeping keys as they are.
+
+        Raises:
+            ValueError: Raised when the number of prefixes does not match the
+            number of graphs.
+        """
+        vertices, adj_table = self._union(graphs, key_remap)
+        if self._undo_log is not None:
+            added = tuple(key for key in vertices if key not in self._vertices)
+            prior = {
+                key: self._vertices[key]
+                for key in vertices
+                if key in self._vertices
+            }
+            prior_rows = {
+                src: dict(self._adj_table[src])
+                for src in adj_table
+                if src in self._adj_table
+            }
+            self._undo_log.append(
+                (AdjacencyGraph._unmerge, (added, prior, prior_rows), added)
+            )
+
+        self._vertices.update(vertices)
+        for key in vertices:
+            if key not in self._adj_table:
+                self._adj_table[key] = {}
+                if self._weight_index is not None:
+                    self._weight_index[key] = []
+
+        touched = set(vertices)
+        for src, row in adj_table.items():
+            adj_list = self._adj_table[src]
+            if self._reverse_index is not None:
+                for dest in row:
+                    if dest not in adj_list:
+                        self._reverse_index.setdefault(dest, []).append(src)
+            adj_list.update(row)
+            touched.update(row)
+            if self._weight_index is not None:
+                self._weight_index[src] = sorted(
+                    GraphEdge(src, dest, weight)
+                    for dest, weight in self._adj_table[src].items()
+                )
+
+        if self._subscribers:
+            with self.batch():
+                for key, value in vertices.items():
+                    self._emit(
+                        GraphEvent(GraphEventType.VERTEX_SET, key, value=value)
+                    )
+                for src, row in adj_table.items():
+                    for dest, weight in row.items():
+                        self._emit(
+                            GraphEvent(
+                                GraphEventType.EDGE_SET, src, dest, weight
+                            )
+                        )
+
+        self._restored(tuple(touched))
+
+    def _unmerge(
+        self,
+        added: Tuple[Hashable],
+        prior: Dict[Hashable, object],
+        prior_rows: Dict[Hashable, Dict],
+    ) -> None:
+        """Undo a merge, restoring vertices and edges to their prior state.
+
+        Args:
+            added (Tuple[Hashable]): Vertices that the merge added.
+            prior (Dict[Hashable, object]): Prior values of vertices that the
+            merge overwrote.
+            prior_rows (Dict[Hashable, Dict]): Prior adjacency lists of
+            vertices that the merge added edges to.
+        """
+        touched = set(prior)
+        for src, row in prior_rows.items():
+            adj_list = self._adj_table[src]
+            for dest in [dest for dest in adj_list if dest not in row]:
+                AdjacencyGraph.remove_edge(self, src, dest)
+                touched.add(dest)
+            for dest, weight in row.items():
+                if adj_list[dest] != weight:
+                    AdjacencyGraph.add_edge(self, src, dest, weight)
+                    touched.add(dest)
+
+        for key in added:
+            AdjacencyGraph.__delitem__(self, key)
+        for key, value in prior.items():
+            AdjacencyGraph.__setitem__(self, key, value)
+        self._restored(tuple(touched))
+
 
 class BidirectionalAdjGraph(AdjacencyGraph):
     """An adjacency list implementation a bidirectional graph."""
 
+    def __init__(
+        self,
+        weight_index: bool = False,
+        single_copy: bool = False,
+        payloads: Optional[MutableMapping[Hashable, object]] = None,
+    ):
+        """Initialize an empty graph.
+
+        By default each edge is stored twice, once from each of its ends.
+        Single copy storage keeps each edge once, in the adjacency list of
+        one of its ends, and finds the edges stored by other vertices through
+        a reverse index. Neighbors are still found in time linear in the
+        degree of a vertex, edges() reports each edge once, and adding or
+        removing an edge costs a single write.
+
+        Args:
+            weight_index (bool): Maintain a weight-ordered list of neighbors
+            for every vertex. Defaults to False.
+            single_copy (bool): Store each edge once. Defaults to False.
+            payloads (Optional[MutableMapping[Hashable, object]]): An empty
+            mapping to hold the values of vertices. Defaults to a dict.
+
+        Raises:
+            ValueError: Raised when a weight index is requested for single
+            copy storage.
+        """
+        if weight_index and single_copy:
+            raise ValueError(
+                "A weight index is not supported with single copy storage."
+            )
+
+        super().__init__(weight_index=weight_index, payloads=payloads)
+        if single_copy:
+            self._reverse_index = {}
+
+    @property
+    def single_copy(self) -> bool:
+        """bool: True if each edge of the graph is stored once."""
+        return self._reverse_index is not None
+
+    def _owner(self, a: Hashable, b: Hashable) -> Hashable:
+        """Get the end of an existing edge whose adjacency list holds it.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+
+        Returns:
+            Hashable: 'b' if the edge is stored by 'b', otherwise 'a'.
+        """
+        if a != b and a in self._adj_table.get(b, ()):
+            return b
+        return a
+
+    def get_neighbors(self, node: Hashable) -> Iterable[GraphEdge]:
+        """Get the connected neighbors of the specified node.
+
+        Args:
+            a (Hashable): Key whose neighbor's should be returned.
+
+        Raises:
+            KeyError: Raised when 'key' does not exist in the graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of GraphEdge records that
+            represent the neighbors of the vertex named 'key'.
+        """
+        yield from super().get_neighbors(node)
+        if self._reverse_index is None:
+            return
+
+        for src in self._reverse_index.get(node, ()):
+            if src != node:
+                yield GraphEdge(node, src, self._adj_table[src][node])
+
     def add_edge(self, a: Hashable, b: Hashable, weight: Comparable = 0):
         """Add an undirected edge to the graph.
 
@@ -127,8 +669,18 @@ class BidirectionalAdjGraph(AdjacencyGraph):
             KeyError: Raised when either node 'a' or node 'b'
             do not exist in the graph.
         """
+        if self._reverse_index is None:
+            super().add_edge(a, b, weight)
+            super().add_edge(b, a, weight)
+            return
+
+        if b not in self._adj_table:
+            raise KeyError(f"Key '{b}' not found in graph.")
+        if a not in self._adj_table:
+            raise KeyError(f"Key '{a}' not found in graph.")
+        if self._owner(a, b) == b:
+            a, b = b, a
         super().add_edge(a, b, weight)
-        super().add_edge(b, a, weight)
 
     def remove_edge(self, a: Hashable, b: Hashable) -> None:
         """Remove the bidirectional edge from nodes 'a' to 'b' from the graph.
@@ -141,17 +693,234 @@ class BidirectionalAdjGraph(AdjacencyGraph):
             KeyError: Raised when either node 'a' or node 'b'
             do not exist in the graph.
         """
-        if a != b:
+        if self._reverse_index is not None:
+            if b not in self._adj_table:
+                raise KeyError(f"Key '{b}' not found in graph.")
+            if a in self._adj_table and self._owner(a, b) == b:
+                a, b = b, a
+        elif a != b:
             super().remove_edge(b, a)
         super().remove_edge(a, b)
 
+    def delete_edges(self, key: Hashable) -> None:
+        """Delete all edges associated to a key from the Graph.
+
+        Args:
+            key (Hashable): Key to a node whose edges are to be removed.
+
+        Raises:
+            KeyError: Raised when either node 'key' or does not exist in the
+            graph.
+        """
+        super().delete_edges(key)
+        if self._reverse_index is None:
+            return
+
+        for src in list(self._reverse_index.get(key, ())):
+            super().remove_edge(src, key)
+
+    def _union(
+        self, graphs: Tuple[Graph], key_remap: Optional[KeyRemap]
+    ) -> Tuple[Dict[Hashable, object], Dict[Hashable, Dict]]:
+        """Union the vertex and adjacency tables of several graphs.
+
+        Edges merged from directed graphs are mirrored so that every merged
+        edge is bidirectional.
+
+        Args:
+            graphs (Tuple[Graph]): Graphs to union.
+            key_remap (Optional[KeyRemap]): Remapping applied to the keys of
+            each graph.
+
+        Raises:
+            KeyError: Raised when an edge leads to a vertex that exists in
+            neither the merged graphs nor this graph.
+
+        Returns:
+            Tuple[Dict[Hashable, object], Dict[Hashable, Dict]]: The merged
+            vertex values and adjacency lists, keyed by remapped keys.
+        """
+        vertices, adj_table = super()._union(graphs, key_remap)
+        for src, row in list(adj_table.items()):
+            for dest, weight in row.items():
+                if dest not in vertices and dest not in self._vertices:
+                    raise KeyError(f"Key '{dest}' not found in graph.")
+                if dest != src:
+                    adj_table.setdefault(dest, {})[src] = weight
+
+        if self._reverse_index is None:
+            return vertices, adj_table
+
+        # Keep one copy of each edge, where this graph already stores it.
+        canonical: Dict[Hashable, Dict] = {}
+        for src, row in adj_table.items():
+            for dest, weight in row.items():
+                if src in canonical.get(dest, ()):
+                    continue
+                if self._owner(src, dest) == dest:
+                    canonical.setdefault(dest, {})[src] = weight
+                else:
+                    canonical.setdefault(src, {})[dest] = weight
+
+        return vertices, canonical
+
 
 class AcyclicAdjGraph(AdjacencyGraph):
     """A directed acyclic variant of the AdjacencyGraph data structure."""
 
-    def __init__(self, cycle_checker: CycleCheckProtocol = DefaultCycleCheck):
-        super().__init__()
+    def __init__(
+        self,
+        cycle_checker: CycleCheckProtocol = DefaultCycleCheck,
+        weight_index: bool = False,
+        payloads: Optional[MutableMapping[Hashable, object]] = None,
+    ):
+        super().__init__(weight_index=weight_index, payloads=payloads)
         self._cycle_checker: CycleCheckProtocol = cycle_checker
+        # Predecessors are indexed so refreshing fingerprints only visits
+        # the vertices that changed and their descendants.
+        self._reverse_index = {}
+        self._fingerprints: Dict[Hashable, str] = {}
+        self._stale_fingerprints: Set[Hashable] = set()
+
+    def __setitem__(self, key: Hashable, value: object) -> None:
+        super().__setitem__(key, value)
+        self._stale_fingerprints.add(key)
+
+    def remove_edge(self, a: Hashable, b: Hashable) -> None:
+        """Remove a directed edge from node 'a' to node 'b' to the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+
+        Raises:
+            KeyError: Raised when either node 'a' or node 'b'
+            do not exist in the graph.
+        """
+        super().remove_edge(a, b)
+        self._stale_fingerprints.add(b)
+
+    def delete_edges(self, key: Hashable) -> None:
+        """Delete all edges associated to a key from the Graph.
+
+        Args:
+            key (Hashable): Key to a node whose edges are to be removed.
+
+        Raises:
+            KeyError: Raised when either node 'key' or does not exist in the
+            graph.
+        """
+        self._stale_fingerprints.update(self._adj_table.get(key, ()))
+        super().delete_edges(key)
+
+    def _restored(self, keys: Tuple[Hashable]) -> None:
+        self._stale_fingerprints.update(keys)
+
+    @staticmethod
+    def encode_vertex(value: object) -> bytes:
+        """Encode the value of a vertex for fingerprinting.
+
+        Subclasses may override this to control which parts of a vertex's
+        value contribute to its fingerprint, or to support other types.
+
+        Args:
+            value (object): The value of a vertex.
+
+        Raises:
+            TypeError: Raised when 'value' holds a type other than None,
+            bools, numbers, strings, bytes, lists, tuples, sets and mappings.
+
+        Returns:
+            bytes: A stable byte representation of 'value'.
+        """
+        return _canonical(value).encode()
+
+    def _refresh_fingerprints(self) -> None:
+        """Recompute the fingerprints of stale vertices and their descendants.
+
+        Vertices are visited in topological order and a descendant is only
+        rehashed when one of its predecessors' fingerprints actually changed.
+        """
+        adj_table = self._adj_table
+        for key in [key for key in self._fingerprints if key not in adj_table]:
+            del self._fingerprints[key]
+
+        stale = {key for key in self._stale_fingerprints if key in adj_table}
+        if not stale:
+            self._stale_fingerprints.clear()
+            return
+
+        # Count in-edges among the stale vertices and their descendants.
+        in_degree = dict.fromkeys(stale, 0)
+        to_visit = list(stale)
+        while to_visit:
+            for dest in adj_table[to_visit.pop()]:
+                if dest not in adj_table:
+                    continue
+                if dest not in in_degree:
+                    in_degree[dest] = 0
+                    to_visit.append(dest)
+                in_degree[dest] += 1
+
+        predecessors = self._reverse_index
+        ready = deque(key for key, degree in in_degree.items() if degree == 0)
+        changed = set()
+        while ready:
+            node = ready.popleft()
+            parents = predecessors.get(node, ())
+            if node in stale or any(pred in changed for pred in parents):
+                digest = sha256(self.encode_vertex(self._vertices[node]))
+                for fingerprint in sorted(
+                    self._fingerprints[pred] for pred in parents
+                ):
+                    digest.update(fingerprint.encode())
+
+                fingerprint = digest.hexdigest()
+                if self._fingerprints.get(node) != fingerprint:
+                    self._fingerprints[node] = fingerprint
+                    changed.add(node)
+
+            for dest in adj_table[node]:
+                if dest in in_degree:
+                    in_degree[dest] -= 1
+                    if in_degree[dest] == 0:
+                        ready.append(dest)
+
+        # Cleared last, so vertices that failed to encode stay stale.
+        self._stale_fingerprints.clear()
+
+    def get_fingerprint(self, key: Hashable) -> str:
+        """Get the structural fingerprint of a vertex.
+
+        A fingerprint hashes the value of a vertex together with the
+        fingerprints of its predecessors, so it changes whenever anything
+        upstream of the vertex changes.
+
+        Args:
+            key (Hashable): Key of the vertex to fingerprint.
+
+        Raises:
+            KeyError: Raised when 'key' does not exist in the graph.
+
+        Returns:
+            str: A hexadecimal SHA-256 digest.
+        """
+        self._refresh_fingerprints()
+        try:
+            return self._fingerprints[key]
+        except KeyError as key_error:
+            raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
+
+    def get_fingerprints(self) -> Mapping[Hashable, str]:
+        """Get the structural fingerprints of every vertex in the graph.
+
+        Returns:
+            Mapping[Hashable, str]: A read-only mapping of each vertex to its
+            fingerprint. Later mutations are not reflected until this method
+            or get_fingerprint is called again.
+        """
+        self._refresh_fingerprints()
+        return MappingProxyType(dict(self._fingerprints))
 
     def add_edge(
         self, a: Hashable, b: Hashable, weight: Comparable = 0
@@ -170,9 +939,40 @@ class AcyclicAdjGraph(AdjacencyGraph):
             RuntimeError: Raised when a cycle is introduced by the addition of
             edge (a, b).
         """
-        super().add_edge(a, b, weight)
-        if self._cycle_checker.detect_cycles(self):
-            raise RuntimeError(f"Addition of edge ({a}, {b}) creates a cycle!")
+        # Roll the edge back out if it turns out to close a cycle.
+        with self.transaction():
+            super().add_edge(a, b, weight)
+            self._stale_fingerprints.add(b)
+            if self._cycle_checker.detect_cycles(self):
+                raise RuntimeError(
+                    f"Addition of edge ({a}, {b}) creates a cycle!"
+                )
+
+    def merge(
+        self, *graphs: Graph, key_remap: Optional[KeyRemap] = None
+    ) -> None:
+        """Merge the vertices and edges of other graphs into this graph.
+
+        The graphs are unioned in bulk and acyclicity is checked once for
+        the merged result, rather than once per edge.
+
+        Args:
+            *graphs (Graph): Graphs whose contents are merged into this one.
+            key_remap (Optional[KeyRemap]): Either a sequence holding a key
+            prefix (or None) for each graph, or a callable taking the index
+            of a graph and one of its keys and returning the merged key.
+            Defaults to keeping keys as they are.
+
+        Raises:
+            ValueError: Raised when the number of prefixes does not match the
+            number of graphs.
+            RuntimeError: Raised when the merged graph contains a cycle, in
+            which case the graph is left unchanged.
+        """
+        with self.transaction():
+            super().merge(*graphs, key_remap=key_remap)
+            if self._cycle_checker.detect_cycles(self):
+                raise RuntimeError("Merging the graphs creates a cycle!")
 
     def __repr__(self) -> str:
         self_cls = type(self).__name__
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import functools
+from typing import Callable, Collection, Hashable, Iterable, Optional
+
+from pyaestro.abstracts.graphs import Graph
+from pyaestro.dataclasses import GraphEdge
+from pyaestro.typing import Comparable
+
+
+class ImplicitGraph(Graph):
+    """A read-only directed graph whose edges are generated on demand.
+
+    Rather than storing adjacency lists, the graph asks a user supplied
+    callable for the neighbors of a vertex whenever they are needed, so
+    graphs that follow a simple rule never have to be materialized. The most
+    recently requested neighbor lists are kept in a bounded LRU cache.
+    Vertex values default to a second callable and may be overridden by
+    assignment, but the vertices and edges themselves are fixed, and any
+    attempt to change them raises a RuntimeError.
+
+    Searches from a source only visit the vertices they reach. Algorithms
+    that need every vertex or the reverse of every edge, such as
+    TopologicalSort and Predecessors, still walk the whole graph and hold
+    state for each vertex, so they should only be run on graphs small
+    enough to materialize.
+    """
+
+    def __init__(
+        self,
+        vertices: Collection[Hashable],
+        neighbors: Callable[[Hashable], Iterable[Hashable]],
+        value: Optional[Callable[[Hashable], object]] = None,
+        cache_size: Optional[int] = 1024,
+    ):
+        """Initialize an implicit graph.
+
+        Args:
+            vertices (Collection[Hashable]): The vertices of the graph. Any
+            re-iterable collection with fast membership tests works,
+            including lazily evaluated ones.
+            neighbors (Callable[[Hashable], Iterable[Hashable]]): Callable
+            returning the destinations of the edges leaving a vertex. It must
+            return the same neighbors each time it is called with a vertex.
+            value (Optional[Callable[[Hashable], object]]): Callable
+            computing the value of a vertex that has not been assigned one.
+            Defaults to a value of None.
+            cache_size (Optional[int]): Number of neighbor lists to keep
+            cached. Use 0 to disable caching, or None for an unbounded cache.
+            Defaults to 1024.
+        """
+        super().__init__()
+        self._collection = vertices
+        self._value = value
+        self._neighbors = functools.lru_cache(maxsize=cache_size)(
+            lambda key: tuple(neighbors(key))
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._collection
+
+    def __getitem__(self, key: Hashable) -> object:
+        if key in self._vertices:
+            return self._vertices[key]
+        if key not in self._collection:
+            raise KeyError(f"Key '{key}' not found in graph.")
+        return self._value(key) if self._value else None
+
+    def __setitem__(self, key: Hashable, value: object) -> None:
+        if key not in self._collection:
+            raise RuntimeError(
+                f"Unable to add key '{key}' to a graph with fixed vertices."
+            )
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        raise RuntimeError(
+            "Vertices cannot be removed from an implicit graph."
+        )
+
+    def __iter__(self) -> Iterable[Hashable]:
+        return iter(self._collection)
+
+    def __len__(self) -> int:
+        return len(self._collection)
+
+    def cache_info(self) -> functools._CacheInfo:
+        """Get the hit and miss statistics of the neighbor cache.
+
+        Returns:
+            functools._CacheInfo: Statistics of the neighbor LRU cache.
+        """
+        return self._neighbors.cache_info()
+
+    def cache_clear(self) -> None:
+        """Discard every cached neighbor list."""
+        self._neighbors.cache_clear()
+
+    def edges(self) -> Iterable[GraphEdge]:
+        """Iterate the edges of a graph.
+
+        Edges are generated vertex by vertex and are not cached, so a full
+        pass over the edges never holds more than one neighbor list.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of tuples containing edges.
+        """
+        for key in self._collection:
+            for dest in self._neighbors.__wrapped__(key):
+                yield GraphEdge(key, dest, 0)
+
+    def get_neighbors(self, key: Hashable) -> Iterable[GraphEdge]:
+        """Get the connected neighbors of the specified node.
+
+        Args:
+            key (Hashable): Key whose neighbor's should be returned.
+
+        Raises:
+            KeyError: Raised when 'key' does not exist in the graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of GraphEdge records that
+            represent the neighbors of the vertex named 'key'.
+        """
+        if key not in self._collection:
+            raise KeyError(f"Key '{key}' not found in graph.")
+
+        for dest in self._neighbors(key):
+            yield GraphEdge(key, dest, 0)
+
+    def add_edge(
+        self, a: Hashable, b: Hashable, weight: Comparable = 0
+    ) -> None:
+        """Edges of an implicit graph are fixed by its neighbor callable.
+
+        Raises:
+            RuntimeError: Always raised.
+        """
+        raise RuntimeError("Edges cannot be added to an implicit graph.")
+
+    def remove_edge(self, a: Hashable, b: Hashable) -> None:
+        """Edges of an implicit graph are fixed by its neighbor callable.
+
+        Raises:
+            RuntimeError: Always raised.
+        """
+        raise RuntimeError("Edges cannot be removed from an implicit graph.")
+
+    def delete_edges(self, key: Hashable) -> None:
+        """Edges of an implicit graph are fixed by its neighbor callable.
+
+        Raises:
+            RuntimeError: Always raised.
+        """
+        raise RuntimeError("Edges cannot be removed from an implicit graph.")
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List, MutableMapping, Optional
+
+from pyaestro.abstracts.graphs import Graph
+from pyaestro.dataclasses import GraphEdge, GraphEvent, GraphEventType
+from pyaestro.typing import Comparable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class MatrixGraph(Graph):
+    """A directed graph stored as a dense NumPy adjacency matrix.
+
+    Vertices are assigned rows and columns of a square matrix that grows by
+    doubling, so the graph costs O(V^2) memory regardless of how many edges
+    it holds. In exchange, whole-graph analyses (transitive closure, all
+    pairs shortest paths and cycle detection) run as vectorized matrix
+    operations. Weighted graphs store a float64 matrix in which NaN marks a
+    missing edge; unweighted graphs store a boolean matrix.
+
+    Matrices returned by the analyses are read-only and their rows and
+    columns follow the iteration order of the graph's vertices.
+    """
+
+    def __init__(
+        self,
+        weighted: bool = True,
+        capacity: int = 16,
+        payloads: Optional[MutableMapping[Hashable, object]] = None,
+    ):
+        """Initialize an empty graph.
+
+        Args:
+            weighted (bool): Store edge weights. Unweighted graphs only
+            accept a weight of 0 and use an eighth of the memory. Defaults
+            to True.
+            capacity (int): Initial number of vertices to allocate room for.
+            Defaults to 16.
+            payloads (Optional[MutableMapping[Hashable, object]]): An empty
+            mapping to hold the values of vertices. Defaults to a dict.
+
+        Raises:
+            ImportError: Raised when NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError(
+                "MatrixGraph requires NumPy. Install it with the 'matrix' "
+                "extra: pip install pyaestro[matrix]"
+            )
+
+        super().__init__(payloads)
+        self._weighted = weighted
+        self._slots: Dict[Hashable, int] = {}
+        self._keys: List[Optional[Hashable]] = []
+        self._free: List[int] = []
+        self._matrix = self._allocate(max(capacity, 1))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(weighted={self._weighted})"
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self._weighted:
+            return np.full((capacity, capacity), np.nan)
+        return np.zeros((capacity, capacity), dtype=bool)
+
+    def _mask(self, matrix: np.ndarray) -> np.ndarray:
+        """Get a boolean mask of the edges present in a matrix."""
+        if self._weighted:
+            return ~np.isnan(matrix)
+        return matrix
+
+    def _slot(self, key: Hashable) -> int:
+        try:
+            return self._slots[key]
+        except KeyError as key_error:
+            raise KeyError(f"Key '{key_error.args[0]}' not found in graph.")
+
+    def _clear(self, row: int, column: int) -> None:
+        self._matrix[row, column] = np.nan if self._weighted else False
+
+    def __setitem__(self, key: Hashable, value: object) -> None:
+        if key not in self._slots:
+            if self._free:
+                slot = self._free.pop()
+                self._keys[slot] = key
+            else:
+                slot = len(self._keys)
+                self._keys.append(key)
+
+            capacity = len(self._matrix)
+            if slot >= capacity:
+                matrix = self._allocate(2 * capacity)
+                matrix[:capacity, :capacity] = self._matrix
+                self._matrix = matrix
+            self._slots[key] = slot
+
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        super().__delitem__(key)
+        slot = self._slots.pop(key)
+        # Edges into a deleted vertex are dropped so a reused slot is clean.
+        self._clear(slice(None), slot)
+        self._keys[slot] = None
+        self._free.append(slot)
+
+    def _ordering(self) -> np.ndarray:
+        """Get the slots of the vertices in iteration order."""
+        return np.fromiter(
+            (self._slots[key] for key in self._vertices),
+            dtype=np.intp,
+            count=len(self._vertices),
+        )
+
+    def _compact(self) -> np.ndarray:
+        """Get the matrix restricted to vertices, in iteration order."""
+        order = self._ordering()
+        return self._matrix[np.ix_(order, order)]
+
+    def edges(self) -> Iterable[GraphEdge]:
+        """Iterate the edges of a graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of tuples containing edges.
+        """
+        for key in list(self._vertices):
+            yield from self.get_neighbors(key)
+
+    def get_neighbors(self, key: Hashable) -> Iterable[GraphEdge]:
+        """Get the connected neighbors of the specified node.
+
+        Args:
+            key (Hashable): Key whose neighbor's should be returned.
+
+        Raises:
+            KeyError: Raised when 'key' does not exist in the graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of GraphEdge records that
+            represent the neighbors of the vertex named 'key'.
+        """
+        row = self._matrix[self._slot(key)]
+        for slot in np.flatnonzero(self._mask(row)).tolist():
+            weight = row[slot].item() if self._weighted else 0
+            yield GraphEdge(key, self._keys[slot], weight)
+
+    def add_edge(
+        self, a: Hashable, b: Hashable, weight: Comparable = 0
+    ) -> None:
+        """Add an edge to the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+            weight(Comparable): Numeric weight of the edge between 'a' and
+            'b'. Defaults to 0 for unweighted.
+
+        Raises:
+            KeyError: Raised when either node 'a' or node 'b'
+            do not exist in the graph.
+            ValueError: Raised when a weight is given to an unweighted graph.
+        """
+        row, column = self._slot(a), self._slot(b)
+        if self._weighted:
+            self._matrix[row, column] = weight
+        elif weight != 0:
+            raise ValueError(
+                "Unable to add a weighted edge to an unweighted graph."
+            )
+        else:
+            self._matrix[row, column] = True
+        self._emit(GraphEvent(GraphEventType.EDGE_SET, a, b, weight))
+
+    def remove_edge(self, a: Hashable, b: Hashable) -> None:
+        """Remove a directed edge from node 'a' to node 'b' to the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+
+        Raises:
+            KeyError: Raised when either node 'a' or node 'b'
+            do not exist in the graph or are not connected.
+        """
+        row, column = self._slot(a), self._slot(b)
+        if not self._mask(self._matrix[row, column]):
+            raise KeyError(f"Key '{b}' not found in graph.")
+        self._clear(row, column)
+        self._emit(GraphEvent(GraphEventType.EDGE_REMOVED, a, b))
+
+    def delete_edges(self, key: Hashable) -> None:
+        """Delete all edges associated to a key from the Graph.
+
+        Args:
+            key (Hashable): Key to a node whose edges are to be removed.
+
+        Raises:
+            KeyError: Raised when node 'key' does not exist in the graph.
+        """
+        row = self._slot(key)
+        if self._subscribers:
+            mask = self._mask(self._matrix[row])
+            for slot in np.flatnonzero(mask).tolist():
+                self._emit(
+                    GraphEvent(
+                        GraphEventType.EDGE_REMOVED, key, self._keys[slot]
+                    )
+                )
+        self._clear(row, slice(None))
+
+    def _apply_event(self, event: GraphEvent) -> None:
+        """Apply a single change event to the graph.
+
+        Args:
+            event (GraphEvent): The change event to apply.
+        """
+        key, dest = event.key, event.destination
+        if event.kind is GraphEventType.VERTEX_SET:
+            self[key] = event.value
+        elif event.kind is GraphEventType.VERTEX_DELETED:
+            if key in self._slots:
+                del self[key]
+        elif event.kind is GraphEventType.EDGE_SET:
+            self.add_edge(key, dest, event.value)
+        elif event.kind is GraphEventType.EDGE_REMOVED:
+            if key in self._slots and dest in self._slots:
+                if self._mask(
+                    self._matrix[self._slots[key], self._slots[dest]]
+                ):
+                    self.remove_edge(key, dest)
+
+    def adjacency_matrix(self) -> np.ndarray:
+        """Get the boolean adjacency matrix of the graph.
+
+        Returns:
+            np.ndarray: A read-only V x V matrix that is True where an edge
+            leads from the row's vertex to the column's vertex.
+        """
+
+        def compute() -> np.ndarray:
+            adjacency = self._mask(self._compact())
+            adjacency.setflags(write=False)
+            return adjacency
+
+        return self.memoize(("adjacency_matrix",), compute)
+
+    def transitive_closure(self) -> np.ndarray:
+        """Compute which vertices can reach one another.
+
+        The closure is found by repeatedly squaring the reachability matrix,
+        which takes O(log V) matrix products.
+
+        Returns:
+            np.ndarray: A read-only V x V boolean matrix that is True where a
+            path of one or more edges leads from the row's vertex to the
+            column's vertex.
+        """
+
+        def compute() -> np.ndarray:
+            reach = self.adjacency_matrix().copy()
+            while True:
+                # Float products use BLAS; the counts only need to be > 0.
+                paths = reach.astype(np.float32)
+                extended = reach | (paths @ paths > 0)
+                if np.array_equal(extended, reach):
+                    break
+                reach = extended
+            reach.setflags(write=False)
+            return reach
+
+        return self.memoize(("transitive_closure",), compute)
+
+    def shortest_paths(self) -> np.ndarray:
+        """Compute the length of the shortest path between all vertices.
+
+        Uses a Floyd-Warshall relaxation that is vectorized over each
+        intermediate vertex. Edges with a weight of 0 (unweighted) count as
+        1, matching the other graph algorithms.
+
+        Returns:
+            np.ndarray: A read-only V x V float matrix of path lengths, where
+            unreachable pairs are infinite. A negative diagonal entry means
+            the vertex lies on a negative cycle.
+        """
+
+        def compute() -> np.ndarray:
+            adjacency = self.adjacency_matrix()
+            if self._weighted:
+                weights = self._compact()
+                weights[weights == 0] = 1
+            else:
+                weights = np.ones(adjacency.shape)
+            distance = np.where(adjacency, weights, np.inf)
+
+            diagonal = np.diagonal(distance)
+            np.fill_diagonal(distance, np.minimum(diagonal, 0))
+            for k in range(len(distance)):
+                np.minimum(
+                    distance,
+                    distance[:, k, np.newaxis] + distance[np.newaxis, k, :],
+                    out=distance,
+                )
+            distance.setflags(write=False)
+            return distance
+
+        return self.memoize(("shortest_paths",), compute)
+
+    def has_cycle(self) -> bool:
+        """Check the graph for cycles.
+
+        Returns:
+            bool: True if the trace of the transitive closure is non-zero,
+            meaning some vertex can reach itself.
+        """
+        return bool(np.trace(self.transitive_closure()) > 0)
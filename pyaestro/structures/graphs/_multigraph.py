@@ -0,0 +1,379 @@
+from typing import (
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from pyaestro.abstracts.graphs import Graph
+from pyaestro.dataclasses import GraphEdge, GraphEvent, GraphEventType
+from pyaestro.structures.constants import EdgeProperty
+from pyaestro.typing import Comparable
+
+
+class _GraphLayer:
+    """Edge storage for a single named layer of a MultiGraph.
+
+    Adjacency entries are only allocated for vertices that have edges in
+    the layer, and unweighted layers store plain sets of neighbors, so a
+    layer costs little more than the edges it holds. A reverse index of the
+    sources of each vertex lets a vertex be deleted in time proportional to
+    its own edges.
+    """
+
+    __slots__ = ("name", "properties", "_adj_table", "_rev_table", "_weighted")
+
+    def __init__(self, name: str, properties: Iterable[EdgeProperty]):
+        self.name = name
+        self.properties: FrozenSet[EdgeProperty] = frozenset(
+            EdgeProperty.reconile_properties(properties)
+        )
+        self._weighted = EdgeProperty.WEIGHTED in self.properties
+        self._adj_table: Dict[Hashable, Union[Dict, Set]] = {}
+        self._rev_table: Dict[Hashable, Set] = {}
+
+    def _orient(self, a: Hashable, b: Hashable) -> Tuple[Hashable, Hashable]:
+        if EdgeProperty.BACKWARD in self.properties:
+            return b, a
+        return a, b
+
+    def neighbors(self, key: Hashable) -> Iterable[Tuple[Hashable, object]]:
+        adj_list = self._adj_table.get(key)
+        if not adj_list:
+            return ()
+        if self._weighted:
+            return adj_list.items()
+        return ((dest, 0) for dest in adj_list)
+
+    def edges(self) -> Iterable[Tuple[Hashable, Hashable, object]]:
+        for src in self._adj_table:
+            for dest, weight in self.neighbors(src):
+                yield src, dest, weight
+
+    def reaches(self, source: Hashable, target: Hashable) -> bool:
+        visited = {source}
+        to_visit = [source]
+        while to_visit:
+            node = to_visit.pop()
+            if node == target:
+                return True
+            for dest in self._adj_table.get(node, ()):
+                if dest not in visited:
+                    visited.add(dest)
+                    to_visit.append(dest)
+        return False
+
+    def add(self, a: Hashable, b: Hashable, weight: Comparable) -> None:
+        if not self._weighted and weight != 0:
+            raise ValueError(
+                f"Unable to add a weighted edge to unweighted layer "
+                f"'{self.name}'."
+            )
+
+        src, dest = self._orient(a, b)
+        if EdgeProperty.ACYCLIC in self.properties and self.reaches(dest, src):
+            raise RuntimeError(
+                f"Addition of edge ({a}, {b}) creates a cycle in layer "
+                f"'{self.name}'!"
+            )
+
+        self._insert(src, dest, weight)
+        if EdgeProperty.BIDIRECTION in self.properties:
+            self._insert(dest, src, weight)
+
+    def _insert(self, src: Hashable, dest: Hashable, weight: object) -> None:
+        if self._weighted:
+            self._adj_table.setdefault(src, {})[dest] = weight
+        else:
+            self._adj_table.setdefault(src, set()).add(dest)
+        self._rev_table.setdefault(dest, set()).add(src)
+
+    def has_edge(self, a: Hashable, b: Hashable) -> bool:
+        src, dest = self._orient(a, b)
+        return dest in self._adj_table.get(src, ())
+
+    def remove(self, a: Hashable, b: Hashable) -> None:
+        src, dest = self._orient(a, b)
+        self._discard(src, dest)
+        if EdgeProperty.BIDIRECTION in self.properties and src != dest:
+            self._discard(dest, src)
+
+    def _discard(self, src: Hashable, dest: Hashable) -> None:
+        adj_list = self._adj_table[src]
+        if self._weighted:
+            del adj_list[dest]
+        else:
+            adj_list.remove(dest)
+
+        if not adj_list:
+            del self._adj_table[src]
+
+        sources = self._rev_table[dest]
+        sources.discard(src)
+        if not sources:
+            del self._rev_table[dest]
+
+    def delete(self, key: Hashable) -> List[Tuple[Hashable, Hashable]]:
+        """Delete every edge of a vertex.
+
+        Returns:
+            List[Tuple[Hashable, Hashable]]: The deleted edges, oriented as
+            they were added to the layer.
+        """
+        deleted = []
+        for dest in list(self._adj_table.get(key, ())):
+            self._discard(key, dest)
+            deleted.append(self._orient(key, dest))
+        for src in list(self._rev_table.get(key, ())):
+            self._discard(src, key)
+            deleted.append(self._orient(src, key))
+        return deleted
+
+
+class MultiGraph(Graph):
+    """A graph of named edge layers that share a single set of vertices.
+
+    Each layer enforces its own set of EdgeProperty flags (for example, an
+    ACYCLIC "data" layer next to a BIDIRECTION "control" layer). Queries that
+    do not name a layer see the edges of every layer together.
+
+    Edge events of the change feed name the layer they apply to, and adding
+    a layer is reported by a LAYER_ADDED event holding the names of its
+    properties, so a MultiGraph can be rebuilt by replaying its feed.
+    """
+
+    def __init__(
+        self, payloads: Optional[MutableMapping[Hashable, object]] = None
+    ):
+        """Initialize a graph without any layers.
+
+        Args:
+            payloads (Optional[MutableMapping[Hashable, object]]): An empty
+            mapping to hold the values of vertices. Defaults to a dict.
+        """
+        super().__init__(payloads)
+        self._layers: Dict[str, _GraphLayer] = {}
+
+    @property
+    def layers(self) -> Tuple[str]:
+        """Tuple[str]: The names of the layers in the graph."""
+        return tuple(self._layers)
+
+    def add_layer(
+        self, name: str, properties: Iterable[EdgeProperty] = ()
+    ) -> None:
+        """Add a new, empty layer of edges to the graph.
+
+        Args:
+            name (str): Name of the new layer.
+            properties (Iterable[EdgeProperty]): Properties that edges in the
+            layer must uphold. Defaults to unweighted forward edges.
+
+        Raises:
+            ValueError: Raised when the layer already exists or its
+            properties are contradictory.
+        """
+        if name in self._layers:
+            raise ValueError(f"Layer '{name}' already exists in graph.")
+        layer = self._layers[name] = _GraphLayer(name, properties)
+        self._emit(
+            GraphEvent(
+                GraphEventType.LAYER_ADDED,
+                name,
+                value=sorted(prop.name for prop in layer.properties),
+            )
+        )
+
+    def get_layer_properties(self, name: str) -> FrozenSet[EdgeProperty]:
+        """Get the reconciled properties of a layer.
+
+        Args:
+            name (str): Name of the layer.
+
+        Raises:
+            KeyError: Raised when the layer does not exist.
+
+        Returns:
+            FrozenSet[EdgeProperty]: Properties enforced by the layer.
+        """
+        return self._get_layer(name).properties
+
+    def _get_layer(self, name: str) -> _GraphLayer:
+        try:
+            return self._layers[name]
+        except KeyError:
+            raise KeyError(f"Layer '{name}' not found in graph.")
+
+    def _select_layers(
+        self, layers: Optional[Iterable[str]]
+    ) -> Iterable[_GraphLayer]:
+        if layers is None:
+            return self._layers.values()
+        if isinstance(layers, str):
+            layers = (layers,)
+        return [self._get_layer(name) for name in layers]
+
+    def _check_vertices(self, *keys: Hashable) -> None:
+        for key in keys:
+            if key not in self._vertices:
+                raise KeyError(f"Key '{key}' not found in graph.")
+
+    def edges(
+        self, layers: Optional[Iterable[str]] = None
+    ) -> Iterable[GraphEdge]:
+        """Iterate the edges of a graph.
+
+        Args:
+            layers (Optional[Iterable[str]]): Names of the layers to iterate.
+            Defaults to all layers.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of tuples containing edges.
+        """
+        for layer in self._select_layers(layers):
+            for src, dest, weight in layer.edges():
+                yield GraphEdge(src, dest, weight)
+
+    def get_neighbors(
+        self, key: Hashable, layers: Optional[Iterable[str]] = None
+    ) -> Iterable[GraphEdge]:
+        """Get the connected neighbors of the specified node.
+
+        Args:
+            key (Hashable): Key whose neighbor's should be returned.
+            layers (Optional[Iterable[str]]): Names of the layers to query.
+            Defaults to all layers.
+
+        Raises:
+            KeyError: Raised when 'key' or a named layer does not exist in
+            the graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of GraphEdge records that
+            represent the neighbors of the vertex named 'key'. A neighbor
+            connected in more than one layer is reported once per layer.
+        """
+        self._check_vertices(key)
+        for layer in self._select_layers(layers):
+            for dest, weight in layer.neighbors(key):
+                yield GraphEdge(key, dest, weight)
+
+    def add_edge(
+        self,
+        a: Hashable,
+        b: Hashable,
+        weight: Comparable = 0,
+        layer: Optional[str] = None,
+    ) -> None:
+        """Add an edge to a layer of the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+            weight(Comparable): Weight of the edge between 'a' and 'b'.
+            Defaults to 0 for unweighted.
+            layer (Optional[str]): Name of the layer to add the edge to. May
+            only be omitted when the graph has a single layer.
+
+        Raises:
+            KeyError: Raised when either node 'a' or node 'b'
+            do not exist in the graph.
+            ValueError: Raised when the layer is ambiguous or a weight is
+            given to an unweighted layer.
+            RuntimeError: Raised when the edge would introduce a cycle into
+            an acyclic layer.
+        """
+        self._check_vertices(a, b)
+        if layer is None:
+            if len(self._layers) != 1:
+                raise ValueError(
+                    "A layer must be specified for graphs that do not have "
+                    "exactly one layer."
+                )
+            layer = next(iter(self._layers))
+
+        self._get_layer(layer).add(a, b, weight)
+        self._emit(
+            GraphEvent(GraphEventType.EDGE_SET, a, b, weight, layer=layer)
+        )
+
+    def remove_edge(
+        self, a: Hashable, b: Hashable, layer: Optional[str] = None
+    ) -> None:
+        """Remove the edge from node 'a' to node 'b' from the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+            layer (Optional[str]): Name of the layer to remove the edge
+            from. Defaults to every layer that contains the edge.
+
+        Raises:
+            KeyError: Raised when either node 'a' or node 'b'
+            do not exist in the graph or are not connected.
+        """
+        self._check_vertices(a, b)
+        removed = False
+        for _layer in self._select_layers(layer):
+            if _layer.has_edge(a, b):
+                _layer.remove(a, b)
+                removed = True
+                self._emit(
+                    GraphEvent(
+                        GraphEventType.EDGE_REMOVED, a, b, layer=_layer.name
+                    )
+                )
+
+        if not removed:
+            raise KeyError(f"Key '{b}' not found in graph.")
+
+    def delete_edges(self, key: Hashable) -> None:
+        """Delete all edges associated to a key from every layer.
+
+        Args:
+            key (Hashable): Key to a node whose edges are to be removed.
+
+        Raises:
+            KeyError: Raised when node 'key' does not exist in the graph.
+        """
+        self._check_vertices(key)
+        for layer in self._layers.values():
+            for a, b in layer.delete(key):
+                self._emit(
+                    GraphEvent(
+                        GraphEventType.EDGE_REMOVED, a, b, layer=layer.name
+                    )
+                )
+
+    def _apply_event(self, event: GraphEvent) -> None:
+        """Apply a single change event to the graph.
+
+        Args:
+            event (GraphEvent): The change event to apply.
+        """
+        key, dest = event.key, event.destination
+        if event.kind is GraphEventType.VERTEX_SET:
+            self[key] = event.value
+        elif event.kind is GraphEventType.VERTEX_DELETED:
+            if key in self._vertices:
+                del self[key]
+        elif event.kind is GraphEventType.LAYER_ADDED:
+            if key not in self._layers:
+                self.add_layer(key, [EdgeProperty[n] for n in event.value])
+        elif event.kind is GraphEventType.EDGE_SET:
+            self.add_edge(key, dest, event.value, layer=event.layer)
+        elif event.kind is GraphEventType.EDGE_REMOVED:
+            layer = self._layers.get(event.layer)
+            if (
+                layer is not None
+                and key in self._vertices
+                and dest in self._vertices
+                and layer.has_edge(key, dest)
+            ):
+                self.remove_edge(key, dest, layer=event.layer)
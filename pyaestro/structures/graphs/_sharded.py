@@ -0,0 +1,530 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import weakref
+from collections import Counter
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from pyaestro.abstracts.graphs import Graph, KeyRemap
+from pyaestro.dataclasses import GraphEdge, GraphEvent, GraphEventType
+from pyaestro.structures.graphs._adjacency import AdjacencyGraph
+from pyaestro.typing import Comparable
+
+
+class _Shard:
+    """The portion of a sharded graph held by a single worker process."""
+
+    def __init__(self):
+        self.graph = AdjacencyGraph()
+        self.visited: Dict[int, set] = {}
+        self.in_degree: Dict[Hashable, int] = {}
+
+    def setitem(self, key: Hashable, value: object) -> None:
+        self.graph[key] = value
+
+    def getitem(self, key: Hashable) -> object:
+        return self.graph._vertices[key]
+
+    def delitem(self, key: Hashable) -> None:
+        del self.graph[key]
+
+    def contains(self, key: Hashable) -> bool:
+        return key in self.graph
+
+    def keys(self) -> List[Hashable]:
+        return list(self.graph)
+
+    def size(self) -> int:
+        return len(self.graph)
+
+    def add_edge(self, a: Hashable, b: Hashable, weight: Comparable) -> None:
+        self.graph.add_edge(a, b, weight)
+
+    def remove_edge(self, a: Hashable, b: Hashable) -> None:
+        self.graph.remove_edge(a, b)
+
+    def delete_edges(self, key: Hashable) -> List[Hashable]:
+        dests = list(self.graph._adj_table[key])
+        self.graph.delete_edges(key)
+        return dests
+
+    def neighbors(self, key: Hashable) -> List[Tuple[Hashable, object]]:
+        return [
+            (e.destination, e.value) for e in self.graph.get_neighbors(key)
+        ]
+
+    def edges(self) -> List[Tuple[Hashable, Hashable, object]]:
+        return [(e.source, e.destination, e.value) for e in self.graph.edges()]
+
+    def update(
+        self, vertices: Dict[Hashable, object], rows: Dict[Hashable, Dict]
+    ) -> None:
+        graph = self.graph
+        for key, value in vertices.items():
+            graph[key] = value
+        for src, row in rows.items():
+            graph._adj_table[src].update(row)
+
+    def visit(
+        self, search: int, candidates: List[Tuple[Hashable, Hashable]]
+    ) -> List[Tuple[Hashable, Hashable, List[Hashable]]]:
+        """Mark candidates of a search as visited, returning the new ones."""
+        visited = self.visited.setdefault(search, set())
+        adj_table = self.graph._adj_table
+        accepted = []
+        for node, parent in candidates:
+            if node in adj_table and node not in visited:
+                visited.add(node)
+                accepted.append((node, parent, list(adj_table[node])))
+        return accepted
+
+    def end_searches(self, searches: List[int]) -> None:
+        for search in searches:
+            self.visited.pop(search, None)
+
+    def count_destinations(self) -> Counter:
+        counts = Counter()
+        for adj_list in self.graph._adj_table.values():
+            counts.update(adj_list.keys())
+        return counts
+
+    def _peel(self, zeros: List[Hashable]) -> Tuple[int, List[Hashable]]:
+        adj_table = self.graph._adj_table
+        dests = []
+        for node in zeros:
+            del self.in_degree[node]
+            dests.extend(adj_table[node])
+        return len(zeros), dests
+
+    def start_peeling(self, counts: Counter) -> Tuple[int, List[Hashable]]:
+        self.in_degree = {key: counts.get(key, 0) for key in self.graph}
+        zeros = [key for key, degree in self.in_degree.items() if not degree]
+        return self._peel(zeros)
+
+    def peel(self, dests: List[Hashable]) -> Tuple[int, List[Hashable]]:
+        in_degree = self.in_degree
+        zeros = []
+        for dest in dests:
+            if dest in in_degree:
+                in_degree[dest] -= 1
+                if not in_degree[dest]:
+                    zeros.append(dest)
+        return self._peel(zeros)
+
+
+def _serve(connection: Connection) -> None:
+    """Answer requests for a shard until told to stop."""
+    shard = _Shard()
+    while True:
+        method, args = connection.recv()
+        if method is None:
+            break
+        try:
+            connection.send((True, getattr(shard, method)(*args)))
+        except Exception as exception:
+            connection.send((False, exception))
+    connection.close()
+
+
+def _shutdown(
+    connections: List[Connection], processes: List[multiprocessing.Process]
+) -> None:
+    for connection in connections:
+        try:
+            connection.send((None, ()))
+            connection.close()
+        except (OSError, ValueError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+
+class _ShardedVertices(MutableMapping):
+    """A mapping view of vertex values held across the shards of a graph."""
+
+    def __init__(self, graph: ShardedAdjGraph):
+        self._graph = weakref.proxy(graph)
+
+    def __getitem__(self, key: Hashable) -> object:
+        return self._graph._call(key, "getitem", key)
+
+    def __setitem__(self, key: Hashable, value: object) -> None:
+        self._graph._call(key, "setitem", key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self._graph._call(key, "delitem", key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._graph._call(key, "contains", key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for keys in self._graph._broadcast("keys"):
+            yield from keys
+
+    def __len__(self) -> int:
+        return sum(self._graph._broadcast("size"))
+
+
+class ShardedAdjGraph(Graph):
+    """A directed adjacency graph hash-partitioned across worker processes.
+
+    Each vertex, with its value and outgoing edges, lives in an
+    AdjacencyGraph held by one of several local worker processes, chosen by
+    the hash of its key. Single vertex operations are forwarded to the
+    owning worker over a pipe. Breadth-first search and cycle detection run
+    as level-synchronous frontier exchanges: every worker expands its part
+    of the frontier in parallel and the results are routed to the owners of
+    the next frontier, so the calling process only ever holds a frontier.
+
+    Like AdjacencyGraph, deleting a vertex leaves edges that lead to it in
+    place, and such dangling destinations are skipped by the distributed
+    algorithms. Workers are stopped by close(), or when the graph is garbage
+    collected.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """Start the worker processes of an empty graph.
+
+        Args:
+            workers (Optional[int]): Number of worker processes. Defaults to
+            the number of CPUs.
+        """
+        super().__init__(payloads=_ShardedVertices(self))
+        workers = workers or os.cpu_count() or 1
+        self._connections: List[Connection] = []
+        processes = []
+        for _ in range(workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve, args=(child,), daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            processes.append(process)
+
+        self._searches = 0
+        self._finished: List[int] = []
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._connections, processes
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(workers={len(self._connections)})"
+
+    @property
+    def workers(self) -> int:
+        """int: The number of worker processes holding the graph."""
+        return len(self._connections)
+
+    def close(self) -> None:
+        """Stop the worker processes, discarding the graph."""
+        self._finalizer()
+
+    def _owner(self, key: Hashable) -> int:
+        return hash(key) % len(self._connections)
+
+    def _call(self, key: Hashable, method: str, *args) -> object:
+        """Run a shard method on the worker that owns 'key'."""
+        connection = self._connections[self._owner(key)]
+        connection.send((method, args))
+        ok, result = connection.recv()
+        if not ok:
+            raise result
+        return result
+
+    def _scatter(self, requests: Dict[int, Tuple]) -> Dict[int, object]:
+        """Run shard methods on several workers in parallel.
+
+        Args:
+            requests (Dict[int, Tuple]): A mapping of worker index to a tuple
+            of a method name and its arguments.
+
+        Returns:
+            Dict[int, object]: The result of each worker's method.
+        """
+        # Every request is pickled before any is sent, and every reply is
+        # read even after a failure, so that no worker is left holding a
+        # reply that a later call would mistake for its own.
+        payloads = {
+            worker: ForkingPickler.dumps((method, tuple(args)))
+            for worker, (method, *args) in requests.items()
+        }
+        for worker, payload in payloads.items():
+            self._connections[worker].send_bytes(payload)
+
+        results, error = {}, None
+        for worker in requests:
+            try:
+                ok, result = self._connections[worker].recv()
+            except Exception as exception:
+                ok, result = False, exception
+            if ok:
+                results[worker] = result
+            elif error is None:
+                error = result
+        if error is not None:
+            raise error
+        return results
+
+    def _broadcast(self, method: str, *args) -> List[object]:
+        requests = {i: (method,) + args for i in range(self.workers)}
+        results = self._scatter(requests)
+        return [results[i] for i in range(self.workers)]
+
+    def _route(self, items: Iterable, keyed: bool = False) -> Dict[int, List]:
+        """Group items by the worker that owns them.
+
+        Args:
+            items (Iterable): Keys, or tuples whose first entry is a key when
+            'keyed' is True.
+            keyed (bool): Route tuples by their first entry.
+
+        Returns:
+            Dict[int, List]: The items owned by each worker.
+        """
+        routed: Dict[int, List] = {}
+        for item in items:
+            key = item[0] if keyed else item
+            routed.setdefault(self._owner(key), []).append(item)
+        return routed
+
+    def edges(self) -> Iterable[GraphEdge]:
+        """Iterate the edges of a graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of tuples containing edges.
+        """
+        for edges in self._broadcast("edges"):
+            for src, dest, weight in edges:
+                yield GraphEdge(src, dest, weight)
+
+    def get_neighbors(self, key: Hashable) -> Iterable[GraphEdge]:
+        """Get the connected neighbors of the specified node.
+
+        Args:
+            key (Hashable): Key whose neighbor's should be returned.
+
+        Raises:
+            KeyError: Raised when 'key' does not exist in the graph.
+
+        Returns:
+            Iterable[GraphEdge]: An iterable of GraphEdge records that
+            represent the neighbors of the vertex named 'key'.
+        """
+        for dest, weight in self._call(key, "neighbors", key):
+            yield GraphEdge(key, dest, weight)
+
+    def add_edge(
+        self, a: Hashable, b: Hashable, weight: Comparable = 0
+    ) -> None:
+        """Add an edge to the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+            weight(Comparable): Weight of the edge between 'a' and 'b'.
+            Defaults to 0 for unweighted.
+
+        Raises:
+            KeyError: Raised when node 'a' does not exist in the graph.
+        """
+        self._call(a, "add_edge", a, b, weight)
+        self._emit(GraphEvent(GraphEventType.EDGE_SET, a, b, weight))
+
+    def remove_edge(self, a: Hashable, b: Hashable) -> None:
+        """Remove a directed edge from node 'a' to node 'b' to the graph.
+
+        Args:
+            a (Hashable): Key identifying side 'a' of an edge.
+            b (Hashable): Key identifying side 'b' of an edge.
+
+        Raises:
+            KeyError: Raised when either node 'a' or node 'b'
+            do not exist in the graph.
+        """
+        self._call(a, "remove_edge", a, b)
+        self._emit(GraphEvent(GraphEventType.EDGE_REMOVED, a, b))
+
+    def delete_edges(self, key: Hashable) -> None:
+        """Delete all edges associated to a key from the Graph.
+
+        Args:
+            key (Hashable): Key to a node whose edges are to be removed.
+
+        Raises:
+            KeyError: Raised when node 'key' does not exist in the graph.
+        """
+        for dest in self._call(key, "delete_edges", key):
+            self._emit(GraphEvent(GraphEventType.EDGE_REMOVED, key, dest))
+
+    def _apply_event(self, event: GraphEvent) -> None:
+        """Apply a single change event to the graph.
+
+        Args:
+            event (GraphEvent): The change event to apply.
+        """
+        key, dest = event.key, event.destination
+        if event.kind is GraphEventType.VERTEX_SET:
+            self[key] = event.value
+        elif event.kind is GraphEventType.VERTEX_DELETED:
+            if key in self:
+                del self[key]
+        elif event.kind is GraphEventType.EDGE_SET:
+            self.add_edge(key, dest, event.value)
+        elif event.kind is GraphEventType.EDGE_REMOVED:
+            try:
+                self.remove_edge(key, dest)
+            except KeyError:
+                pass
+
+    def merge(
+        self, *graphs: Graph, key_remap: Optional[KeyRemap] = None
+    ) -> None:
+        """Merge the vertices and edges of other graphs into this graph.
+
+        Vertices and edges are grouped by their owning worker and sent in
+        one message per worker, rather than one message per vertex or edge.
+
+        Args:
+            *graphs (Graph): Graphs whose contents are merged into this one.
+            key_remap (Optional[KeyRemap]): Either a sequence holding a key
+            prefix (or None) for each graph, or a callable taking the index
+            of a graph and one of its keys and returning the merged key.
+            Defaults to keeping keys as they are.
+
+        Raises:
+            ValueError: Raised when the number of prefixes does not match the
+            number of graphs.
+        """
+        parts = [({}, {}) for _ in self._connections]
+        events = []
+        remappers = self._key_remappers(graphs, key_remap)
+        for graph, remap in zip(graphs, remappers):
+            remap = remap or (lambda key: key)
+            for key in graph:
+                name = remap(key)
+                vertices, _ = parts[self._owner(name)]
+                vertices[name] = graph[key]
+                events.append(
+                    GraphEvent(
+                        GraphEventType.VERTEX_SET, name, value=graph[key]
+                    )
+                )
+            for edge in graph.edges():
+                src, dest = remap(edge.source), remap(edge.destination)
+                _, rows = parts[self._owner(src)]
+                rows.setdefault(src, {})[dest] = edge.value
+                events.append(
+                    GraphEvent(GraphEventType.EDGE_SET, src, dest, edge.value)
+                )
+
+        self._scatter(
+            {
+                i: ("update",) + part
+                for i, part in enumerate(parts)
+                if any(part)
+            }
+        )
+        if self._subscribers:
+            with self.batch():
+                for event in events:
+                    self._emit(event)
+
+    def search(self, source: Hashable) -> Iterator[Tuple[Hashable]]:
+        """Perform a distributed breadth-first search from a vertex.
+
+        Vertices are produced level by level; within a level their order
+        depends on how the vertices are partitioned.
+
+        Args:
+            source (Hashable): Vertex to start the search from.
+
+        Raises:
+            KeyError: Raised when 'source' does not exist in the graph.
+
+        Returns:
+            Iterator[Tuple[Hashable]]: Iterator of (node, parent) tuples in
+            breadth-first order.
+        """
+        if source not in self:
+            raise KeyError(f"Key '{source}' not found in graph.")
+
+        if self._finished:
+            self._broadcast("end_searches", list(self._finished))
+            self._finished.clear()
+
+        self._searches += 1
+        search = self._searches
+        frontier = {self._owner(source): [(source, None)]}
+        try:
+            while frontier:
+                results = self._scatter(
+                    {
+                        worker: ("visit", search, candidates)
+                        for worker, candidates in frontier.items()
+                    }
+                )
+                candidates = []
+                for accepted in results.values():
+                    for node, parent, dests in accepted:
+                        yield node, parent
+                        candidates.extend((dest, node) for dest in dests)
+                frontier = self._route(candidates, keyed=True)
+        finally:
+            # Workers are told to free the search's state by the next search,
+            # since a generator may be closed in the middle of another call.
+            self._finished.append(search)
+
+    def detect_cycles(self) -> bool:
+        """Detect a cycle in the graph with a distributed topological peel.
+
+        Every worker removes its vertices that have no remaining in-edges,
+        and the destinations of their out-edges are routed back to their
+        owners until no more vertices can be removed.
+
+        Returns:
+            bool: True if the graph contains a cycle.
+        """
+        return self.memoize(("detect_cycles",), self._detect_cycles)
+
+    def _detect_cycles(self) -> bool:
+        counts = [Counter() for _ in self._connections]
+        for destinations in self._broadcast("count_destinations"):
+            for dest, count in destinations.items():
+                counts[self._owner(dest)][dest] += count
+
+        results = self._scatter(
+            {
+                worker: ("start_peeling", count)
+                for worker, count in enumerate(counts)
+            }
+        )
+        removed = 0
+        while results:
+            dests = []
+            for peeled, released in results.values():
+                removed += peeled
+                dests.extend(released)
+            results = self._scatter(
+                {
+                    worker: ("peel", routed)
+                    for worker, routed in self._route(dests).items()
+                }
+            )
+
+        return removed != len(self)
@@ -1,5 +1,18 @@
+import functools
 from collections import deque
-from typing import Hashable, Iterable, Set, Tuple
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # Python 3.7 compatibility
 try:
@@ -10,6 +23,28 @@ except ImportError:
 from pyaestro.abstracts.graphs import Graph
 
 
+def memoized(function: Callable) -> Callable:
+    """Cache the result of a graph algorithm against the graph's version.
+
+    The decorated function must take the graph as its first argument after
+    the class and return an immutable result, since the same object is handed
+    back to every caller until the graph is mutated.
+
+    Args:
+        function (Callable): Algorithm of the form f(cls, graph, *args).
+
+    Returns:
+        Callable: The algorithm wrapped to use the graph's result cache.
+    """
+
+    @functools.wraps(function)
+    def memoized_algorithm(cls, graph: Graph, *args):
+        key = (cls, function.__name__, args)
+        return graph.memoize(key, lambda: function(cls, graph, *args))
+
+    return memoized_algorithm
+
+
 class CycleCheckProtocol(Protocol):
     @classmethod
     def detect_cycles(cls, graph: Graph) -> bool:
@@ -70,6 +105,23 @@ class BreadthFirstSearch:
 
             yield root, parent
 
+    @classmethod
+    @memoized
+    def ordering(
+        cls, graph: Graph, source: Hashable
+    ) -> Tuple[Tuple[Hashable]]:
+        """Compute the breadth-first ordering of a graph from a source.
+
+        Args:
+            graph (Graph): An instance of a Graph data structure.
+            source (Hashable): Vertex to start the search from.
+
+        Returns:
+            Tuple[Tuple[Hashable]]: Tuple of (node, parent) pairs in the order
+            they are visited, cached until the graph is mutated.
+        """
+        return tuple(cls.search(graph, source))
+
 
 class DepthFirstSearch:
     def search(graph: Graph, source: Hashable) -> Iterable[Tuple[Hashable]]:
@@ -101,6 +153,235 @@ class DepthFirstSearch:
 
             yield root, parent
 
+    @classmethod
+    @memoized
+    def ordering(
+        cls, graph: Graph, source: Hashable
+    ) -> Tuple[Tuple[Hashable]]:
+        """Compute the depth-first ordering of a graph from a source.
+
+        Args:
+            graph (Graph): An instance of a Graph data structure.
+            source (Hashable): Vertex to start the search from.
+
+        Returns:
+            Tuple[Tuple[Hashable]]: Tuple of (node, parent) pairs in the order
+            they are visited, cached until the graph is mutated.
+        """
+        return tuple(cls.search(graph, source))
+
+
+class Reachability:
+    @classmethod
+    @memoized
+    def reachable(cls, graph: Graph, source: Hashable) -> FrozenSet[Hashable]:
+        """Compute the set of vertices reachable from a source vertex.
+
+        Args:
+            graph (Graph): An instance of a Graph data structure.
+            source (Hashable): Vertex to start the search from.
+
+        Returns:
+            FrozenSet[Hashable]: Vertices reachable from 'source', including
+            'source' itself.
+        """
+        ordering = BreadthFirstSearch.ordering(graph, source)
+        return frozenset(node for node, _ in ordering)
+
+
+class Predecessors:
+    @classmethod
+    @memoized
+    def get_predecessors(
+        cls, graph: Graph
+    ) -> Mapping[Hashable, Tuple[Hashable]]:
+        """Build a reverse adjacency index of a graph.
+
+        Args:
+            graph (Graph): An instance of a Graph data structure.
+
+        Returns:
+            Mapping[Hashable, Tuple[Hashable]]: A read-only mapping of each
+            vertex to the vertices with an edge to it, cached until the graph
+            is mutated.
+        """
+        predecessors: Dict[Hashable, List[Hashable]] = {
+            node: [] for node in graph
+        }
+        for node in graph:
+            for edge in graph.get_neighbors(node):
+                if edge.destination in predecessors:
+                    predecessors[edge.destination].append(node)
+
+        return MappingProxyType(
+            {node: tuple(parents) for node, parents in predecessors.items()}
+        )
+
+
+class Traversal:
+    """A configurable graph traversal that reuses its visited state.
+
+    Vertices are interned to integer ids the first time they are seen and
+    visits are recorded by stamping each id with the epoch of the current
+    search, so repeated searches over the same graph do not allocate new
+    visited sets or frontiers. Only one search may be in progress at a time.
+    """
+
+    def __init__(
+        self, graph: Graph, depth_first: bool = False, reverse: bool = False
+    ):
+        """Initialize a traversal over a graph.
+
+        Args:
+            graph (Graph): An instance of a Graph data structure.
+            depth_first (bool): Expand the most recently discovered vertex
+            first. Defaults to breadth-first order.
+            reverse (bool): Follow edges from destination to source.
+        """
+        self._graph = graph
+        self._depth_first = depth_first
+        self._reverse = reverse
+        self._ids: Dict[Hashable, int] = {}
+        self._stamps: List[int] = []
+        self._epoch = 0
+        self._frontier: deque = deque()
+
+    def _neighbors(self, node: Hashable) -> Iterable[Hashable]:
+        if self._reverse:
+            return Predecessors.get_predecessors(self._graph)[node]
+        return (edge.destination for edge in self._graph.get_neighbors(node))
+
+    def _visit(self, node: Hashable) -> bool:
+        """Stamp a vertex as visited in the current search.
+
+        Args:
+            node (Hashable): Vertex being visited.
+
+        Returns:
+            bool: True if the vertex had not been visited yet.
+        """
+        node_id = self._ids.get(node)
+        if node_id is None:
+            self._ids[node] = len(self._stamps)
+            self._stamps.append(self._epoch)
+            return True
+
+        if self._stamps[node_id] == self._epoch:
+            return False
+
+        self._stamps[node_id] = self._epoch
+        return True
+
+    def search(
+        self,
+        *sources: Hashable,
+        max_depth: Optional[int] = None,
+        prune: Optional[Callable[[Hashable], bool]] = None,
+        goal: Optional[Callable[[Hashable], bool]] = None,
+        limit: Optional[int] = None,
+    ) -> Iterable[Tuple[Hashable]]:
+        """Search the graph from one or more source vertices.
+
+        Args:
+            sources (Hashable): Vertices to start the search from.
+            max_depth (Optional[int]): Do not expand vertices that are this
+            many edges away from a source. Defaults to no limit.
+            prune (Optional[Callable[[Hashable], bool]]): Predicate marking
+            vertices that should neither be yielded nor expanded.
+            goal (Optional[Callable[[Hashable], bool]]): Predicate that ends
+            the search once a matching vertex has been yielded.
+            limit (Optional[int]): Maximum number of vertices to yield.
+
+        Raises:
+            KeyError: Raised when a source does not exist in the graph.
+            RuntimeError: Raised when another search is started on the same
+            traversal before this one finishes.
+
+        Returns:
+            Iterable[Tuple[Hashable]]: Iterable of tuples representing the
+            combination of (node, parent) in the search.
+        """
+        if len(self._ids) > 2 * len(self._graph):
+            # Drop interned vertices that have since left the graph.
+            self._ids.clear()
+            self._stamps.clear()
+
+        self._epoch += 1
+        epoch = self._epoch
+        frontier = self._frontier
+        frontier.clear()
+
+        for source in sources:
+            if source not in self._graph:
+                raise KeyError(f"Key '{source}' not found in graph.")
+            if self._visit(source) and not (prune and prune(source)):
+                frontier.append((source, None, 0))
+
+        pop = frontier.pop if self._depth_first else frontier.popleft
+        found = 0
+        while frontier:
+            root, parent, depth = pop()
+            yield root, parent
+
+            if self._epoch != epoch:
+                raise RuntimeError(
+                    "Traversal was restarted while a search was in progress."
+                )
+
+            found += 1
+            if limit is not None and found >= limit:
+                return
+            if goal is not None and goal(root):
+                return
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for node in self._neighbors(root):
+                if not self._visit(node):
+                    continue
+                if prune is not None and prune(node):
+                    continue
+                frontier.append((node, root, depth + 1))
+
+
+class TopologicalSort:
+    @classmethod
+    @memoized
+    def sort(cls, graph: Graph) -> Tuple[Hashable]:
+        """Compute a topological ordering of the vertices of a graph.
+
+        Args:
+            graph (Graph): An instance of a Graph data structure.
+
+        Raises:
+            RuntimeError: Raised when the graph contains a cycle.
+
+        Returns:
+            Tuple[Hashable]: The vertices of the graph where every vertex
+            appears before all of its neighbors.
+        """
+        in_degree = {node: 0 for node in graph}
+        for node in graph:
+            for edge in graph.get_neighbors(node):
+                in_degree[edge.destination] += 1
+
+        to_visit: deque[Hashable] = deque(
+            node for node, degree in in_degree.items() if degree == 0
+        )
+        order = []
+        while to_visit:
+            node = to_visit.popleft()
+            order.append(node)
+            for edge in graph.get_neighbors(node):
+                in_degree[edge.destination] -= 1
+                if in_degree[edge.destination] == 0:
+                    to_visit.append(edge.destination)
+
+        if len(order) != len(in_degree):
+            raise RuntimeError("Unable to sort a graph that contains a cycle.")
+
+        return tuple(order)
+
 
 class DefaultCycleCheck:
     @classmethod
@@ -136,9 +417,12 @@ class DefaultCycleCheck:
         return False
 
     @classmethod
+    @memoized
     def detect_cycles(cls, graph: Graph) -> bool:
         """Detect a cycle in a graph.
 
+        Results are cached until the graph is next mutated.
+
         Args:
             graph (Graph): An instance of a Graph data structure.
 
@@ -0,0 +1,151 @@
+"""A module for evaluating functions over the vertices of acyclic graphs."""
+
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Dict, Hashable, MutableMapping, Optional
+
+from pyaestro.structures.graphs._adjacency import AcyclicAdjGraph
+from pyaestro.structures.graphs.algorithms import Predecessors
+
+VertexFunction = Callable[[Hashable, object, Dict[Hashable, object]], object]
+
+
+class DataflowEvaluator:
+    """Evaluate a function at every vertex of a graph in dependency order.
+
+    The function is called as f(key, value, inputs), where 'value' is the
+    value held by the vertex and 'inputs' maps each predecessor of the
+    vertex to its result. A vertex is submitted to the executor as soon as
+    all of its predecessors have finished, so independent branches of the
+    graph run concurrently. When the executor is a ProcessPoolExecutor, the
+    function, vertex values and results must be picklable.
+
+    Results can be cached by the structural fingerprint of a vertex, which
+    covers its value and everything upstream of it, so evaluating a graph
+    again only recomputes the vertices affected by changes since the last
+    evaluation. This assumes the function is deterministic.
+    """
+
+    def __init__(
+        self,
+        function: VertexFunction,
+        executor: Optional[Executor] = None,
+        max_in_flight: Optional[int] = None,
+        cache: Optional[MutableMapping[str, object]] = None,
+    ):
+        """Initialize an evaluator.
+
+        Args:
+            function (VertexFunction): Callable computing the result of a
+            vertex from its key, value and the results of its predecessors.
+            executor (Optional[Executor]): Executor to run the function on.
+            Defaults to a thread pool created for each evaluation.
+            max_in_flight (Optional[int]): Maximum number of vertices
+            submitted to the executor at once. Defaults to no limit.
+            cache (Optional[MutableMapping[str, object]]): Mapping of
+            fingerprints to results shared across evaluations. Defaults to
+            not caching results.
+
+        Raises:
+            ValueError: Raised when 'max_in_flight' is less than 1.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("At least one vertex must be allowed in flight.")
+
+        self._function = function
+        self._executor = executor
+        self._max_in_flight = max_in_flight
+        self._cache = cache
+
+    def evaluate(self, graph: AcyclicAdjGraph) -> Dict[Hashable, object]:
+        """Evaluate the function at every vertex of a graph.
+
+        The graph is read-only while it is being evaluated. If the function
+        raises, vertices that have not started are cancelled, running ones
+        are waited for, and the exception is raised.
+
+        Args:
+            graph (AcyclicAdjGraph): The graph to evaluate.
+
+        Raises:
+            RuntimeError: Raised when the graph contains a cycle.
+
+        Returns:
+            Dict[Hashable, object]: The result of each vertex.
+        """
+        if self._executor is not None:
+            return self._evaluate(graph, self._executor)
+
+        with ThreadPoolExecutor() as executor:
+            return self._evaluate(graph, executor)
+
+    def _evaluate(
+        self, graph: AcyclicAdjGraph, executor: Executor
+    ) -> Dict[Hashable, object]:
+        with graph:
+            predecessors = Predecessors.get_predecessors(graph)
+            fingerprints = (
+                graph.get_fingerprints() if self._cache is not None else None
+            )
+            waiting = {
+                node: len(preds) for node, preds in predecessors.items()
+            }
+            successors = {node: [] for node in predecessors}
+            for node, preds in predecessors.items():
+                for pred in preds:
+                    successors[pred].append(node)
+            ready = deque(node for node, count in waiting.items() if not count)
+            results: Dict[Hashable, object] = {}
+            in_flight: Dict[Future, Hashable] = {}
+            limit = self._max_in_flight or len(waiting) or 1
+
+            def finish(node: Hashable, result: object) -> None:
+                results[node] = result
+                for dest in successors[node]:
+                    waiting[dest] -= 1
+                    if not waiting[dest]:
+                        ready.append(dest)
+
+            try:
+                while ready or in_flight:
+                    while ready and len(in_flight) < limit:
+                        node = ready.popleft()
+                        if fingerprints and fingerprints[node] in self._cache:
+                            finish(node, self._cache[fingerprints[node]])
+                            continue
+
+                        inputs = {
+                            pred: results[pred] for pred in predecessors[node]
+                        }
+                        future = executor.submit(
+                            self._function, node, graph[node], inputs
+                        )
+                        in_flight[future] = node
+
+                    if not in_flight:
+                        continue
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = in_flight.pop(future)
+                        result = future.result()
+                        if fingerprints:
+                            self._cache[fingerprints[node]] = result
+                        finish(node, result)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+                wait(in_flight)
+
+            if len(results) != len(waiting):
+                raise RuntimeError(
+                    "Unable to evaluate a graph that contains a cycle."
+                )
+
+            return results
@@ -0,0 +1,158 @@
+"""A module of stores for the values held by graph vertices."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import tempfile
+import weakref
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Hashable,
+    Iterator,
+    MutableMapping,
+    Optional,
+)
+
+
+def _close(connection: sqlite3.Connection, path: Optional[str]) -> None:
+    connection.close()
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
+
+class SpillingPayloadStore(MutableMapping):
+    """A mapping that keeps hot values in memory and spills cold ones to disk.
+
+    Keys always stay in memory, so membership tests, iteration and len()
+    never touch the disk. Up to 'capacity' values are kept in memory in
+    least recently used order; older values are pickled into a SQLite
+    database and loaded back into memory when they are next read.
+
+    Values must be picklable. A value read back from disk is a copy, so
+    changes to a value should be made by assigning it again rather than by
+    mutating a previously returned object.
+    """
+
+    def __init__(self, capacity: int = 1024, path: Optional[str] = None):
+        """Initialize an empty store.
+
+        Args:
+            capacity (int): Maximum number of values to keep in memory.
+            Defaults to 1024.
+            path (Optional[str]): Path of the SQLite database to spill to,
+            whose 'payloads' table is cleared. Defaults to a temporary file
+            that is removed when the store is closed or garbage collected.
+
+        Raises:
+            ValueError: Raised when 'capacity' is negative.
+        """
+        if capacity < 0:
+            raise ValueError("Capacity of a payload store must be >= 0.")
+
+        owned = path is None
+        if owned:
+            fd, path = tempfile.mkstemp(prefix="pyaestro-", suffix=".sqlite")
+            os.close(fd)
+
+        self._capacity = capacity
+        self._ids: Dict[Hashable, int] = {}
+        self._next_id = 0
+        self._hot: OrderedDict[Hashable, object] = OrderedDict()
+        self._cold: Dict[Hashable, int] = {}
+
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS payloads "
+            "(id INTEGER PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._connection.execute("DELETE FROM payloads")
+        self._finalizer = weakref.finalize(
+            self, _close, self._connection, path if owned else None
+        )
+
+    @property
+    def capacity(self) -> int:
+        """int: Maximum number of values kept in memory."""
+        return self._capacity
+
+    @property
+    def spilled(self) -> int:
+        """int: Number of values currently held on disk."""
+        return len(self._cold)
+
+    def close(self) -> None:
+        """Close the database and remove it if it is a temporary file."""
+        self._finalizer()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ids
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, key: Hashable) -> object:
+        hot = self._hot
+        if key in hot:
+            hot.move_to_end(key)
+            return hot[key]
+
+        row_id = self._cold.pop(key)
+        (blob,) = self._connection.execute(
+            "SELECT value FROM payloads WHERE id = ?", (row_id,)
+        ).fetchone()
+        value = pickle.loads(blob)
+        self._connection.execute(
+            "DELETE FROM payloads WHERE id = ?", (row_id,)
+        )
+        hot[key] = value
+        self._evict()
+        return value
+
+    def __setitem__(self, key: Hashable, value: object) -> None:
+        if key not in self._ids:
+            self._ids[key] = self._next_id
+            self._next_id += 1
+        elif key in self._cold:
+            self._connection.execute(
+                "DELETE FROM payloads WHERE id = ?", (self._cold.pop(key),)
+            )
+
+        self._hot[key] = value
+        self._hot.move_to_end(key)
+        self._evict()
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._ids[key]
+        if key in self._cold:
+            self._connection.execute(
+                "DELETE FROM payloads WHERE id = ?", (self._cold.pop(key),)
+            )
+        else:
+            del self._hot[key]
+
+    def _evict(self) -> None:
+        """Spill the least recently used values that exceed the capacity."""
+        if len(self._hot) <= self._capacity:
+            return
+
+        rows = []
+        try:
+            while len(self._hot) > self._capacity:
+                key = next(iter(self._hot))
+                row_id = self._ids[key]
+                rows.append((row_id, pickle.dumps(self._hot[key])))
+                del self._hot[key]
+                self._cold[key] = row_id
+        finally:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO payloads (id, value) VALUES (?, ?)",
+                rows,
+            )
@@ -1,5 +1,8 @@
 import functools
+import json
+from typing import Iterator, List
 
+from pyaestro.dataclasses import GraphEvent
 from pyaestro.structures.graphs.algorithms import (
     CycleCheckProtocol,
     DefaultCycleCheck,
@@ -22,3 +25,46 @@ def cycle_check_on_return(
         return cycle_check_wrapper
 
     return inner
+
+
+class GraphEventLog:
+    """An append-only log of graph change events stored as JSON lines.
+
+    An instance is a change feed subscriber; each published batch of events
+    is appended to the log file. Vertex keys, values and edge weights must
+    be JSON serializable.
+    """
+
+    def __init__(self, path: str):
+        """Initialize a log that appends to the specified file.
+
+        Args:
+            path (str): Path of the log file.
+        """
+        self._path = path
+
+    def __call__(self, events: List[GraphEvent]) -> None:
+        """Append a batch of events to the log.
+
+        Args:
+            events (List[GraphEvent]): Change events to append.
+        """
+        with open(self._path, "a") as log:
+            log.writelines(
+                json.dumps(event.to_record()) + "\n" for event in events
+            )
+
+    @staticmethod
+    def read(path: str) -> Iterator[GraphEvent]:
+        """Read the events stored in a log file.
+
+        Args:
+            path (str): Path of the log file.
+
+        Returns:
+            Iterator[GraphEvent]: The logged events in the order written.
+        """
+        with open(path) as log:
+            for line in log:
+                if line.strip():
+                    yield GraphEvent.from_record(json.loads(line))
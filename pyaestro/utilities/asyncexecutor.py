@@ -0,0 +1,273 @@
+"""Executor utility module for locally scheduled tasks on an asyncio loop."""
+
+import asyncio
+import os
+import sys
+import threading
+from os.path import abspath, join
+from uuid import uuid4
+
+from psutil import NoSuchProcess, Process
+
+from pyaestro.utilities.executor import ExecCancel, ExecTaskState
+
+
+class _AsyncRecord:
+    """Record tracking the state and process of an asynchronous task."""
+
+    __slots__ = ("uuid", "state", "estatus", "process", "task", "timeout")
+
+    def __init__(self):
+        """Initialize a new record with a uuid and initial state."""
+        self.uuid = uuid4()
+        self.state = ExecTaskState.INITIALIZED
+        self.estatus = None
+        self.process = None
+        self.task = None
+        self.timeout = None
+
+
+def _select_child_watcher():
+    """Reap children with pidfds rather than a thread per child."""
+    # Python 3.12 and later select pidfds on their own, and a watcher
+    # installed by the application is left in place. Before 3.12 the pidfd
+    # watcher only serves the loop it is attached to, which the policy
+    # keeps up to date for loops in the main thread alone.
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    policy = asyncio.get_event_loop_policy()
+    if type(policy.get_child_watcher()) is not asyncio.ThreadedChildWatcher:
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        # The kernel, or a seccomp filter, does not allow pidfds.
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    policy.set_child_watcher(watcher)
+
+
+class AsyncExecutor:
+    """
+    An Executor that runs local tasks as asyncio subprocesses.
+
+    Rather than parking a thread on every running process, each task is a
+    coroutine on a single event loop and at most `workers` processes run
+    at once. Tasks must be submitted from a coroutine running on the loop
+    that will drive them.
+
+    Children are reaped by the loop's child watcher. From Python 3.12 on
+    Linux this uses pidfds in the loop thread. On older versions the
+    default watcher starts a thread per child, so an executor on the main
+    thread's loop replaces it with `asyncio.PidfdChildWatcher` when the
+    kernel supports pidfds. Elsewhere each running process still costs a
+    thread.
+    """
+
+    def __init__(self, workers):
+        """
+        Initialize an executor.
+
+        :param workers: Maximum number of processes to run concurrently.
+        """
+        self._workers = workers
+        self._slots = None
+        self._records = {}
+
+    def _semaphore(self):
+        # Created lazily so that it binds to the loop running the tasks.
+        if self._slots is None:
+            _select_child_watcher()
+            self._slots = asyncio.Semaphore(self._workers)
+        return self._slots
+
+    def submit(self, script, workspace, *args, **kwargs):
+        """
+        Schedule a script to execute on the running event loop.
+
+        :param script: Path to a script to execute.
+        :param workspace: Directory path to execute the script in.
+        :param args: Additonal arguments to pass to the script being
+            executed.
+        :param kwargs: Additional kwargs to configure of execution.
+            - shell [bool]: Execute script in a new shell.
+            - env [dict]: A dict of environment variables.
+            - stdout [str]: Name of the output .out file.
+            - stderr [str]: Name of the output .err file.
+        :returns: A string containing the unique job identifier.
+        """
+        record = _AsyncRecord()
+        kwargs.setdefault("stdout", f"local-{record.uuid}.out")
+        kwargs.setdefault("stderr", f"local-{record.uuid}.err")
+
+        record.state = ExecTaskState.PENDING
+        record.task = asyncio.ensure_future(
+            self._execute(record, script, workspace, args, **kwargs)
+        )
+        taskid = str(record.uuid)
+        self._records[taskid] = record
+        return taskid
+
+    async def _execute(self, record, script, cwd, args, **kwargs):
+        shell = kwargs.pop("shell", True)
+        env = kwargs.pop("env", None)
+        stdout = kwargs.pop("stdout")
+        stderr = kwargs.pop("stderr")
+
+        async with self._semaphore():
+            if record.state == ExecTaskState.CANCELLED:
+                return record.state
+
+            try:
+                # The child holds its own copies of the descriptors, so the
+                # files are closed as soon as it has started.
+                with open(join(cwd, stdout), "wb") as out, open(
+                    join(cwd, stderr), "wb"
+                ) as err:
+                    if shell:
+                        record.process = await asyncio.create_subprocess_shell(
+                            " ".join([abspath(script)] + list(args)),
+                            env=env,
+                            cwd=cwd,
+                            stdout=out,
+                            stderr=err,
+                            **kwargs,
+                        )
+                    else:
+                        record.process = await asyncio.create_subprocess_exec(
+                            abspath(script),
+                            *args,
+                            env=env,
+                            cwd=cwd,
+                            stdout=out,
+                            stderr=err,
+                            **kwargs,
+                        )
+            except Exception:
+                record.estatus = 127
+                record.state = ExecTaskState.FAILED
+                return record.state
+
+            if record.state == ExecTaskState.CANCELLED:
+                # Cancelled while the process was being spawned.
+                await self._stop(record, record.process.wait(), record.timeout)
+            else:
+                record.state = ExecTaskState.RUNNING
+            record.estatus = await record.process.wait()
+
+        if record.state == ExecTaskState.RUNNING:
+            if record.estatus != 0:
+                record.state = ExecTaskState.FAILED
+            else:
+                record.state = ExecTaskState.SUCCESS
+        return record.state
+
+    def get_task(self, taskid):
+        """
+        Get an awaitable handle of a task.
+
+        :param taskid: A string containing the task identifier.
+        :returns: An asyncio.Task that resolves to the final ExecTaskState
+            of the task.
+        """
+        return self._records[taskid].task
+
+    async def cancel(self, taskid, timeout=3):
+        """
+        Cancel the specified task in the Executor.
+
+        Running processes and their descendants are terminated, and killed
+        if they have not exited after `timeout` seconds.
+
+        :param taskid: A uuid of the task to be cancelled.
+        :param timeout: Seconds to wait for processes to terminate.
+        :returns: An ExecCancel enum representing the exit status
+         of the cancel command.
+        """
+        record = self._records.get(taskid)
+        if record is None:
+            return ExecCancel.JOBNOTFOUND
+        if record.task.done():
+            return ExecCancel.SUCCESS
+
+        record.state = ExecTaskState.CANCELLED
+        record.timeout = timeout
+        if record.process is None:
+            # The task is still waiting for a slot and exits on acquiring it,
+            # or is spawning its process and stops it once spawned.
+            return ExecCancel.SUCCESS
+
+        try:
+            await self._stop(record, record.task, timeout)
+        except Exception:
+            record.state = ExecTaskState.UNKNOWN
+            return ExecCancel.FAILED
+
+        return ExecCancel.SUCCESS
+
+    async def _stop(self, record, exited, timeout):
+        """
+        Terminate the process of a task along with its descendants.
+
+        :param record: The record of the task whose process is stopped.
+        :param exited: An awaitable that completes once the process exits.
+        :param timeout: Seconds to wait before killing the processes.
+        """
+        try:
+            parent = Process(record.process.pid)
+            children = parent.children(recursive=True)
+            children.append(parent)
+        except NoSuchProcess:
+            return
+
+        for child in children:
+            try:
+                child.terminate()
+            except NoSuchProcess:
+                pass
+
+        try:
+            await asyncio.wait_for(asyncio.shield(exited), timeout)
+        except asyncio.TimeoutError:
+            for child in children:
+                try:
+                    child.kill()
+                except NoSuchProcess:
+                    pass
+
+    async def cancel_all(self, timeout=3):
+        """
+        Cancel every task in the Executor.
+
+        :param timeout: Seconds to wait for processes to terminate.
+        """
+        # Pending tasks are cancelled first so none of them start in the
+        # slots freed by cancelling running tasks.
+        records = sorted(
+            self._records.items(),
+            key=lambda item: item[1].state == ExecTaskState.RUNNING,
+        )
+        await asyncio.gather(
+            *(self.cancel(taskid, timeout) for taskid, _ in records)
+        )
+
+    def get_status(self, taskid):
+        """
+        Get the status of a specific task.
+
+        :param taskid: A string containing the task identifier.
+        :returns: A ExecTaskState set the current state of the task.
+        """
+        return self._records[taskid].state
+
+    def get_all_status(self):
+        """
+        Get the status of a all tasks.
+
+        :returns: Generator of tuples as (taskid, ExecTaskState).
+        """
+        for uuid, record in self._records.items():
+            yield uuid, record.state
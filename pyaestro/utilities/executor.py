@@ -1,16 +1,42 @@
 """Executor utility module for locally scheduled tasks."""
 
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+)
+from collections import deque
+from dataclasses import dataclass, replace
 from enum import Enum
-import _io
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+import logging
+import os
 from os.path import abspath, join
-from psutil import Process, NoSuchProcess, TimeoutExpired, wait_procs
-from subprocess import Popen
-from uuid import uuid4
+from psutil import (
+    AccessDenied,
+    Process,
+    NoSuchProcess,
+    TimeoutExpired,
+    cpu_count,
+    process_iter,
+    virtual_memory,
+    wait_procs,
+)
+import select
+import selectors
+from subprocess import PIPE, Popen
+from threading import Condition, Lock, Thread, current_thread
+from time import monotonic, sleep
+from uuid import UUID, uuid4
 
-from pyaestro.metaclasses import Singleton, SynchronizedClass
+from pyaestro.metaclasses import Singleton
 from pyaestro.dataclasses.utilities import MultiRdrWtrDict
+from pyaestro.structures.graphs.algorithms import Predecessors
+
+LOGGER = logging.getLogger(__name__)
 
 
 class ExecTaskState(Enum):
@@ -25,6 +51,12 @@ class ExecTaskState(Enum):
     UNKNOWN = 6
 
 
+#: States a task does not leave once it has reached them.
+FINAL_STATES = frozenset(
+    {ExecTaskState.SUCCESS, ExecTaskState.FAILED, ExecTaskState.CANCELLED}
+)
+
+
 class ExecCancel(Enum):
     """An enumeration of possible cancellation returns."""
 
@@ -41,29 +73,1016 @@ class ExecSubmit(Enum):
     FAILED = 1
 
 
+@dataclass
+class TaskUsage:
+    """Resources used by a task and its descendant processes."""
+
+    #: Seconds of user and system CPU time.
+    cpu_time: float = 0.0
+    #: Largest combined resident set size seen, in bytes.
+    peak_rss: int = 0
+    #: Bytes read from storage.
+    read_bytes: int = 0
+    #: Bytes written to storage.
+    write_bytes: int = 0
+    #: Number of times the task has been sampled.
+    samples: int = 0
+
+
+class _Waiter:
+    """The tasks a call to Executor.wait is still waiting on."""
+
+    __slots__ = ("pending", "done")
+
+    def __init__(self, pending, done):
+        self.pending = pending
+        self.done = done
+
+
+class _TaskQueue:
+    """
+    Pending tasks ordered by priority, with aging and optional fair-share.
+
+    A task's effective priority grows by `aging` for every second it
+    waits. Since every task ages at the same rate, the order of two tasks
+    never changes over time, so tasks are kept in a heap keyed by their
+    priority at submission minus their age credit and both push and pop
+    take O(log n).
+
+    With fair-share enabled, tasks are also split by group, such as the
+    workflow or user that submitted them. Each group has a virtual time
+    that advances by the cost of every task it dispatches divided by its
+    share, and tasks are taken from the group with the lowest virtual time
+    (stride scheduling). A group that becomes active starts at the current
+    virtual time, so it cannot claim credit for time it spent idle.
+    """
+
+    def __init__(self, aging, fair_share):
+        """
+        Initialize an empty queue.
+
+        :param aging: Priority gained per second spent waiting.
+        :param fair_share: Share dispatches fairly among groups.
+        """
+        self._aging = aging
+        self._fair_share = fair_share
+        self._order = count()
+        self._length = 0
+        # Without fair-share, every task is kept in the heap of group None.
+        self._tasks = {}
+        self._groups = []
+        self._passes = {}
+        self._shares = {}
+        self._vtime = 0.0
+
+    def __len__(self):
+        return self._length
+
+    def set_share(self, group, share):
+        """
+        Set the relative share of dispatches given to a group.
+
+        :param group: A hashable group identifier.
+        :param share: A positive weight. Groups default to a share of 1.
+        """
+        if share <= 0:
+            raise ValueError("The share of a group must be positive.")
+        self._shares[group] = share
+
+    def push(self, item, priority, group, submitted):
+        """
+        Add an item to the queue.
+
+        :param item: The item to queue.
+        :param priority: Priority of the item, where higher goes first.
+        :param group: The fair-share group of the item.
+        :param submitted: Monotonic time at which the item was submitted.
+        """
+        key = self._aging * submitted - priority
+        self.restore((key, next(self._order), item, group))
+
+    def restore(self, entry):
+        """
+        Put an entry returned by pop back in its place in the queue.
+
+        :param entry: A tuple returned by pop.
+        """
+        group = entry[3] if self._fair_share else None
+        tasks = self._tasks.get(group)
+        if tasks is None:
+            tasks = self._tasks[group] = []
+            if self._fair_share:
+                vtime = max(self._passes.get(group, 0.0), self._vtime)
+                self._passes[group] = vtime
+                heappush(self._groups, (vtime, next(self._order), group))
+        heappush(tasks, entry)
+        self._length += 1
+
+    def pop(self):
+        """
+        Remove the next entry from the queue.
+
+        :returns: A tuple whose third item is the queued item, or None if
+            the queue is empty.
+        """
+        if not self._length:
+            return None
+
+        group = None
+        if self._fair_share:
+            # Skip heap entries left behind by earlier charges.
+            while True:
+                vtime, _, group = self._groups[0]
+                if group in self._tasks and vtime == self._passes[group]:
+                    break
+                heappop(self._groups)
+
+        tasks = self._tasks[group]
+        entry = heappop(tasks)
+        if not tasks:
+            del self._tasks[group]
+        self._length -= 1
+        return entry
+
+    def charge(self, entry, cost):
+        """
+        Account for the dispatch of a popped entry to its group.
+
+        :param entry: A tuple returned by pop.
+        :param cost: The cost of the dispatched item, such as its cores.
+        """
+        if not self._fair_share:
+            return
+
+        group = entry[3]
+        self._vtime = self._passes[group]
+        vtime = self._vtime + cost / self._shares.get(group, 1)
+        self._passes[group] = vtime
+        if group in self._tasks:
+            heappush(self._groups, (vtime, next(self._order), group))
+
+
+class _Capture:
+    """The output of a task read through pipes into files and ring buffers."""
+
+    __slots__ = ("lines", "partial", "files", "pipes", "lock")
+
+    #: Length in bytes past which an unterminated line is split.
+    MAX_LINE = 65536
+
+    def __init__(self, lines, paths):
+        """
+        Open the log files of a task.
+
+        :param lines: Number of lines of each stream to keep in memory.
+        :param paths: Paths of the stdout and stderr log files.
+        """
+        self.lines = (deque(maxlen=lines), deque(maxlen=lines))
+        self.partial = [b"", b""]
+        self.files = []
+        self.pipes = []
+        self.lock = Lock()
+        try:
+            for path in paths:
+                self.files.append(open(path, "wb"))
+        except Exception:
+            self.close()
+            raise
+
+    def feed(self, stream, data):
+        """
+        Add output read from a pipe.
+
+        :param stream: 0 for stdout or 1 for stderr.
+        :param data: Bytes read from the pipe of the stream.
+        """
+        self.files[stream].write(data)
+        with self.lock:
+            lines = (self.partial[stream] + data).split(b"\n")
+            partial = lines.pop()
+            if len(partial) > self.MAX_LINE:
+                lines.append(partial)
+                partial = b""
+            self.partial[stream] = partial
+            self.lines[stream].extend(lines)
+
+    def tail(self, stream, n):
+        """
+        Get the last lines of a stream.
+
+        :param stream: 0 for stdout or 1 for stderr.
+        :param n: The number of lines to return.
+        :returns: A list of up to `n` decoded lines, oldest first. A line
+            that has not been terminated yet is included last.
+        """
+        with self.lock:
+            lines = list(self.lines[stream])
+            if self.partial[stream]:
+                lines.append(self.partial[stream])
+        lines = lines[-n:] if n > 0 else []
+        return [line.decode(errors="replace") for line in lines]
+
+    def close(self):
+        """Close every pipe and log file of the task."""
+        for handle in self.pipes + self.files:
+            handle.close()
+
+
+class _OutputPump:
+    """
+    A single thread that drains the output pipes of every captured task.
+
+    Pipes are read as soon as they have data, so a child never blocks on a
+    full pipe while the thread has work to catch up on. A task's pipes and
+    log files are closed once both streams reach end-of-file, or shortly
+    after the task exits if a descendant keeps them open.
+    """
+
+    #: Seconds to wait for the output of an exited task to be drained.
+    GRACE = 1.0
+    #: Number of bytes read from a pipe at once.
+    CHUNK = 65536
+
+    def __init__(self):
+        """Initialize a pump whose thread starts on the first watch."""
+        self._lock = Lock()
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+        # Registrations are made by the pump thread, so that the selector
+        # is never modified while it is waiting.
+        self._pending = []
+        self._open = {}
+        self._finishing = {}
+        self._thread = None
+        self._closed = False
+
+    def watch(self, capture):
+        """
+        Start draining the pipes of a capture.
+
+        :param capture: A _Capture whose pipes have been set.
+        :raises RuntimeError: Raised when the pump has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The output pump has been closed.")
+            self._open[capture] = len(capture.pipes)
+            for stream, pipe in enumerate(capture.pipes):
+                os.set_blocking(pipe.fileno(), False)
+                self._pending.append((pipe, (capture, stream)))
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="pyaestro-output", daemon=True
+                )
+                self._thread.start()
+        os.write(self._wakeup_w, b"\0")
+
+    def finish(self, capture, callback, *args):
+        """
+        Call a function once the output of an exited task has been drained.
+
+        :param capture: The _Capture of the task.
+        :param callback: Callable to call with `args`, from the pump thread
+            unless the output has already been drained.
+        """
+        with self._lock:
+            if capture in self._open:
+                self._finishing[capture] = (
+                    monotonic() + self.GRACE,
+                    partial(callback, *args),
+                )
+                callback = None
+        if callback is None:
+            os.write(self._wakeup_w, b"\0")
+        else:
+            callback(*args)
+
+    def close(self):
+        """
+        Stop the pump thread and close its descriptors.
+
+        Captures that are still open are closed without being drained, and
+        their callbacks are not called.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is None:
+            self._release()
+            return
+        # The thread releases the descriptors itself once it has stopped.
+        os.write(self._wakeup_w, b"\0")
+        if thread is not current_thread():
+            thread.join()
+
+    def _release(self):
+        """Close the selector, the wakeup pipe and every open capture."""
+        for capture in self._open:
+            capture.close()
+        self._open.clear()
+        self._finishing.clear()
+        self._pending.clear()
+        self._selector.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+
+    def _run(self):
+        try:
+            self._drain_pipes()
+        finally:
+            self._release()
+
+    def _drain_pipes(self):
+        while not self._closed:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                deadlines = [d for d, _ in self._finishing.values()]
+            for pipe, data in pending:
+                self._selector.register(pipe, selectors.EVENT_READ, data)
+
+            timeout = None
+            if deadlines:
+                timeout = max(0, min(deadlines) - monotonic())
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    os.read(self._wakeup_r, 4096)
+                    continue
+
+                capture, stream = key.data
+                try:
+                    data = os.read(key.fd, self.CHUNK)
+                except BlockingIOError:
+                    continue
+                if data:
+                    capture.feed(stream, data)
+                    continue
+
+                self._selector.unregister(key.fileobj)
+                with self._lock:
+                    self._open[capture] -= 1
+                    done = not self._open[capture]
+                if done:
+                    self._close(capture)
+
+            now = monotonic()
+            with self._lock:
+                expired = [
+                    capture
+                    for capture, (deadline, _) in self._finishing.items()
+                    if deadline <= now
+                ]
+            for capture in expired:
+                for pipe in capture.pipes:
+                    if not pipe.closed:
+                        try:
+                            self._selector.unregister(pipe)
+                        except KeyError:
+                            pass
+                self._close(capture)
+
+    def _close(self, capture):
+        """Close a capture and call its callback if its task has exited."""
+        capture.close()
+        with self._lock:
+            del self._open[capture]
+            callback = self._finishing.pop(capture, (None, None))[1]
+        if callback is not None:
+            callback()
+
+
+class _Reaper:
+    """
+    A single thread that waits on the exit of every launched process.
+
+    On Linux, each process is watched through a pidfd registered with an
+    epoll instance, so the thread sleeps until a child exits. Elsewhere, or
+    when a pidfd cannot be opened, processes are polled at a fixed interval.
+    """
+
+    #: Seconds between checks of processes that cannot be watched by pidfd.
+    POLL_INTERVAL = 0.05
+
+    def __init__(self):
+        """Initialize a reaper whose thread starts on the first watch."""
+        self._lock = Condition(Lock())
+        self._pidfds = {}
+        self._polled = {}
+        self._thread = None
+        self._closed = False
+        self._epoll = None
+        if hasattr(os, "pidfd_open") and hasattr(select, "epoll"):
+            self._epoll = select.epoll()
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            os.set_blocking(self._wakeup_r, False)
+            self._epoll.register(self._wakeup_r, select.EPOLLIN)
+
+    def watch(self, process, callback):
+        """
+        Call a function with the return code of a process once it exits.
+
+        :param process: A Popen instance of a running process.
+        :param callback: Callable taking the return code of the process,
+            called from the reaper thread.
+        :raises RuntimeError: Raised when the reaper has been closed.
+        """
+        pidfd = None
+        if self._epoll is not None:
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pass
+
+        with self._lock:
+            if self._closed:
+                if pidfd is not None:
+                    os.close(pidfd)
+                raise RuntimeError("The process reaper has been closed.")
+            if pidfd is not None:
+                self._pidfds[pidfd] = (process, callback)
+                self._epoll.register(pidfd, select.EPOLLIN)
+            else:
+                self._polled[process.pid] = (process, callback)
+                if self._epoll is not None:
+                    os.write(self._wakeup_w, b"\0")
+                self._lock.notify()
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="pyaestro-reaper", daemon=True
+                )
+                self._thread.start()
+
+    def close(self):
+        """
+        Stop the reaper thread and close its descriptors.
+
+        Processes that are still being watched are no longer waited on,
+        and their callbacks are not called.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._lock.notify()
+
+        if thread is None:
+            self._release()
+            return
+        # The thread releases the descriptors itself once it has stopped.
+        if self._epoll is not None:
+            os.write(self._wakeup_w, b"\0")
+        if thread is not current_thread():
+            thread.join()
+
+    def _release(self):
+        """Close the epoll instance, the wakeup pipe and every pidfd."""
+        self._polled.clear()
+        if self._epoll is None:
+            return
+        for pidfd in self._pidfds:
+            os.close(pidfd)
+        self._pidfds.clear()
+        self._epoll.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+
+    def _run(self):
+        try:
+            self._reap()
+        finally:
+            self._release()
+
+    def _reap(self):
+        while not self._closed:
+            if self._epoll is not None:
+                timeout = self.POLL_INTERVAL if self._polled else -1
+                for fd, _ in self._epoll.poll(timeout):
+                    if fd == self._wakeup_r:
+                        os.read(self._wakeup_r, 4096)
+                        continue
+                    with self._lock:
+                        self._epoll.unregister(fd)
+                        process, callback = self._pidfds.pop(fd)
+                    os.close(fd)
+                    callback(process.wait())
+                    # Callbacks are dropped so that their owners, such as
+                    # the Executor, can be freed while the thread sleeps.
+                    process = callback = None
+            else:
+                with self._lock:
+                    while not (self._polled or self._closed):
+                        self._lock.wait()
+                sleep(self.POLL_INTERVAL)
+
+            if self._polled:
+                with self._lock:
+                    exited = [
+                        pid
+                        for pid, (process, _) in self._polled.items()
+                        if process.poll() is not None
+                    ]
+                    exited = [self._polled.pop(pid) for pid in exited]
+                for process, callback in exited:
+                    callback(process.returncode)
+                exited = process = callback = None
+
+
+class _Sampler:
+    """
+    A single thread that samples the resource usage of running tasks.
+
+    A task is sampled along with every process descended from it. New tasks
+    are sampled often and the interval grows with their age, so that short
+    tasks are still measured while long ones cost little. The interval is
+    also stretched so that sampling takes no more than a small fraction of
+    the thread's time.
+
+    Descendants are found through procfs where the kernel provides it, so
+    the cost of a sample depends only on the size of the task's process
+    tree. CPU time includes descendants that have exited and been waited on
+    by their parents. Usage of processes that exit between two samples is
+    otherwise missed, as is the last interval of a task's life.
+    """
+
+    #: Shortest number of seconds between samples of a task.
+    MIN_INTERVAL = 0.05
+    #: Longest number of seconds between samples of a task.
+    MAX_INTERVAL = 5.0
+    #: Fraction of its age a task waits until its next sample.
+    AGE_FRACTION = 0.1
+    #: Largest fraction of time the thread spends sampling.
+    MAX_OVERHEAD = 0.01
+
+    def __init__(self):
+        """Initialize a sampler whose thread starts on the first watch."""
+        self._lock = Condition(Lock())
+        self._heap = []
+        self._order = count()
+        self._floor = self.MIN_INTERVAL
+        self._thread = None
+        self._closed = False
+        self._io = hasattr(Process, "io_counters")
+        # Linux lists the children of each thread, which avoids scanning
+        # every process on the node to find the descendants of a task.
+        pid = os.getpid()
+        self._procfs = os.path.exists(f"/proc/{pid}/task/{pid}/children")
+
+    def watch(self, record):
+        """
+        Sample the usage of a record's process until it exits.
+
+        :param record: The record of a running task, whose usage is set to
+            a new TaskUsage.
+        :raises RuntimeError: Raised when the sampler has been closed.
+        """
+        record.usage = TaskUsage()
+        started = monotonic()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The usage sampler has been closed.")
+            heappush(
+                self._heap,
+                (
+                    started + self.MIN_INTERVAL,
+                    next(self._order),
+                    record,
+                    {},
+                    started,
+                ),
+            )
+            self._lock.notify()
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="pyaestro-sampler", daemon=True
+                )
+                self._thread.start()
+
+    def close(self):
+        """Stop the sampler thread and forget every task being sampled."""
+        with self._lock:
+            self._closed = True
+            self._heap.clear()
+            thread = self._thread
+            self._lock.notify()
+
+        if thread is not None and thread is not current_thread():
+            thread.join()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._heap:
+                        self._lock.wait()
+                        continue
+                    remaining = self._heap[0][0] - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+
+                # Tasks due soon are sampled early to share the scan below.
+                now = monotonic()
+                due = []
+                horizon = now + self.MIN_INTERVAL
+                while self._heap and self._heap[0][0] <= horizon:
+                    due.append(heappop(self._heap))
+
+            # Without procfs, one scan of the process table serves every
+            # task being sampled.
+            children = None
+            if not self._procfs:
+                children = {}
+                for proc in process_iter(["ppid"]):
+                    children.setdefault(proc.info["ppid"], []).append(proc.pid)
+            for _, _, record, procs, _ in due:
+                self._sample(record, procs, children)
+
+            cost = monotonic() - now
+            self._floor = max(self.MIN_INTERVAL, cost / self.MAX_OVERHEAD)
+            with self._lock:
+                for _, _, record, procs, started in due:
+                    # The return code is only set once the reaper has
+                    # waited on the process.
+                    if record.process.returncode is not None:
+                        continue
+                    interval = min(
+                        self.MAX_INTERVAL,
+                        max(
+                            self._floor,
+                            (now - started) * self.AGE_FRACTION,
+                        ),
+                    )
+                    heappush(
+                        self._heap,
+                        (
+                            now + interval,
+                            next(self._order),
+                            record,
+                            procs,
+                            started,
+                        ),
+                    )
+            # Records are dropped so that the Executor can be freed while
+            # the thread sleeps.
+            due = record = procs = None
+
+    def _children(self, pid, children):
+        """
+        Get the pids of the child processes of a process.
+
+        :param pid: The pid of the parent process.
+        :param children: A dict of the child pids of every process on the
+            node, or None to read them from procfs.
+        """
+        if children is not None:
+            return children.get(pid, ())
+
+        found = []
+        try:
+            for tid in os.listdir(f"/proc/{pid}/task"):
+                with open(f"/proc/{pid}/task/{tid}/children") as listing:
+                    found.extend(
+                        int(child) for child in listing.read().split()
+                    )
+        except OSError:
+            pass
+        return found
+
+    def _sample(self, record, procs, children):
+        """
+        Add a sample of a task's process tree to its usage.
+
+        :param record: The record of the task.
+        :param procs: A dict of the Process and last (read, write) bytes of
+            every process of the task, keyed by pid.
+        :param children: A dict of the child pids of every process on the
+            node, or None to read them from procfs.
+        """
+        cpu_time = rss = 0
+        stack = [record.process.pid]
+        while stack:
+            pid = stack.pop()
+            try:
+                seen = procs.get(pid)
+                if seen is None:
+                    seen = procs[pid] = [Process(pid), 0, 0]
+                proc = seen[0]
+                with proc.oneshot():
+                    times = proc.cpu_times()
+                    rss += proc.memory_info().rss
+                    if self._io:
+                        counters = proc.io_counters()
+                        seen[1] = counters.read_bytes
+                        seen[2] = counters.write_bytes
+            except (NoSuchProcess, AccessDenied):
+                continue
+            # Exited children that were waited on are counted by their
+            # parent, and live ones are counted on their own.
+            cpu_time += (
+                times.user
+                + times.system
+                + times.children_user
+                + times.children_system
+            )
+            stack.extend(self._children(pid, children))
+
+        usage = record.usage
+        usage.cpu_time = max(usage.cpu_time, cpu_time)
+        usage.peak_rss = max(usage.peak_rss, rss)
+        usage.read_bytes = sum(seen[1] for seen in procs.values())
+        usage.write_bytes = sum(seen[2] for seen in procs.values())
+        usage.samples += 1
+
+
+class GraphRun:
+    """
+    A live view of the execution of a graph of tasks by an Executor.
+
+    Each vertex is submitted as soon as all of its predecessors have
+    succeeded. Submission is driven by the Executor's state changes rather
+    than by polling, so a vertex is dispatched from the thread that
+    observed its last dependency finish. When a vertex fails or is
+    cancelled, every vertex downstream of it is cancelled without running.
+
+    Vertices that are waiting on their dependencies are INITIALIZED; once
+    submitted, a vertex takes the state of its task.
+    """
+
+    def __init__(self, executor, graph, workspace):
+        """
+        Prepare the execution of a graph. Call `start` to begin running it.
+
+        :param executor: The Executor to submit tasks to.
+        :param graph: An AcyclicAdjGraph whose vertices describe scripts.
+        :param workspace: Workspace of vertices that do not specify one.
+        """
+        self._executor = executor
+        self._lock = Lock()
+        self._finished = Condition(self._lock)
+        with graph:
+            predecessors = Predecessors.get_predecessors(graph)
+            self._specs = {node: graph[node] for node in predecessors}
+        self._workspace = workspace
+        self._waiting = {
+            node: len(preds) for node, preds in predecessors.items()
+        }
+        self._successors = {node: [] for node in predecessors}
+        for node, preds in predecessors.items():
+            for pred in preds:
+                self._successors[pred].append(node)
+        self._states = {
+            node: ExecTaskState.INITIALIZED for node in predecessors
+        }
+        self._taskids = {}
+        self._nodes = {}
+        self._remaining = len(predecessors)
+
+    def start(self):
+        """Subscribe to the Executor and submit vertices without inputs."""
+        self._executor.subscribe(self._task_changed)
+        with self._lock:
+            ready = [
+                node for node, count in self._waiting.items() if not count
+            ]
+            for node in ready:
+                self._submit(node)
+            self._check_finished()
+
+    def _submit(self, node):
+        """Submit the task of a vertex. Must hold the run's lock."""
+        spec = self._specs[node]
+        if isinstance(spec, str):
+            spec = {"script": spec}
+        kwargs = dict(spec)
+        script = kwargs.pop("script")
+        workspace = kwargs.pop("workspace", self._workspace)
+        args = kwargs.pop("args", ())
+
+        try:
+            taskid = self._executor.submit(script, workspace, *args, **kwargs)
+        except Exception:
+            LOGGER.exception("Unable to submit vertex '%s'.", node)
+            self._finish(node, ExecTaskState.FAILED)
+            return
+
+        self._taskids[node] = taskid
+        self._nodes[taskid] = node
+        self._states[node] = ExecTaskState.PENDING
+
+    def _task_changed(self, taskid, state):
+        """Track the state of submitted tasks and dispatch successors."""
+        # Submitting a vertex reports PENDING while the lock is held, so
+        # only the states that drive the run take the lock.
+        if state not in FINAL_STATES and state != ExecTaskState.RUNNING:
+            return
+
+        with self._lock:
+            node = self._nodes.get(taskid)
+            if node is None or self._states[node] in FINAL_STATES:
+                return
+            if state == ExecTaskState.RUNNING:
+                self._states[node] = state
+                return
+            self._finish(node, state)
+            self._check_finished()
+
+    def _finish(self, node, state):
+        """Record the final state of a vertex and update its successors."""
+        self._states[node] = state
+        self._remaining -= 1
+        if state == ExecTaskState.SUCCESS:
+            for dest in self._successors[node]:
+                self._waiting[dest] -= 1
+                # A successor may have been cancelled by cancel() while this
+                # vertex was finishing, and must not be submitted.
+                if self._states[dest] != ExecTaskState.INITIALIZED:
+                    continue
+                if not self._waiting[dest]:
+                    self._submit(dest)
+            return
+
+        # Cancel everything downstream of a vertex that did not succeed.
+        stack = list(self._successors[node])
+        while stack:
+            dest = stack.pop()
+            if self._states[dest] == ExecTaskState.INITIALIZED:
+                self._states[dest] = ExecTaskState.CANCELLED
+                self._remaining -= 1
+                stack.extend(self._successors[dest])
+
+    def _check_finished(self):
+        if not self._remaining:
+            self._executor.unsubscribe(self._task_changed)
+            self._finished.notify_all()
+
+    def cancel(self):
+        """Cancel every vertex of the graph that has not finished."""
+        with self._lock:
+            for node, state in self._states.items():
+                if state == ExecTaskState.INITIALIZED:
+                    self._states[node] = ExecTaskState.CANCELLED
+                    self._remaining -= 1
+            taskids = [
+                self._taskids[node]
+                for node, state in self._states.items()
+                if node in self._taskids and state not in FINAL_STATES
+            ]
+            self._check_finished()
+
+        # Cancelling reports back through _task_changed, so the lock must
+        # not be held while cancelling.
+        for taskid in taskids:
+            self._executor.cancel(taskid)
+
+    def done(self):
+        """
+        Check whether every vertex has reached a final state.
+
+        :returns: True if the run has finished.
+        """
+        with self._lock:
+            return not self._remaining
+
+    def wait(self, timeout=None):
+        """
+        Wait for every vertex to reach a final state.
+
+        :param timeout: Maximum number of seconds to wait, or None to wait
+            without a limit.
+        :returns: True if the run has finished, False on a timeout.
+        """
+        with self._finished:
+            return self._finished.wait_for(
+                lambda: not self._remaining, timeout
+            )
+
+    def get_status(self, node):
+        """
+        Get the state of a vertex.
+
+        :param node: The key of a vertex of the graph.
+        :returns: The ExecTaskState of the vertex.
+        """
+        with self._lock:
+            return self._states[node]
+
+    def get_taskid(self, node):
+        """
+        Get the identifier of the task submitted for a vertex.
+
+        :param node: The key of a vertex of the graph.
+        :returns: The task identifier, or None if the vertex has not been
+            submitted.
+        """
+        with self._lock:
+            return self._taskids.get(node)
+
+    def get_all_status(self):
+        """
+        Get the state of every vertex.
+
+        :returns: A dict mapping each vertex to its ExecTaskState.
+        """
+        with self._lock:
+            return dict(self._states)
+
+    def progress(self):
+        """
+        Count the vertices in each state.
+
+        :returns: A dict mapping every ExecTaskState to the number of
+            vertices in that state.
+        """
+        counts = dict.fromkeys(ExecTaskState, 0)
+        with self._lock:
+            for state in self._states.values():
+                counts[state] += 1
+        return counts
+
+
 class Executor(metaclass=Singleton):
     """A class that manages local tasks using asynchronous futures."""
 
     @dataclass
-    class _Record(metaclass=SynchronizedClass):
-        """Executor Record class for tracking futures and processes."""
+    class _Record:
+        """
+        Executor Record class for tracking futures and processes.
+
+        Each record guards its own state with a private lock, so records
+        never contend with one another. State changes are made through
+        `transition`, a compare-and-set that only moves a record out of an
+        expected state, and reading `state` never takes the lock. Every
+        change of state is reported to the record's listener.
+        """
 
         uuid: uuid4
         process: Popen
-        stdout: _io.TextIOWrapper
-        stderr: _io.TextIOWrapper
+        stdout: str
+        stderr: str
+        capture: _Capture
         estatus: int
         state: ExecTaskState
+        usage: TaskUsage
 
-        def __init__(self):
-            """Initialize a new record with a uuid and initial state."""
-            self.uuid = uuid4()
+        def __init__(self, listener=None, uuid=None):
+            """
+            Initialize a new record with a uuid and initial state.
+
+            :param listener: Optional callable taking the record and its new
+             ExecTaskState, called after each change of state outside of the
+             record's lock.
+            :param uuid: Optional UUID of the record. Defaults to a new
+             random UUID.
+            """
+            self.uuid = uuid or uuid4()
+            self.taskid = str(self.uuid)
             self.state = ExecTaskState.INITIALIZED
             self.process = None
+            self.cores = 1
+            self.memory = 0
+            self.priority = 0
+            self.group = None
+            self.submitted = None
+            self.usage = None
+            self.capture = None
+            self.capture_lines = 0
+            self._lock = Lock()
+            self._listener = listener
+
+        def _notify(self, state):
+            if self._listener is not None:
+                self._listener(self, state)
+
+        def transition(self, expected, state):
+            """
+            Atomically move the record to a new state.
+
+            :param expected: A collection of the states the record may be
+             moved out of.
+            :param state: The ExecTaskState to move the record to.
+            :returns: True if the record was in an expected state and has
+             been moved, False if it was left unchanged.
+            """
+            with self._lock:
+                if self.state not in expected:
+                    return False
+                self.state = state
+            self._notify(state)
+            return True
 
         def execute(self, script, cwd, *args, **kwargs):
             """
-            Executes the record instance.
+            Starts the process of the record instance without waiting on it.
 
             :param script: Path to a script to execute.
             :param cwd: Directory path to execute the script in.
@@ -74,50 +1093,81 @@ class Executor(metaclass=Singleton):
              - env [dict]: A dict of environment variables.
              - stdout [str]: Name of the output .out file.
              - stderr [str]: Name of the output .err file.
+             - capture [int]: Lines of output to keep in memory.
+            :returns: The started Popen instance, or None if the record was
+             cancelled before it started.
             """
+            # Holding the lock while starting the process means that a
+            # concurrent cancel either stops the start or sees the process.
+            state = None
             try:
-                # Pop optional kwargs
-                shell = kwargs.pop("shell", True)
-                env = kwargs.pop("env", None)
-                stdout = kwargs.pop("stdout", f"{self.uuid}.out")
-                stderr = kwargs.pop("stderr", f"{self.uuid}.err")
+                with self._lock:
+                    # The task was cancelled before it could be started.
+                    if self.state != ExecTaskState.PENDING:
+                        return None
+                    try:
+                        self._start(script, cwd, *args, **kwargs)
+                        # Initalize the record's state to RUNNING since
+                        # Popen was called.
+                        self.state = state = ExecTaskState.RUNNING
+                    except Exception:
+                        self.state = state = ExecTaskState.FAILED
+                        raise
+            finally:
+                if state is not None:
+                    self._notify(state)
+
+            return self.process
+
+        def _start(self, script, cwd, *args, **kwargs):
+            # Pop optional kwargs
+            shell = kwargs.pop("shell", True)
+            env = kwargs.pop("env", None)
+            stdout = kwargs.pop("stdout", f"{self.uuid}.out")
+            stderr = kwargs.pop("stderr", f"{self.uuid}.err")
+            capture = kwargs.pop("capture", 0)
 
-                # Set up core arguments (cmd, stdout, stderr)
-                cmd = " ".join([abspath(script)] + list(*args))
-                self.stdout = open(join(cwd, stdout), "wb")
-                self.stderr = open(join(cwd, stderr), "wb")
+            # Set up core arguments (cmd, stdout, stderr)
+            cmd = " ".join([abspath(script)] + list(*args))
+            self.stdout = join(cwd, stdout)
+            self.stderr = join(cwd, stderr)
 
+            if capture:
+                # Output is read from pipes by the Executor's output pump,
+                # which writes it to the log files.
+                self.capture = _Capture(capture, (self.stdout, self.stderr))
+                try:
+                    self.process = Popen(
+                        cmd,
+                        shell=shell,
+                        env=env,
+                        cwd=cwd,
+                        stdout=PIPE,
+                        stderr=PIPE,
+                        **kwargs,
+                    )
+                except Exception:
+                    self.capture.close()
+                    raise
+                self.capture.pipes = [self.process.stdout, self.process.stderr]
+                return
+
+            # The child holds its own copies of the descriptors, so the
+            # files are closed as soon as it has started.
+            with open(self.stdout, "wb") as out, open(
+                self.stderr, "wb"
+            ) as err:
                 # Start the new process.
                 self.process = Popen(
                     cmd,
                     shell=shell,
                     env=env,
                     cwd=cwd,
-                    stdout=self.stdout,
-                    stderr=self.stderr,
+                    stdout=out,
+                    stderr=err,
                     **kwargs,
                 )
 
-                # Initalize the record's state to RUNNING since
-                # Popen was called.
-                self.state = ExecTaskState.RUNNING
-                # Prematurely drop the lock so that other processes
-                # can access the class.
-                # NOTE: This is a slight nuance of how the metaclass
-                # was implemented. Need to figure out if there is a
-                # better way to do this.
-                self.__lock__.release()
-                # Do a non-blocking communicate to wait on the process.
-                # DO NOT use a wait -- that blocks and prevents the GIL
-                # from moving forward.
-                self.process.communicate()
-                # Reacquire the lock.. this is ugly but..
-                self.__lock__.acquire()
-
-            except Exception:
-                self.state = ExecTaskState.FAILED
-                raise
-
         def cancel(self, future):
             """
             Cancel the task represented by the _Record instance.
@@ -125,20 +1175,20 @@ class Executor(metaclass=Singleton):
             :returns: An ExecCancel enum representing the exit status
              of the cancel command.
             """
-            # If we find that the future is done, just return success.
-            if future.done():
+            # If we find that the task has finished, just return success.
+            running = {ExecTaskState.PENDING, ExecTaskState.RUNNING}
+            if not self.transition(running, ExecTaskState.CANCELLED):
                 return ExecCancel.SUCCESS
-            # If we haven't started running yet, cancel from the future.
-            elif not future.running():
-                future.record.state = ExecTaskState.CANCELLED
-                future.cancel()
+
+            # If we haven't been given a slot yet, cancel from the future.
+            # A record given a slot but not yet started will not start.
+            if future.cancel() or self.process is None:
                 return ExecCancel.SUCCESS
             else:
                 try:
                     parent = Process(self.process.pid)
                     children = parent.children(recursive=True)
                     children.append(parent)
-                    self.state = ExecTaskState.CANCELLED
                     for child in children:
                         child.terminate()
 
@@ -148,30 +1198,36 @@ class Executor(metaclass=Singleton):
 
                     return ExecCancel.SUCCESS
                 except TimeoutExpired:
-                    self.state = ExecTaskState.UNKNOWN
+                    self.transition(
+                        {ExecTaskState.CANCELLED}, ExecTaskState.UNKNOWN
+                    )
                     return ExecCancel.TIMEDOUT
                 except NoSuchProcess:
                     return ExecCancel.SUCCESS
                 except Exception:
-                    self.state = ExecTaskState.UNKNOWN
+                    self.transition(
+                        {ExecTaskState.CANCELLED}, ExecTaskState.UNKNOWN
+                    )
                     return ExecCancel.FAILED
 
         def cleanup(self, future):
             """Clean up method to close out a record instance."""
-            if self.state == ExecTaskState.CANCELLED:
+            # Cancelled records keep their state.
+            if future.cancelled() or self.state == ExecTaskState.CANCELLED:
                 return
 
+            running = {ExecTaskState.PENDING, ExecTaskState.RUNNING}
             if future.exception():
                 self.estatus = 127
-                self.state = ExecTaskState.FAILED
+                self.transition(running, ExecTaskState.FAILED)
                 return
 
             self.estatus = self.process.wait()
 
             if self.estatus != 0:
-                self.state = ExecTaskState.FAILED
+                self.transition(running, ExecTaskState.FAILED)
             else:
-                self.state = ExecTaskState.SUCCESS
+                self.transition(running, ExecTaskState.SUCCESS)
 
         @staticmethod
         def cleanup_hook(future):
@@ -183,11 +1239,290 @@ class Executor(metaclass=Singleton):
             # Call clean up on the record in the future.
             future.record.cleanup(future)
 
-    def __init__(self, workers):
-        """An Executor that mimics scheduler-like behavior locally."""
+    #: Number of queued tasks searched for one that fits free resources.
+    BACKFILL_DEPTH = 64
+    #: Times the task at the front of the queue may be passed over before
+    #: backfilling stops until it has started.
+    MAX_BYPASS = 1000
+
+    def __init__(
+        self,
+        workers,
+        cores=None,
+        memory=None,
+        aging=1 / 60,
+        fair_share=False,
+        sample_usage=False,
+    ):
+        """
+        An Executor that mimics scheduler-like behavior locally.
+
+        Worker threads only start processes; a single reaper thread notices
+        when they exit. Tasks declare the cores and memory they need and
+        are packed against the capacity of the node: a queued task starts
+        once at most `workers` processes are running and its cores and
+        memory are free. When the task at the front of the queue does not
+        fit, smaller tasks behind it are backfilled into the gap.
+
+        Queued tasks start in order of priority, and waiting tasks slowly
+        gain priority so that none of them starve. With fair-share enabled,
+        tasks are grouped by the `group` they were submitted with, and each
+        group is given cores in proportion to its share.
+
+        :param workers: Maximum number of processes to run concurrently.
+        :param cores: Number of cores tasks may use at once. Defaults to the
+            number of CPUs of the node.
+        :param memory: Bytes of memory tasks may use at once. Defaults to
+            the total memory of the node.
+        :param aging: Priority a queued task gains per second of waiting.
+            Defaults to one level per minute.
+        :param fair_share: Share cores fairly among groups of tasks.
+        :param sample_usage: Sample the CPU time, memory and I/O used by
+            each running task on a background thread.
+        """
 
         self._statuses = MultiRdrWtrDict()
         self._thread_pool = ThreadPoolExecutor(max_workers=workers)
+        self._workers = workers
+        self._capacity = (
+            workers,
+            cores or cpu_count() or 1,
+            memory or virtual_memory().total,
+        )
+        self._free = list(self._capacity)
+        self._queue = _TaskQueue(aging, fair_share)
+        self._queue_lock = Condition(Lock())
+        self._drainers = 0
+        self._bypassed = 0
+        self._reaper = _Reaper()
+        self._sampler = _Sampler() if sample_usage else None
+        self._pump = _OutputPump()
+        self._subscribers = []
+        self._changed = Condition(Lock())
+        self._waiters = []
+        self._closed = False
+
+    def __del__(self):
+        # The Executor may have failed to initialize.
+        # Tasks are left running: collection, or interpreter exit, only
+        # stops the background threads.
+        if hasattr(self, "_closed"):
+            self.shutdown(cancel=False)
+
+    def _record_changed(self, record, state):
+        """Wake waiters and notify subscribers of a task's new state."""
+        taskid = record.taskid
+        for callback in list(self._subscribers):
+            try:
+                callback(taskid, state)
+            except Exception:
+                LOGGER.exception("Exception calling subscriber %r", callback)
+
+        # Waiters are woken last so they observe the work of subscribers.
+        # The lock is always taken: wait reads states and registers its
+        # waiter under it, so a task cannot finish in between unnoticed.
+        if state in FINAL_STATES:
+            with self._changed:
+                for waiter in self._waiters:
+                    if taskid in waiter.pending:
+                        waiter.pending.discard(taskid)
+                        waiter.done.add(taskid)
+                self._changed.notify_all()
+
+    def subscribe(self, callback):
+        """
+        Subscribe to the state transitions of every task.
+
+        Callbacks are called from whichever thread changes a task's state,
+        so they should return quickly and must not block on other tasks.
+
+        :param callback: Callable taking a task identifier and the
+            ExecTaskState it has moved to.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Remove a subscriber from task state transitions.
+
+        :param callback: A callable that was previously subscribed.
+        :raises ValueError: Raised when `callback` is not subscribed.
+        """
+        self._subscribers.remove(callback)
+
+    def wait(self, taskids, return_when=ALL_COMPLETED, timeout=None):
+        """
+        Wait for tasks to reach a final state without polling.
+
+        :param taskids: An iterable of task identifiers to wait on.
+        :param return_when: FIRST_COMPLETED to return once any task has
+            finished, or ALL_COMPLETED to wait for all of them.
+        :param timeout: Maximum number of seconds to wait, or None to wait
+            without a limit.
+        :returns: A tuple of two sets, the identifiers of tasks that have
+            finished and of those that have not.
+        :raises KeyError: Raised when a task identifier is unknown.
+        """
+        if return_when not in (FIRST_COMPLETED, ALL_COMPLETED):
+            raise ValueError(f"Unsupported return_when '{return_when}'.")
+
+        first = return_when == FIRST_COMPLETED
+        records = [self._statuses[taskid].record for taskid in taskids]
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._changed:
+            done = {r.taskid for r in records if r.state in FINAL_STATES}
+            pending = {r.taskid for r in records} - done
+            waiter = _Waiter(pending, done)
+            self._waiters.append(waiter)
+            try:
+                while pending and not (first and done):
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            break
+                    self._changed.wait(remaining)
+            finally:
+                self._waiters.remove(waiter)
+            return set(done), set(pending)
+
+    @property
+    def capacity(self):
+        """tuple: The (processes, cores, memory) that tasks may use."""
+        return self._capacity
+
+    def set_share(self, group, share):
+        """
+        Set the share of cores given to a group when fair-share is enabled.
+
+        :param group: A hashable group identifier.
+        :param share: A positive weight. Groups default to a share of 1.
+        """
+        with self._queue_lock:
+            self._queue.set_share(group, share)
+
+    def _enqueue(self, launches):
+        """
+        Queue task launches, starting pool threads to drain the queue.
+
+        :param launches: A list of (future, launch) tuples, where launch is
+            a callable that starts the task of the future.
+        """
+        with self._queue_lock:
+            for future, launch in launches:
+                record = future.record
+                self._queue.push(
+                    (future, launch),
+                    record.priority,
+                    record.group,
+                    record.submitted,
+                )
+            started = min(len(self._queue), self._workers - self._drainers)
+            self._drainers += started
+            self._queue_lock.notify_all()
+
+        for _ in range(started):
+            self._thread_pool.submit(self._drain)
+
+    def _drain(self):
+        """Launch queued tasks as resources free up until none are left."""
+        while True:
+            with self._queue_lock:
+                launch = self._take()
+                while launch is None:
+                    if not self._queue:
+                        self._drainers -= 1
+                        return
+                    self._queue_lock.wait()
+                    launch = self._take()
+            launch()
+
+    def _take(self):
+        """
+        Remove the first queued task that fits and reserve its resources.
+
+        Must be called while holding the queue lock.
+
+        :returns: The launch callable of the task, or None if no task fits.
+        """
+        queue, free = self._queue, self._free
+        depth = self.BACKFILL_DEPTH
+        if self._bypassed >= self.MAX_BYPASS:
+            depth = 1
+
+        # Tasks that do not fit are put back in their places afterwards.
+        passed = []
+        try:
+            while len(passed) < depth:
+                entry = queue.pop()
+                if entry is None:
+                    return None
+
+                future, launch = entry[2]
+                if future.cancelled():
+                    continue
+
+                record = future.record
+                if (
+                    free[0] >= 1
+                    and free[1] >= record.cores
+                    and free[2] >= record.memory
+                ):
+                    free[0] -= 1
+                    free[1] -= record.cores
+                    free[2] -= record.memory
+                    queue.charge(entry, max(record.cores, 1))
+                    self._bypassed = self._bypassed + 1 if passed else 0
+                    return launch
+                passed.append(entry)
+
+            return None
+        finally:
+            for entry in passed:
+                queue.restore(entry)
+
+    def _release(self, record):
+        """Return the resources reserved for a task."""
+        with self._queue_lock:
+            self._free[0] += 1
+            self._free[1] += record.cores
+            self._free[2] += record.memory
+            self._queue_lock.notify_all()
+
+    def _launch(self, future, script, workspace, *args, **kwargs):
+        """
+        Start the process of a task with the resources reserved for it.
+
+        :param future: The Future tracking completion of the task.
+        """
+        record = future.record
+        if not future.set_running_or_notify_cancel():
+            self._release(record)
+            return
+
+        try:
+            process = record.execute(script, workspace, *args, **kwargs)
+        except Exception as exception:
+            self._release(record)
+            future.set_exception(exception)
+            return
+
+        if process is None:
+            self._release(record)
+            future.set_result(None)
+        else:
+            reaped = partial(self._reaped, future)
+            if record.capture is not None:
+                self._pump.watch(record.capture)
+                reaped = partial(self._pump.finish, record.capture, reaped)
+            self._reaper.watch(process, reaped)
+            if self._sampler is not None:
+                self._sampler.watch(record)
+
+    def _reaped(self, future, returncode):
+        """Free the resources of an exited process and complete its future."""
+        self._release(future.record)
+        future.set_result(returncode)
 
     def submit(self, script, workspace, *args, **kwargs):
         """
@@ -202,19 +1537,126 @@ class Executor(metaclass=Singleton):
             - env [dict]: A dict of environment variables.
             - stdout [str]: Name of the output .out file.
             - stderr [str]: Name of the output .err file.
+            - cores [int]: Number of cores the task uses. Defaults to 1.
+            - memory [int]: Bytes of memory the task uses. Defaults to 0.
+            - priority [float]: Tasks with a higher priority start first.
+              Defaults to 0.
+            - group [Hashable]: Fair-share group of the task, such as the
+              submitting workflow or user. Defaults to None.
+            - capture [int]: Number of lines of stdout and stderr to keep in
+              memory for `tail`. Output is then read through pipes and
+              still written to the log files. Defaults to 0, which leaves
+              output to go straight to the log files.
         :returns: A string containing the unique job identifier.
+        :raises ValueError: Raised when the task needs more cores or memory
+            than the Executor has.
+        :raises RuntimeError: Raised when the Executor has been shut down.
         """
+        self._check_open()
         # Create a new _Record instance to track the submission.
-        record = Executor._Record()
+        record = Executor._Record(self._record_changed)
+        future, launch = self._prepare(record, script, workspace, args, kwargs)
+        # Add the status to the status dictionary.
+        taskid = record.taskid
+        self._statuses[taskid] = future
+        self._notify_pending([record])
+        # Hand the launch of the process to our thread pool.
+        self._enqueue([(future, launch)])
+        # Return the job identifier.
+        return taskid
+
+    def submit_many(self, specs):
+        """
+        Executes many scripts within an Executor instance.
+
+        Records for every task are created up front and added to the
+        status map with a single lock acquisition, which makes submitting
+        large batches much cheaper than calling submit for each task. If
+        any spec is invalid, none of the tasks are submitted.
+
+        :param specs: An iterable of tuples of (script, workspace, args,
+            kwargs), where args is a sequence of arguments and kwargs a
+            dict of the keyword arguments accepted by submit. Both args and
+            kwargs may be omitted.
+        :returns: A list of the job identifiers, in the order of `specs`.
+        :raises ValueError: Raised when a task needs more cores or memory
+            than the Executor has.
+        :raises RuntimeError: Raised when the Executor has been shut down.
+        """
+        self._check_open()
+        specs = list(specs)
+        # One call for the randomness of every uuid rather than one each.
+        entropy = os.urandom(16 * len(specs))
+        futures, launches = {}, []
+        for i, (script, workspace, *rest) in enumerate(specs):
+            args = tuple(rest[0]) if rest else ()
+            kwargs = dict(rest[1]) if len(rest) > 1 else {}
+            start, end = 16 * i, 16 * (i + 1)
+            uuid = UUID(bytes=entropy[start:end], version=4)
+            record = Executor._Record(self._record_changed, uuid)
+            future, launch = self._prepare(
+                record, script, workspace, args, kwargs
+            )
+            futures[record.taskid] = future
+            launches.append((future, launch))
+
+        self._statuses.update(futures)
+        self._notify_pending(future.record for future, _ in launches)
+        self._enqueue(launches)
+        return list(futures)
+
+    def _notify_pending(self, records):
+        """
+        Notify subscribers that new tasks are pending.
+
+        Called once the tasks are in the status map, so that subscribers
+        can look them up, and before they are queued to start.
+
+        :param records: An iterable of the records of the new tasks.
+        """
+        if self._subscribers:
+            for record in records:
+                self._record_changed(record, ExecTaskState.PENDING)
+
+    def _prepare(self, record, script, workspace, args, kwargs):
+        """
+        Set up the future and launch of a new record.
+
+        :returns: A tuple of the Future tracking the task and a callable
+            that launches it.
+        """
+        # Check the resources of the task fit on the node.
+        record.cores = kwargs.pop("cores", 1)
+        record.memory = kwargs.pop("memory", 0)
+        record.priority = kwargs.pop("priority", 0)
+        record.group = kwargs.pop("group", None)
+        record.submitted = monotonic()
+        record.capture_lines = kwargs.get("capture", 0)
+        if record.capture_lines < 0:
+            raise ValueError("The number of captured lines must be >= 0.")
+        _, cores, memory = self._capacity
+        if not (0 <= record.cores <= cores and 0 <= record.memory <= memory):
+            raise ValueError(
+                f"Task requesting {record.cores} cores and {record.memory} "
+                f"bytes does not fit in {cores} cores and {memory} bytes."
+            )
+
         # Setup the stdout and stderr logging.
-        stdout = kwargs.get("stdout", f"local-{record.uuid}.out")
-        stderr = kwargs.get("stderr", f"local-{record.uuid}.err")
+        stdout = kwargs.pop("stdout", f"local-{record.taskid}.out")
+        stderr = kwargs.pop("stderr", f"local-{record.taskid}.err")
 
-        # Set the record's state to pending.
+        # Set the record's state to pending. No other thread has seen the
+        # record yet, so there is no need to take its lock. Subscribers are
+        # notified once the record has been added to the status map.
         record.state = ExecTaskState.PENDING
-        # Submit the script to our thread pool.
-        future = self._thread_pool.submit(
-            record.execute,
+        # Create a future that completes when the process exits.
+        future = Future()
+        future.record = record
+        # Add the callback wrapper to the future for clean up.
+        future.add_done_callback(self._Record.cleanup_hook)
+        launch = partial(
+            self._launch,
+            future,
             script,
             workspace,
             args,
@@ -222,14 +1664,25 @@ class Executor(metaclass=Singleton):
             stderr=stderr,
             **kwargs,
         )
-        # Add the record to the returned future.
-        future.record = record
-        # Add the callback wrapper to the future for clean up.
-        future.add_done_callback(self._Record.cleanup_hook)
-        # Add the status to the status dictionary.
-        self._statuses[str(record.uuid)] = future
-        # Return the job identifier.
-        return str(record.uuid)
+        return future, launch
+
+    def run_graph(self, graph, workspace=None):
+        """
+        Execute the vertices of a graph in dependency order.
+
+        Each vertex holds the path of a script, or a dict with a "script"
+        and optionally a "workspace", a sequence of "args" and any of the
+        keyword arguments accepted by submit. A vertex is submitted once
+        all of its predecessors have succeeded, and is cancelled without
+        running if any of them fails or is cancelled.
+
+        :param graph: An AcyclicAdjGraph whose vertices describe scripts.
+        :param workspace: Workspace of vertices that do not specify one.
+        :returns: A GraphRun to follow the progress of the execution.
+        """
+        run = GraphRun(self, graph, workspace)
+        run.start()
+        return run
 
     def cancel(self, taskid):
         """
@@ -255,6 +1708,7 @@ class Executor(metaclass=Singleton):
         # a running job is cancelled, a pending one has started and
         # cannot be cancelled through the future. To prevent this, we
         # need to cancel pending jobs first to prevent the cascade.
+        # Tasks may be submitted meanwhile, so a snapshot is iterated.
         for future in self._statuses.values():
             state = future.record.state
             if state == ExecTaskState.RUNNING:
@@ -265,6 +1719,39 @@ class Executor(metaclass=Singleton):
         for future in running:
             future.record.cancel(future)
 
+    def shutdown(self, cancel=True):
+        """
+        Cancel every task and stop the Executor's background threads.
+
+        Waits for the worker, reaper, sampler and output threads to stop and
+        closes the descriptors they hold. No tasks can be submitted once the
+        Executor has been shut down.
+
+        :param cancel: Cancel queued and running tasks. Otherwise running
+            processes are left to finish on their own, unobserved, and the
+            worker threads are not waited for.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if cancel:
+            self.cancel_all()
+            # Wake workers waiting on resources so they see the
+            # cancellations.
+            with self._queue_lock:
+                self._queue_lock.notify_all()
+        self._thread_pool.shutdown(wait=cancel)
+        self._reaper.close()
+        if self._sampler is not None:
+            self._sampler.close()
+        self._pump.close()
+
+    def _check_open(self):
+        """Raise a RuntimeError if the Executor has been shut down."""
+        if self._closed:
+            raise RuntimeError("Cannot submit tasks to a shut down Executor.")
+
     def get_status(self, taskid):
         """
         Get the status of a specific task.
@@ -274,6 +1761,40 @@ class Executor(metaclass=Singleton):
         """
         return self._statuses[taskid].record.state
 
+    def get_usage(self, taskid):
+        """
+        Get the resources used by a specific task so far.
+
+        :param taskid: A string containing the task identifier.
+        :returns: A copy of the TaskUsage of the task, or None if usage is
+            not being sampled or the task has not started.
+        """
+        usage = self._statuses[taskid].record.usage
+        return None if usage is None else replace(usage)
+
+    def tail(self, taskid, n=10, stream="stdout"):
+        """
+        Get the last lines of output of a task submitted with `capture`.
+
+        :param taskid: A string containing the task identifier.
+        :param n: The number of lines to return.
+        :param stream: Either "stdout" or "stderr".
+        :returns: A list of up to `n` lines, oldest first, which is empty
+            if the task has not started.
+        :raises ValueError: Raised when the task does not capture output or
+            `stream` is unknown.
+        """
+        if stream not in ("stdout", "stderr"):
+            raise ValueError(f"Unknown output stream '{stream}'.")
+
+        future = self._statuses[taskid]
+        capture = future.record.capture
+        if capture is None:
+            if not future.record.capture_lines:
+                raise ValueError(f"Task '{taskid}' does not capture output.")
+            return []
+        return capture.tail(stream == "stderr", n)
+
     def get_all_status(self):
         """
         Get the status of a all tasks.
@@ -36,7 +36,7 @@ setup(
         "jsonschema",
         "typing-extensions; python_version < '3.8'",
     ],
-    extras_require={},
+    extras_require={"matrix": ["numpy"]},
     long_description=load_readme(),
     long_description_content_type="text/markdown",
     download_url="https://pypi.org/project/pyaestro/",
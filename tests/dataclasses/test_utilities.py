@@ -0,0 +1,68 @@
+from threading import Event, Thread
+
+import pytest
+
+from pyaestro.dataclasses.utilities import MultiRdrWtrDict
+
+
+def test_update_while_reading():
+    statuses = MultiRdrWtrDict()
+    statuses.update(seed=0)
+    stop = Event()
+    reads = []
+
+    def read():
+        count = 0
+        while not stop.is_set():
+            count += statuses["seed"] == 0
+        reads.append(count)
+
+    def write():
+        for batch in range(200):
+            statuses.update({(batch, i): i for i in range(10)})
+            statuses[batch] = batch
+
+    readers = [Thread(target=read, daemon=True) for _ in range(4)]
+    writer = Thread(target=write, daemon=True)
+    for thread in readers + [writer]:
+        thread.start()
+    writer.join(30)
+    stop.set()
+    for thread in readers:
+        thread.join(30)
+
+    assert not any(thread.is_alive() for thread in readers + [writer])
+    assert len(reads) == len(readers) and all(reads)
+    assert len(statuses) == 1 + 200 * 11
+    assert statuses[(199, 9)] == 9 and statuses[199] == 199
+    assert (statuses._readers, statuses._writers) == (0, 0)
+    assert not statuses._w_wait
+
+    # A failed lookup releases the read lock.
+    with pytest.raises(KeyError):
+        statuses["missing"]
+    statuses["missing"] = 1
+    assert statuses["missing"] == 1
+
+
+def test_values_while_writing():
+    statuses = MultiRdrWtrDict()
+    statuses.update({i: i for i in range(100)})
+    done = Event()
+
+    def write():
+        for i in range(100, 5000):
+            statuses[i] = i
+        done.set()
+
+    writer = Thread(target=write, daemon=True)
+    writer.start()
+    while not done.is_set():
+        values = statuses.values()
+        assert values[:100] == list(range(100))
+        assert [key for key, _ in statuses.items()][:100] == values[:100]
+    writer.join(30)
+
+    assert not writer.is_alive()
+    assert statuses.values() == list(range(5000))
+    assert (statuses._readers, statuses._writers) == (0, 0)
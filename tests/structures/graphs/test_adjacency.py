@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from itertools import product
 from math import ceil
 from random import randint, shuffle
@@ -13,6 +16,10 @@ from pyaestro.structures.graphs import (
     AdjacencyGraph,
     BidirectionalAdjGraph,
 )
+from pyaestro.structures.graphs.algorithms import (
+    BreadthFirstSearch,
+    Predecessors,
+)
 from tests.helpers.utils import generate_unique_lower_names
 
 GRAPHS = (AdjacencyGraph, BidirectionalAdjGraph)
@@ -1030,3 +1037,645 @@ class TestAcyclicGraph:
         """
         with pytest.raises(RuntimeError):
             AcyclicAdjGraph.from_specification(valid_cyclic_specification)
+
+
+@pytest.mark.parametrize("graph_type", GRAPHS)
+@pytest.mark.parametrize("weight_index", [True, False])
+class TestWeightOrderedNeighbors:
+    def test_ordered_neighbors(
+        self,
+        graph_type: Type[Graph],
+        weight_index: bool,
+        sized_node_list: List[str],
+    ) -> None:
+        """Tests that neighbors are reported lightest first under mutation.
+
+        Passing condition is that the ordered neighbors of every vertex match
+        a sorted copy of its neighbors after edges are added, re-weighted and
+        removed.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            weight_index (bool): Enable/Disable the weight index.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = graph_type(weight_index=weight_index)
+        for node in sized_node_list:
+            graph[node] = None
+
+        for node in sized_node_list:
+            for neighbor in sized_node_list:
+                graph.add_edge(node, neighbor, randint(0, 10))
+
+        # Re-weight and remove a subset of the edges.
+        for i, node in enumerate(sized_node_list):
+            graph.add_edge(node, sized_node_list[-1], randint(0, 10))
+            if i % 2:
+                graph.remove_edge(node, sized_node_list[0])
+
+        for node in sized_node_list:
+            expected = sorted(edge.value for edge in graph.get_neighbors(node))
+            ordered = graph.get_ordered_neighbors(node)
+            assert [edge.value for edge in ordered] == expected
+            assert len(ordered) == len(expected)
+
+            top = graph.get_ordered_neighbors(node, 2)
+            assert [edge.value for edge in top] == expected[:2]
+
+            lightest = graph.get_min_neighbor(node)
+            if expected:
+                assert lightest.value == expected[0]
+            else:
+                assert lightest is None
+
+    def test_ordered_neighbors_cleared(
+        self,
+        graph_type: Type[Graph],
+        weight_index: bool,
+        sized_node_list: List[str],
+    ) -> None:
+        """Tests that deleting a vertex's edges empties its ordering.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            weight_index (bool): Enable/Disable the weight index.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = graph_type(weight_index=weight_index)
+        for node in sized_node_list:
+            graph[node] = None
+            graph.add_edge(sized_node_list[0], node, randint(0, 10))
+
+        graph.delete_edges(sized_node_list[0])
+        assert graph.get_min_neighbor(sized_node_list[0]) is None
+
+        with pytest.raises(KeyError) as excinfo:
+            graph.get_ordered_neighbors("missing")
+        assert "not found in graph" in str(excinfo)
+
+
+class TestAcyclicFingerprints:
+    @pytest.fixture
+    def tree(self, sized_node_list: List[str]) -> AcyclicAdjGraph:
+        """Creates a binary tree where each vertex's value is its index.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+
+        Returns:
+            AcyclicAdjGraph: A tree rooted at the first node.
+        """
+        g = AcyclicAdjGraph()
+        for i, node in enumerate(sized_node_list):
+            g[node] = {"index": i}
+            if i > 0:
+                g.add_edge(sized_node_list[(i - 1) // 2], node)
+
+        return g
+
+    def test_stable(self, sized_node_list: List[str]) -> None:
+        """Tests that equal graphs built in different orders hash equally.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        a, b = AcyclicAdjGraph(), AcyclicAdjGraph()
+        for node in sized_node_list:
+            a[node] = {"name": node, "args": [1, 2]}
+        for node in reversed(sized_node_list):
+            b[node] = {"args": [1, 2], "name": node}
+
+        for i in range(1, len(sized_node_list)):
+            a.add_edge(sized_node_list[0], sized_node_list[i])
+        for i in reversed(range(1, len(sized_node_list))):
+            b.add_edge(sized_node_list[0], sized_node_list[i])
+
+        assert dict(a.get_fingerprints()) == dict(b.get_fingerprints())
+
+    def test_canonical_encoding(self) -> None:
+        """Tests that sets and mixed-type keys encode deterministically."""
+        code = (
+            "from pyaestro.structures.graphs import AcyclicAdjGraph\n"
+            "g = AcyclicAdjGraph()\n"
+            "g['A'] = {'x', 'y', 'z', ('t', 1)}\n"
+            "g['B'] = {1: 'a', 'b': 2, (3, 4): frozenset({'p', 'q'})}\n"
+            "print(g.get_fingerprint('A'), g.get_fingerprint('B'))\n"
+        )
+        outputs = set()
+        for seed in ("1", "2", "3"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            outputs.add(
+                subprocess.run(
+                    [sys.executable, "-c", code],
+                    env=env,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            )
+        assert len(outputs) == 1
+
+        encode = AcyclicAdjGraph.encode_vertex
+        assert encode({1: "a", "b": 2}) == encode({"b": 2, 1: "a"})
+        assert encode({1: "a"}) != encode({"1": "a"})
+        assert encode(set()) != encode({})
+        assert encode([True]) != encode([1])
+
+    def test_incremental_refresh(
+        self,
+        tree: AcyclicAdjGraph,
+        sized_node_list: List[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Tests that refreshes use the predecessor index, not a rebuild.
+
+        Passing condition is that fingerprints after deletions, re-added
+        vertices and rolled back edges match a graph built from scratch.
+
+        Args:
+            tree (AcyclicAdjGraph): A tree of indexed vertices.
+            sized_node_list (List[str]): A list of unique node names.
+            monkeypatch (pytest.MonkeyPatch): Fixture to patch attributes.
+        """
+        tree.get_fingerprints()
+        monkeypatch.setattr(
+            Predecessors,
+            "get_predecessors",
+            classmethod(lambda cls, graph: pytest.fail("Full rebuild.")),
+        )
+
+        middle = sized_node_list[len(sized_node_list) // 2]
+        value = tree[middle]
+        del tree[middle]
+        tree.get_fingerprints()
+        tree[middle] = value
+        with pytest.raises(RuntimeError):
+            with tree.transaction():
+                tree.add_edge(sized_node_list[-1], sized_node_list[0])
+                raise RuntimeError("Roll back.")
+
+        rebuilt = AcyclicAdjGraph()
+        for node in tree:
+            rebuilt[node] = tree[node]
+        for edge in tree.edges():
+            if edge.destination in tree:
+                rebuilt.add_edge(edge.source, edge.destination)
+        monkeypatch.undo()
+        assert dict(tree.get_fingerprints()) == dict(
+            rebuilt.get_fingerprints()
+        )
+
+    def test_unsupported_value(self) -> None:
+        """Tests that values without a stable encoding are refused."""
+        g = AcyclicAdjGraph()
+        g["A"] = object()
+        with pytest.raises(TypeError):
+            g.get_fingerprints()
+        with pytest.raises(TypeError):
+            AcyclicAdjGraph.encode_vertex({"key": object()})
+
+    def test_downstream_update(
+        self, tree: AcyclicAdjGraph, sized_node_list: List[str]
+    ) -> None:
+        """Tests that only descendants of a changed vertex are rehashed.
+
+        Passing condition is that changing a vertex changes exactly the
+        fingerprints of that vertex and its descendants, and reverting the
+        change restores the original fingerprints.
+
+        Args:
+            tree (AcyclicAdjGraph): A tree of indexed vertices.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        before = dict(tree.get_fingerprints())
+        changed = sized_node_list[len(sized_node_list) // 2]
+        search = BreadthFirstSearch.search(tree, changed)
+        descendants = {node for node, _ in search}
+
+        value = tree[changed]
+        tree[changed] = {"index": -1}
+        after = tree.get_fingerprints()
+        for node in sized_node_list:
+            if node in descendants:
+                assert after[node] != before[node]
+            else:
+                assert after[node] == before[node]
+
+        tree[changed] = value
+        assert dict(tree.get_fingerprints()) == before
+
+    def test_edge_update(
+        self, tree: AcyclicAdjGraph, sized_node_list: List[str]
+    ) -> None:
+        """Tests that edge changes update the destination's fingerprint.
+
+        Args:
+            tree (AcyclicAdjGraph): A tree of indexed vertices.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        if len(sized_node_list) < 2:
+            pytest.skip("Requires at least one edge.")
+
+        node = sized_node_list[-1]
+        parent = sized_node_list[(len(sized_node_list) - 2) // 2]
+        before = tree.get_fingerprint(node)
+
+        tree.remove_edge(parent, node)
+        detached = tree.get_fingerprint(node)
+        assert detached != before
+
+        tree.add_edge(parent, node)
+        assert tree.get_fingerprint(node) == before
+
+        tree.delete_edges(parent)
+        assert tree.get_fingerprint(node) == detached
+
+        del tree[parent]
+        assert parent not in tree.get_fingerprints()
+        with pytest.raises(KeyError):
+            tree.get_fingerprint(parent)
+
+
+@pytest.mark.parametrize(
+    "graph_type", (AcyclicAdjGraph, AdjacencyGraph, BidirectionalAdjGraph)
+)
+class TestTransactions:
+    @staticmethod
+    def snapshot(graph: Graph) -> Dict:
+        """Capture the vertices and edges of a graph for comparison.
+
+        Args:
+            graph (Graph): The graph to capture.
+
+        Returns:
+            Dict: The vertex values and the set of edges of the graph.
+        """
+        return {
+            "vertices": {key: graph[key] for key in graph},
+            "edges": {
+                (e.source, e.destination, e.value) for e in graph.edges()
+            },
+        }
+
+    def test_rollback(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests that an exception undoes every mutation in a transaction.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = graph_type(weight_index=True)
+        for i, node in enumerate(sized_node_list):
+            graph[node] = i
+            if i > 0:
+                graph.add_edge(sized_node_list[i - 1], node, i)
+
+        before = self.snapshot(graph)
+        first, last = sized_node_list[0], sized_node_list[-1]
+        with pytest.raises(ValueError):
+            with graph.transaction():
+                graph[first] = "changed"
+                graph["new"] = None
+                graph.add_edge(first, "new", 5)
+                if len(sized_node_list) > 1:
+                    graph.remove_edge(first, sized_node_list[1])
+                    graph.add_edge(first, last, 7)
+                graph.delete_edges(last)
+                del graph[last]
+                raise ValueError("Abort")
+
+        assert self.snapshot(graph) == before
+        for node in graph:
+            ordered = graph.get_ordered_neighbors(node)
+            assert ordered == sorted(graph.get_neighbors(node))
+
+    def test_commit_and_nesting(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests that inner rollbacks keep the outer transaction's changes.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = graph_type()
+        with graph.transaction():
+            for node in sized_node_list:
+                graph[node] = None
+
+            committed = self.snapshot(graph)
+            try:
+                with graph.transaction():
+                    graph["inner"] = None
+                    raise RuntimeError("Abort inner")
+            except RuntimeError:
+                pass
+
+            assert self.snapshot(graph) == committed
+
+        assert graph._undo_log is None
+        assert sorted(graph) == sorted(sized_node_list)
+
+
+class TestAcyclicRollback:
+    def test_cycle_leaves_graph_intact(
+        self, sized_node_list: List[str]
+    ) -> None:
+        """Tests that a rejected edge is not left behind in the graph.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        g = AcyclicAdjGraph()
+        for i, node in enumerate(sized_node_list):
+            g[node] = i
+            if i > 0:
+                g.add_edge(sized_node_list[i - 1], node, i)
+
+        edges = sorted(g.edges())
+        fingerprints = dict(g.get_fingerprints())
+        with pytest.raises(RuntimeError):
+            g.add_edge(sized_node_list[-1], sized_node_list[0])
+
+        assert sorted(g.edges()) == edges
+        assert dict(g.get_fingerprints()) == fingerprints
+
+
+@pytest.mark.parametrize(
+    "graph_type", (AcyclicAdjGraph, AdjacencyGraph, BidirectionalAdjGraph)
+)
+class TestMerge:
+    @staticmethod
+    def template(graph_type: Type[Graph], nodes: List[str]) -> Graph:
+        """Creates a weighted chain of nodes.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to create.
+            nodes (List[str]): Names of the nodes in the chain.
+
+        Returns:
+            Graph: A chain where each node is valued by its position.
+        """
+        graph = graph_type(weight_index=True)
+        for i, node in enumerate(nodes):
+            graph[node] = i
+            if i > 0:
+                graph.add_edge(nodes[i - 1], node, i)
+        return graph
+
+    def test_prefixes(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests merging namespaced copies of a template.
+
+        Passing condition is that the merge matches adding each vertex and
+        edge one at a time.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        template = self.template(graph_type, sized_node_list)
+        merged = graph_type(weight_index=True)
+        merged.merge(template, template, key_remap=["a.", "b."])
+
+        expected = graph_type()
+        for prefix in ("a.", "b."):
+            for node in template:
+                expected[f"{prefix}{node}"] = template[node]
+            for edge in template.edges():
+                expected.add_edge(
+                    f"{prefix}{edge.source}",
+                    f"{prefix}{edge.destination}",
+                    edge.value,
+                )
+
+        assert TestTransactions.snapshot(merged) == (
+            TestTransactions.snapshot(expected)
+        )
+        for node in merged:
+            ordered = merged.get_ordered_neighbors(node)
+            assert ordered == sorted(merged.get_neighbors(node))
+
+    def test_union(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests that shared keys are unified and edges are unioned.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        chain = self.template(graph_type, sized_node_list)
+        other = AdjacencyGraph()
+        other[sized_node_list[0]] = "first"
+        other["extra"] = None
+        other.add_edge(sized_node_list[0], "extra", 9)
+
+        graph = graph_type()
+        graph.merge(chain, other)
+        assert len(graph) == len(sized_node_list) + 1
+        assert graph[sized_node_list[0]] == "first"
+        assert (sized_node_list[0], "extra", 9) in {
+            (e.source, e.destination, e.value) for e in graph.edges()
+        }
+        assert len(list(graph.edges())) == len(list(chain.edges())) + (
+            2 if graph_type is BidirectionalAdjGraph else 1
+        )
+
+        renamed = graph_type()
+        renamed.merge(other, key_remap=lambda i, key: (i, key))
+        assert sorted(renamed) == [(0, sized_node_list[0]), (0, "extra")]
+
+        with pytest.raises(ValueError):
+            graph.merge(chain, other, key_remap=["a."])
+
+    def test_rollback(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests that a merge is undone as a whole by a transaction.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = self.template(graph_type, sized_node_list)
+        before = TestTransactions.snapshot(graph)
+        first = sized_node_list[0]
+        other = self.template(AdjacencyGraph, sized_node_list)
+        other[first] = "changed"
+        other["extra"] = None
+        other.add_edge(first, "extra", 5)
+        if len(sized_node_list) > 1:
+            other.add_edge(first, sized_node_list[1], 99)
+
+        with pytest.raises(ValueError):
+            with graph.transaction():
+                graph.merge(other)
+                raise ValueError("Abort")
+
+        assert TestTransactions.snapshot(graph) == before
+        for node in graph:
+            ordered = graph.get_ordered_neighbors(node)
+            assert ordered == sorted(graph.get_neighbors(node))
+
+
+class TestAcyclicMerge:
+    def test_cycle_rejected(self, sized_node_list: List[str]) -> None:
+        """Tests that a merge closing a cycle leaves the graph unchanged.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = TestMerge.template(AcyclicAdjGraph, sized_node_list)
+        fingerprints = dict(graph.get_fingerprints())
+        before = TestTransactions.snapshot(graph)
+
+        back = AdjacencyGraph()
+        back[sized_node_list[-1]] = len(sized_node_list) - 1
+        back[sized_node_list[0]] = 0
+        back.add_edge(sized_node_list[-1], sized_node_list[0])
+        with pytest.raises(RuntimeError):
+            graph.merge(back)
+
+        assert TestTransactions.snapshot(graph) == before
+        assert dict(graph.get_fingerprints()) == fingerprints
+
+    def test_fingerprints(self, sized_node_list: List[str]) -> None:
+        """Tests that merged copies are fingerprinted like the original.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        template = TestMerge.template(AcyclicAdjGraph, sized_node_list)
+        graph = AcyclicAdjGraph()
+        graph.merge(template, key_remap=["copy."])
+        for node, fingerprint in template.get_fingerprints().items():
+            assert graph.get_fingerprint(f"copy.{node}") == fingerprint
+
+
+class TestSingleCopyStorage:
+    @staticmethod
+    def neighbors(graph: Graph) -> Dict:
+        """Collect the neighbors of every vertex of a graph.
+
+        Args:
+            graph (Graph): The graph to inspect.
+
+        Returns:
+            Dict: A mapping of each vertex to its set of (neighbor, weight).
+        """
+        return {
+            key: {(e.destination, e.value) for e in graph.get_neighbors(key)}
+            for key in graph
+        }
+
+    @pytest.fixture
+    def graphs(self, sized_node_list: List[str]) -> List[Graph]:
+        """Creates the same random graph with both storage modes.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+
+        Returns:
+            List[Graph]: A double copy graph followed by a single copy graph.
+        """
+        graphs = [
+            BidirectionalAdjGraph(),
+            BidirectionalAdjGraph(single_copy=True),
+        ]
+        edges = [
+            (node, other, randint(0, 10))
+            for node in sized_node_list
+            for other in sized_node_list
+            if randint(0, 2) == 0
+        ]
+        for graph in graphs:
+            for node in sized_node_list:
+                graph[node] = None
+            for a, b, weight in edges:
+                graph.add_edge(a, b, weight)
+        return graphs
+
+    def test_equivalent(self, graphs: List[Graph]) -> None:
+        """Tests that both modes report the same neighbors.
+
+        Passing condition is that each undirected edge is enumerated once in
+        single copy mode, and twice (once per end) otherwise.
+
+        Args:
+            graphs (List[Graph]): Graphs with double and single copy storage.
+        """
+        double, single = graphs
+        assert single.single_copy and not double.single_copy
+        assert self.neighbors(single) == self.neighbors(double)
+
+        pairs = {frozenset((e.source, e.destination)) for e in double.edges()}
+        assert len(list(single.edges())) == len(pairs)
+        loops = sum(1 for e in double.edges() if e.source == e.destination)
+        assert len(list(double.edges())) == 2 * len(pairs) - loops
+
+    def test_mutations(
+        self, graphs: List[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests that removals keep both modes equivalent.
+
+        Args:
+            graphs (List[Graph]): Graphs with double and single copy storage.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        double, single = graphs
+        first, last = sized_node_list[0], sized_node_list[-1]
+        for graph in graphs:
+            graph.add_edge(last, first, 42)
+            graph.remove_edge(first, last)
+            with pytest.raises(KeyError):
+                graph.remove_edge(last, first)
+        assert self.neighbors(single) == self.neighbors(double)
+
+        single.delete_edges(first)
+        assert list(single.get_neighbors(first)) == []
+        for node in single:
+            assert first not in {
+                e.destination for e in single.get_neighbors(node)
+            }
+
+        if len(sized_node_list) > 1:
+            del single[last]
+            for edge in single.edges():
+                assert last not in (edge.source, edge.destination)
+
+        with pytest.raises(KeyError):
+            single.add_edge(first, "missing")
+
+    def test_rollback_and_merge(self, graphs: List[Graph]) -> None:
+        """Tests transactions and merges with single copy storage.
+
+        Args:
+            graphs (List[Graph]): Graphs with double and single copy storage.
+        """
+        double, single = graphs
+        before = self.neighbors(single)
+        with pytest.raises(ValueError):
+            with single.transaction():
+                for node in list(single):
+                    del single[node]
+                raise ValueError("Abort")
+        assert self.neighbors(single) == before
+
+        for source in graphs:
+            merged = BidirectionalAdjGraph(single_copy=True)
+            merged.merge(source, source)
+            assert self.neighbors(merged) == before
+            assert len(list(merged.edges())) == len(list(single.edges()))
+
+        directed = AdjacencyGraph()
+        directed.merge(single)
+        assert self.neighbors(directed) == before
+
+    def test_weight_index_rejected(self) -> None:
+        """Tests that single copy storage refuses a weight index."""
+        with pytest.raises(ValueError):
+            BidirectionalAdjGraph(weight_index=True, single_copy=True)
@@ -5,7 +5,11 @@ from typing import List, Type
 from pyaestro.abstracts.graphs import Graph
 from pyaestro.structures.graphs.algorithms import (
     BreadthFirstSearch,
+    DefaultCycleCheck,
     DepthFirstSearch,
+    Reachability,
+    TopologicalSort,
+    Traversal,
 )
 from pyaestro.structures.graphs import (
     AcyclicAdjGraph,
@@ -151,4 +155,256 @@ class TestBreadthFirstSearch:
             assert node[1] == path[i][1]
             result.append(node)
 
-        assert len(result) == len(path)
\ No newline at end of file
+        assert len(result) == len(path)
+
+
+@pytest.mark.parametrize("graph_type", GRAPHS)
+class TestMemoizedAlgorithms:
+    def test_version_bumps(self, graph_type: Type[Graph]) -> None:
+        """Tests that every mutating method increments the graph version.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        g = graph_type()
+        versions = [g.version]
+
+        g["A"] = None
+        versions.append(g.version)
+        g["B"] = None
+        versions.append(g.version)
+        g.add_edge("A", "B")
+        versions.append(g.version)
+        g.remove_edge("A", "B")
+        versions.append(g.version)
+        g.delete_edges("A")
+        versions.append(g.version)
+        del g["B"]
+        versions.append(g.version)
+
+        assert versions == sorted(set(versions))
+
+    def test_cached_until_mutation(
+        self, sized_node_list: List[str], graph_type: Type[Graph]
+    ) -> None:
+        """Tests that results are reused until the graph is mutated.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        g = graph_type()
+        for i, node in enumerate(sized_node_list):
+            g[node] = None
+            if i > 0:
+                g.add_edge(sized_node_list[i - 1], node)
+
+        source = sized_node_list[0]
+        ordering = BreadthFirstSearch.ordering(g, source)
+        assert ordering == tuple(BreadthFirstSearch.search(g, source))
+        assert BreadthFirstSearch.ordering(g, source) is ordering
+        assert DepthFirstSearch.ordering(g, source) is not ordering
+        assert Reachability.reachable(g, source) == set(sized_node_list)
+
+        g["extra"] = None
+        g.add_edge(source, "extra")
+        assert BreadthFirstSearch.ordering(g, source) is not ordering
+        assert "extra" in Reachability.reachable(g, source)
+
+    def test_memoize_compute_count(self, graph_type: Type[Graph]) -> None:
+        """Tests that a memoized computation only runs once per version.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        g = graph_type()
+        calls = []
+
+        def compute():
+            calls.append(g.version)
+            return len(calls)
+
+        assert g.memoize("key", compute) == 1
+        assert g.memoize("key", compute) == 1
+        g["A"] = None
+        assert g.memoize("key", compute) == 2
+        assert calls == [0, g.version]
+
+    def test_memoize_none(self, graph_type: Type[Graph]) -> None:
+        """Tests that a computation returning None is cached.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        g = graph_type()
+        calls = []
+
+        def compute():
+            calls.append(g.version)
+
+        assert g.memoize("key", compute) is None
+        assert g.memoize("key", compute) is None
+        assert calls == [0]
+
+
+class TestTopologicalSort:
+    def test_tree_sort(self, sized_node_list: List[str]) -> None:
+        """Tests that every vertex is ordered before its neighbors.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        g = AcyclicAdjGraph()
+        for node in sized_node_list:
+            g[node] = None
+
+        for i in range(1, len(sized_node_list)):
+            parent = int((i - 1) / 2)
+            g.add_edge(sized_node_list[parent], sized_node_list[i])
+
+        order = TopologicalSort.sort(g)
+        position = {node: i for i, node in enumerate(order)}
+
+        assert sorted(order) == sorted(sized_node_list)
+        for node in g:
+            for edge in g.get_neighbors(node):
+                assert position[node] < position[edge.destination]
+
+    def test_cycle(self) -> None:
+        """Tests that sorting a cyclic graph raises an exception."""
+        g = AdjacencyGraph()
+        g["A"] = None
+        g["B"] = None
+        g.add_edge("A", "B")
+        g.add_edge("B", "A")
+
+        assert DefaultCycleCheck.detect_cycles(g)
+        with pytest.raises(RuntimeError):
+            TopologicalSort.sort(g)
+
+        g.remove_edge("B", "A")
+        assert not DefaultCycleCheck.detect_cycles(g)
+        assert TopologicalSort.sort(g) == ("A", "B")
+
+
+@pytest.mark.parametrize("graph_type", GRAPHS)
+class TestTraversal:
+    @pytest.fixture
+    def tree(
+        self, sized_node_list: List[str], graph_type: Type[Graph]
+    ) -> Graph:
+        """Creates a binary tree where each vertex's value is its depth.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+            graph_type (Type[Graph]): A Graph class name to test.
+
+        Returns:
+            Graph: A tree-structured graph rooted at the first node.
+        """
+        g = graph_type()
+        g[sized_node_list[0]] = 0
+        for i in range(1, len(sized_node_list)):
+            g[sized_node_list[i]] = floor(log2(i + 1))
+            parent = int((i - 1) / 2)
+            g.add_edge(sized_node_list[parent], sized_node_list[i])
+
+        return g
+
+    @pytest.mark.parametrize(
+        "depth_first, search",
+        [(False, BreadthFirstSearch), (True, DepthFirstSearch)],
+    )
+    def test_default_order(
+        self, tree: Graph, sized_node_list: List[str], depth_first, search
+    ) -> None:
+        """Tests that an unconstrained traversal matches the plain searches.
+
+        Args:
+            tree (Graph): A tree-structured graph.
+            sized_node_list (List[str]): A list of unique node names.
+            depth_first (bool): Traverse depth-first.
+            search (GraphSearchProtocol): The equivalent plain search.
+        """
+        traversal = Traversal(tree, depth_first=depth_first)
+        source = sized_node_list[0]
+        expected = list(search.search(tree, source))
+
+        assert list(traversal.search(source)) == expected
+        # Reusing the traversal yields the same result.
+        assert list(traversal.search(source)) == expected
+
+    def test_max_depth(self, tree: Graph, sized_node_list: List[str]) -> None:
+        """Tests that vertices deeper than the maximum depth are skipped.
+
+        Args:
+            tree (Graph): A tree-structured graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        traversal = Traversal(tree)
+        source = sized_node_list[0]
+        visited = [n for n, _ in traversal.search(source, max_depth=1)]
+
+        assert all(tree[node] <= 1 for node in visited)
+        assert len(visited) == min(3, len(sized_node_list))
+
+    def test_prune_goal_limit(
+        self, tree: Graph, sized_node_list: List[str]
+    ) -> None:
+        """Tests pruning, goal termination and result limits.
+
+        Args:
+            tree (Graph): A tree-structured graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        traversal = Traversal(tree)
+        source = sized_node_list[0]
+        last = sized_node_list[-1]
+
+        pruned = [
+            n for n, _ in traversal.search(source, prune=lambda n: n == last)
+        ]
+        # The last node is always a leaf, so only it is removed.
+        assert sorted(pruned) == sorted(set(sized_node_list) - {last})
+
+        visited = [
+            n for n, _ in traversal.search(source, goal=lambda n: n == last)
+        ]
+        assert visited[-1] == last
+
+        limited = list(traversal.search(source, limit=2))
+        assert len(limited) == min(2, len(sized_node_list))
+
+    def test_reverse(self, tree: Graph, sized_node_list: List[str]) -> None:
+        """Tests that a reversed traversal walks back to the root.
+
+        Args:
+            tree (Graph): A tree-structured graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        if isinstance(tree, BidirectionalAdjGraph):
+            pytest.skip("Reversal is symmetric for bidirectional graphs.")
+
+        traversal = Traversal(tree, reverse=True)
+        visited = [n for n, _ in traversal.search(sized_node_list[-1])]
+
+        assert visited[-1] == sized_node_list[0]
+        assert len(visited) == tree[sized_node_list[-1]] + 1
+
+    def test_restart(self, tree: Graph, sized_node_list: List[str]) -> None:
+        """Tests that overlapping searches on one traversal are rejected.
+
+        Args:
+            tree (Graph): A tree-structured graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        traversal = Traversal(tree)
+        first = traversal.search(sized_node_list[0])
+        next(first)
+        list(traversal.search(sized_node_list[0]))
+
+        with pytest.raises(RuntimeError):
+            next(first)
+
+        with pytest.raises(KeyError):
+            list(traversal.search("missing"))
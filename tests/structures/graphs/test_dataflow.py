@@ -0,0 +1,160 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from random import randint
+from typing import Dict, Hashable, List
+
+import pytest
+
+from pyaestro.structures.graphs import AcyclicAdjGraph
+from pyaestro.structures.graphs.algorithms import DefaultCycleCheck
+from pyaestro.structures.graphs.dataflow import DataflowEvaluator
+
+
+def total(key: Hashable, value: int, inputs: Dict[Hashable, int]) -> int:
+    """Sum the value of a vertex with the results of its predecessors."""
+    return value + sum(inputs.values())
+
+
+def random_dag(nodes: List[str]) -> AcyclicAdjGraph:
+    """Create a random acyclic graph whose vertices hold small integers.
+
+    Args:
+        nodes (List[str]): Names of the vertices.
+
+    Returns:
+        AcyclicAdjGraph: A graph with edges only from earlier to later nodes.
+    """
+    graph = AcyclicAdjGraph(DefaultCycleCheck)
+    for i, node in enumerate(nodes):
+        graph[node] = i
+    for start, src in enumerate(nodes, start=1):
+        for dest in nodes[start:]:
+            if randint(0, 2) == 0:
+                graph.add_edge(src, dest)
+    return graph
+
+
+def serial_totals(graph: AcyclicAdjGraph) -> Dict[Hashable, int]:
+    """Evaluate 'total' one vertex at a time in insertion order."""
+    results = {}
+    for node in graph:
+        inputs = {
+            src: results[src]
+            for src in graph
+            if node in {e.destination for e in graph.get_neighbors(src)}
+        }
+        results[node] = total(node, graph[node], inputs)
+    return results
+
+
+class TestDataflowEvaluator:
+    def test_evaluate(self, sized_node_list: List[str]) -> None:
+        """Tests that results match a serial evaluation.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = random_dag(sized_node_list)
+        expected = serial_totals(graph)
+        assert DataflowEvaluator(total).evaluate(graph) == expected
+        evaluator = DataflowEvaluator(total, max_in_flight=1)
+        assert evaluator.evaluate(graph) == expected
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            evaluator = DataflowEvaluator(total, executor=executor)
+            assert evaluator.evaluate(graph) == expected
+
+    def test_parallel_branches(self) -> None:
+        """Tests that independent branches run at the same time."""
+        graph = AcyclicAdjGraph(DefaultCycleCheck)
+        for node in ("root", "left", "right", "join"):
+            graph[node] = 1
+        graph.add_edge("root", "left")
+        graph.add_edge("root", "right")
+        graph.add_edge("left", "join")
+        graph.add_edge("right", "join")
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def branch(key, value, inputs):
+            if key in ("left", "right"):
+                barrier.wait()
+            return total(key, value, inputs)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = DataflowEvaluator(branch, executor).evaluate(graph)
+        assert results["join"] == 5
+
+    def test_max_in_flight(self, sized_node_list: List[str]) -> None:
+        """Tests that no more than 'max_in_flight' vertices run at once.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = AcyclicAdjGraph(DefaultCycleCheck)
+        for node in sized_node_list:
+            graph[node] = 0
+
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def count(key, value, inputs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.001)
+            with lock:
+                running[0] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            DataflowEvaluator(count, executor, max_in_flight=2).evaluate(graph)
+        assert peak[0] <= 2
+
+        with pytest.raises(ValueError):
+            DataflowEvaluator(count, max_in_flight=0)
+
+    def test_cache(self, sized_node_list: List[str]) -> None:
+        """Tests that cached results are reused until upstream changes.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        graph = random_dag(sized_node_list)
+        calls = []
+
+        def tracked(key, value, inputs):
+            calls.append(key)
+            return total(key, value, inputs)
+
+        evaluator = DataflowEvaluator(tracked, cache={})
+        evaluator.evaluate(graph)
+        assert sorted(calls) == sorted(sized_node_list)
+
+        calls.clear()
+        assert evaluator.evaluate(graph) == serial_totals(graph)
+        assert calls == []
+
+        last = sized_node_list[-1]
+        graph[last] = -1
+        assert evaluator.evaluate(graph) == serial_totals(graph)
+        assert calls == [last]
+
+    def test_errors(self) -> None:
+        """Tests that a failing vertex stops the evaluation."""
+        graph = AcyclicAdjGraph(DefaultCycleCheck)
+        graph["A"] = 0
+        graph["B"] = 0
+        graph.add_edge("A", "B")
+        calls = []
+
+        def fail(key, value, inputs):
+            calls.append(key)
+            raise ValueError(key)
+
+        with pytest.raises(ValueError):
+            DataflowEvaluator(fail).evaluate(graph)
+        assert calls == ["A"]
+
+        # The graph is writable again once evaluation ends.
+        graph["C"] = 0
@@ -0,0 +1,308 @@
+from random import choice, randint, seed
+from typing import List, Type
+
+import pytest
+
+from pyaestro.abstracts.graphs import Graph
+from pyaestro.dataclasses import GraphEvent, GraphEventType
+from pyaestro.structures.graphs import (
+    AcyclicAdjGraph,
+    AdjacencyGraph,
+    BidirectionalAdjGraph,
+    MultiGraph,
+)
+from pyaestro.structures.constants import EdgeProperty
+from pyaestro.structures.graphs.utils import GraphEventLog
+
+GRAPHS = (AcyclicAdjGraph, AdjacencyGraph, BidirectionalAdjGraph)
+
+
+def snapshot(graph: Graph) -> dict:
+    """Capture the vertices and edges of a graph for comparison.
+
+    Args:
+        graph (Graph): The graph to capture.
+
+    Returns:
+        dict: The vertex values and the set of edges of the graph.
+    """
+    return {
+        "vertices": {key: graph[key] for key in graph},
+        "edges": {(e.source, e.destination, e.value) for e in graph.edges()},
+    }
+
+
+def mutate(graph: Graph, nodes: List[str], count: int) -> None:
+    """Apply a random sequence of mutations to a graph.
+
+    Args:
+        graph (Graph): The graph to mutate.
+        nodes (List[str]): Vertex names to draw from.
+        count (int): Number of mutations to apply.
+    """
+    for _ in range(count):
+        op = randint(0, 4)
+        a, b = choice(nodes), choice(nodes)
+        try:
+            if op == 0:
+                graph[a] = randint(0, 10)
+            elif op == 1 and a in graph:
+                del graph[a]
+            elif op == 2 and a in graph and b in graph:
+                graph.add_edge(a, b, randint(0, 10))
+            elif op == 3:
+                graph.remove_edge(a, b)
+            elif op == 4 and a in graph:
+                graph.delete_edges(a)
+        except (KeyError, RuntimeError):
+            pass
+
+
+@pytest.mark.parametrize("graph_type", GRAPHS)
+class TestChangeFeed:
+    def test_events(self, graph_type: Type[Graph]) -> None:
+        """Tests that each mutation is reported as it happens.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        graph = graph_type()
+        events = []
+        graph.subscribe(events.extend)
+
+        graph["A"] = 1
+        graph["B"] = 2
+        graph.add_edge("A", "B", 3)
+        graph.remove_edge("A", "B")
+        del graph["B"]
+
+        kinds = [event.kind for event in events]
+        assert kinds[:2] == [GraphEventType.VERTEX_SET] * 2
+        assert GraphEventType.EDGE_SET in kinds
+        assert GraphEventType.EDGE_REMOVED in kinds
+        assert events[-1] == GraphEvent(GraphEventType.VERTEX_DELETED, "B")
+
+        graph.unsubscribe(events.extend)
+        graph["C"] = None
+        assert events[-1].key == "B"
+
+    def test_batch_coalesces(self, graph_type: Type[Graph]) -> None:
+        """Tests that a batch publishes one event per vertex or edge.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        graph = graph_type()
+        batches = []
+        graph.subscribe(batches.append)
+
+        with graph.batch():
+            for value in range(10):
+                graph["A"] = value
+            graph["B"] = None
+            graph.add_edge("A", "B", 1)
+            graph.add_edge("A", "B", 2)
+            assert batches == []
+
+        assert len(batches) == 1
+        events = batches[0]
+        assert events[0] == GraphEvent(GraphEventType.VERTEX_SET, "A", value=9)
+        assert events[2] == GraphEvent(GraphEventType.EDGE_SET, "A", "B", 2)
+
+    def test_replay(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests that replaying a feed rebuilds an identical graph.
+
+        Passing condition is that both the per-mutation feed and a batched,
+        coalesced feed rebuild the graph that produced them.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        seed(len(sized_node_list))
+        graph = graph_type()
+        events, batches = [], []
+        graph.subscribe(events.extend)
+
+        mutate(graph, sized_node_list, 100)
+        with graph.batch():
+            graph.subscribe(batches.append)
+            mutate(graph, sized_node_list, 100)
+
+        replica = graph_type()
+        replica.replay(events)
+        assert snapshot(replica) == snapshot(graph)
+
+        coalesced = graph_type()
+        coalesced.replay(events[: len(events) - sum(map(len, batches))])
+        coalesced.replay(batches[0])
+        assert snapshot(coalesced) == snapshot(graph)
+
+    def test_rollback_events(self, graph_type: Type[Graph]) -> None:
+        """Tests that rolled back mutations are compensated in the feed.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+        """
+        graph = graph_type()
+        graph["A"] = None
+        events = []
+        graph.subscribe(events.extend)
+
+        with pytest.raises(ValueError):
+            with graph.transaction():
+                graph["B"] = None
+                graph.add_edge("A", "B")
+                raise ValueError("Abort")
+
+        replica = graph_type()
+        replica["A"] = None
+        replica.replay(events)
+        assert snapshot(replica) == snapshot(graph)
+
+    def test_log_file(self, graph_type: Type[Graph], tmp_path) -> None:
+        """Tests that a feed written to a log file can be replayed.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            tmp_path (Path): A temporary directory for the log file.
+        """
+        path = str(tmp_path / "graph.log")
+        graph = graph_type()
+        graph.subscribe(GraphEventLog(path))
+
+        with graph.batch():
+            mutate(graph, ["A", "B", "C", "D"], 50)
+        mutate(graph, ["A", "B", "C", "D"], 50)
+
+        replica = graph_type()
+        replica.replay(GraphEventLog.read(path))
+        assert snapshot(replica) == snapshot(graph)
+
+
+class PublicReplayGraph(AdjacencyGraph):
+    """A graph that replays events through the public mutators."""
+
+    _apply_event = Graph._apply_event
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_default_replay(batched: bool, sized_node_list: List[str]) -> None:
+    """Tests replaying a feed through the default event application.
+
+    Args:
+        batched (bool): Whether to make the mutations in a batch.
+        sized_node_list (List[str]): A list of unique node names.
+    """
+    seed(33)
+    graph = AdjacencyGraph()
+    events = []
+    graph.subscribe(events.extend)
+    if batched:
+        with graph.batch():
+            mutate(graph, sized_node_list, 200)
+    else:
+        mutate(graph, sized_node_list, 200)
+
+    replica = PublicReplayGraph()
+    replica.replay(events)
+    assert snapshot(replica) == snapshot(graph)
+
+
+def layered_snapshot(graph: MultiGraph) -> dict:
+    """Capture the vertices and the edges of every layer of a graph.
+
+    Args:
+        graph (MultiGraph): The graph to capture.
+
+    Returns:
+        dict: The vertex values, and the properties and edges of each layer.
+    """
+    layers = {
+        name: (
+            graph.get_layer_properties(name),
+            {(e.source, e.destination, e.value) for e in graph.edges([name])},
+        )
+        for name in graph.layers
+    }
+    return {"vertices": {key: graph[key] for key in graph}, "layers": layers}
+
+
+def mutate_layers(graph: MultiGraph, nodes: List[str], count: int) -> None:
+    """Apply a random sequence of mutations to the layers of a graph.
+
+    Args:
+        graph (MultiGraph): The graph to mutate.
+        nodes (List[str]): Vertex names to draw from.
+        count (int): Number of mutations to apply.
+    """
+    for _ in range(count):
+        op = randint(0, 9)
+        a, b = choice(nodes), choice(nodes)
+        layer = choice(graph.layers)
+        weight = randint(1, 10) if layer == "data" else 0
+        try:
+            if op < 3:
+                graph[a] = randint(0, 10)
+            elif op == 3 and a in graph:
+                del graph[a]
+            elif op == 4:
+                graph.remove_edge(a, b, layer)
+            elif op == 5:
+                graph.delete_edges(a)
+            else:
+                graph.add_edge(a, b, weight, layer=layer)
+        except (KeyError, RuntimeError):
+            pass
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_multigraph_feed(batched: bool, tmp_path) -> None:
+    """Tests that a layered graph can be rebuilt from its change feed.
+
+    Args:
+        batched (bool): Whether to make the mutations in a batch.
+        tmp_path (Path): A temporary directory for the log file.
+    """
+    seed(7)
+    path = str(tmp_path / "graph.log")
+    graph = MultiGraph()
+    events = []
+    graph.subscribe(events.extend)
+    graph.subscribe(GraphEventLog(path))
+
+    graph.add_layer("data", [EdgeProperty.ACYCLIC, EdgeProperty.WEIGHTED])
+    graph.add_layer("control", [EdgeProperty.BIDIRECTION])
+    graph.add_layer("reverse", [EdgeProperty.BACKWARD])
+    nodes = ["A", "B", "C", "D", "E", "F"]
+    for node in nodes:
+        graph[node] = 0
+    if batched:
+        with graph.batch():
+            mutate_layers(graph, nodes, 100)
+    else:
+        mutate_layers(graph, nodes, 100)
+    for node in ("X", "Y", "Z"):
+        graph[node] = 1
+    graph.add_edge("X", "Y", 3, layer="data")
+    graph.add_edge("Y", "Z", layer="reverse")
+    graph.add_edge("Z", "Y", layer="control")
+    graph.add_edge("X", "Z", layer="control")
+    graph.remove_edge("Y", "Z", "control")
+
+    assert GraphEventType.LAYER_ADDED in {event.kind for event in events}
+    for event in events:
+        if event.kind in (
+            GraphEventType.EDGE_SET,
+            GraphEventType.EDGE_REMOVED,
+        ):
+            assert event.layer in graph.layers
+    expected = layered_snapshot(graph)
+    assert all(edges for _, edges in expected["layers"].values())
+
+    for feed in (events, GraphEventLog.read(path)):
+        replica = MultiGraph()
+        replica.replay(feed)
+        assert layered_snapshot(replica) == expected
@@ -0,0 +1,200 @@
+from itertools import product
+from typing import Hashable, Iterator, List
+
+import pytest
+
+from pyaestro.dataclasses import GraphEdge
+from pyaestro.structures.graphs import AdjacencyGraph, ImplicitGraph
+from pyaestro.structures.graphs.algorithms import (
+    BreadthFirstSearch,
+    DepthFirstSearch,
+    TopologicalSort,
+    Traversal,
+)
+
+
+class ParameterSweep:
+    """A lazily enumerated collection of setup steps and their combinations.
+
+    Vertices are ("setup", value) for each value of the first parameter and
+    ("run", *combination) for each combination of all parameters.
+    """
+
+    def __init__(self, parameters: List[List[int]]):
+        self.parameters = parameters
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for value in self.parameters[0]:
+            yield ("setup", value)
+        for combination in product(*self.parameters):
+            yield ("run",) + combination
+
+    def __len__(self) -> int:
+        size = 1
+        for values in self.parameters:
+            size *= len(values)
+        return len(self.parameters[0]) + size
+
+    def __contains__(self, key: Hashable) -> bool:
+        if not isinstance(key, tuple) or not key:
+            return False
+        if key[0] == "setup":
+            return len(key) == 2 and key[1] in self.parameters[0]
+        return (
+            key[0] == "run"
+            and len(key) == len(self.parameters) + 1
+            and all(v in p for v, p in zip(key[1:], self.parameters))
+        )
+
+    def neighbors(self, key: Hashable) -> Iterator[Hashable]:
+        """Each setup step leads to every run that uses its value."""
+        if key[0] != "setup":
+            return
+        for rest in product(*self.parameters[1:]):
+            yield ("run", key[1]) + rest
+
+
+@pytest.fixture
+def sweep(sized_node_list: List[str]) -> ParameterSweep:
+    """Creates a sweep whose size scales with the node list.
+
+    Args:
+        sized_node_list (List[str]): A list of unique node names.
+
+    Returns:
+        ParameterSweep: A sweep over three parameters.
+    """
+    size = len(sized_node_list)
+    return ParameterSweep([list(range(size)), list(range(3)), [0, 1]])
+
+
+def materialize(sweep: ParameterSweep) -> AdjacencyGraph:
+    """Build the sweep as an explicit adjacency graph.
+
+    Args:
+        sweep (ParameterSweep): The sweep to materialize.
+
+    Returns:
+        AdjacencyGraph: A graph with the same vertices and edges.
+    """
+    graph = AdjacencyGraph()
+    for key in sweep:
+        graph[key] = None
+    for key in sweep:
+        for dest in sweep.neighbors(key):
+            graph.add_edge(key, dest)
+    return graph
+
+
+class TestImplicitGraph:
+    def test_interface(self, sweep: ParameterSweep) -> None:
+        """Tests that an implicit graph matches its materialized form.
+
+        Args:
+            sweep (ParameterSweep): A lazily enumerated parameter sweep.
+        """
+        graph = ImplicitGraph(sweep, sweep.neighbors, value=lambda key: key[0])
+        explicit = materialize(sweep)
+
+        assert len(graph) == len(explicit)
+        assert list(graph) == list(explicit)
+        assert sorted(graph.edges()) == sorted(explicit.edges())
+        assert ("setup", 0) in graph
+        assert ("setup", -1) not in graph
+        assert graph[("setup", 0)] == "setup"
+
+        graph[("setup", 0)] = "changed"
+        assert graph[("setup", 0)] == "changed"
+        with pytest.raises(RuntimeError):
+            graph[("setup", -1)] = None
+        with pytest.raises(KeyError):
+            graph[("setup", -1)]
+        with pytest.raises(KeyError):
+            list(graph.get_neighbors(("setup", -1)))
+
+    def test_algorithms(self, sweep: ParameterSweep) -> None:
+        """Tests that searches and sorts match the materialized graph.
+
+        Args:
+            sweep (ParameterSweep): A lazily enumerated parameter sweep.
+        """
+        graph = ImplicitGraph(sweep, sweep.neighbors)
+        explicit = materialize(sweep)
+        source = ("setup", 0)
+
+        for search in (BreadthFirstSearch, DepthFirstSearch):
+            assert list(search.search(graph, source)) == list(
+                search.search(explicit, source)
+            )
+
+        order = TopologicalSort.sort(graph)
+        assert order == TopologicalSort.sort(explicit)
+
+        traversal = Traversal(graph)
+        reached = [node for node, _ in traversal.search(source, max_depth=1)]
+        assert len(reached) == 1 + 3 * 2
+
+    def test_bounded_cache(self, sweep: ParameterSweep) -> None:
+        """Tests that the neighbor cache is bounded and reused.
+
+        Args:
+            sweep (ParameterSweep): A lazily enumerated parameter sweep.
+        """
+        calls = []
+
+        def neighbors(key: Hashable) -> Iterator[Hashable]:
+            calls.append(key)
+            return sweep.neighbors(key)
+
+        graph = ImplicitGraph(sweep, neighbors, cache_size=2)
+        source = ("setup", 0)
+        first = list(graph.get_neighbors(source))
+        assert list(graph.get_neighbors(source)) == first
+        assert calls == [source]
+
+        for key in sweep:
+            list(graph.get_neighbors(key))
+        assert graph.cache_info().currsize == 2
+
+        graph.cache_clear()
+        list(graph.get_neighbors(source))
+        assert calls.count(source) == 2
+
+    def test_read_only(self, sweep: ParameterSweep) -> None:
+        """Tests that the structure of an implicit graph cannot change.
+
+        Args:
+            sweep (ParameterSweep): A lazily enumerated parameter sweep.
+        """
+        graph = ImplicitGraph(sweep, sweep.neighbors)
+        node = ("setup", 0)
+        edge = next(iter(graph.get_neighbors(node)))
+        assert edge == GraphEdge(node, ("run", 0, 0, 0), 0)
+
+        with pytest.raises(RuntimeError):
+            graph.add_edge(node, node)
+        with pytest.raises(RuntimeError):
+            graph.remove_edge(node, edge.destination)
+        with pytest.raises(RuntimeError):
+            graph.delete_edges(node)
+        with pytest.raises(RuntimeError):
+            del graph[node]
+
+    def test_merge(self) -> None:
+        """Tests that an implicit graph can be merged into an explicit one."""
+        graph = ImplicitGraph(
+            range(4), lambda key: [(key + 1) % 4], value=lambda key: key * 2
+        )
+        explicit = AdjacencyGraph()
+        explicit.merge(graph)
+        assert list(explicit) == [0, 1, 2, 3]
+        assert explicit[3] == 6
+        assert sorted(explicit.edges()) == sorted(graph.edges())
+
+        renamed = AdjacencyGraph()
+        renamed.merge(graph, key_remap=lambda index, key: f"n{key}")
+        assert list(renamed) == ["n0", "n1", "n2", "n3"]
+        assert renamed["n1"] == 2
+        assert [edge.destination for edge in renamed.get_neighbors("n3")] == [
+            "n0"
+        ]
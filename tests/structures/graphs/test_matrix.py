@@ -0,0 +1,174 @@
+from random import randint
+from typing import List
+
+import pytest
+
+from pyaestro.dataclasses import GraphEdge
+from pyaestro.structures.graphs import AdjacencyGraph, MatrixGraph
+from pyaestro.structures.graphs.algorithms import (
+    DefaultCycleCheck,
+    Reachability,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def random_graphs(nodes: List[str], acyclic: bool = False) -> tuple:
+    """Create the same random weighted graph as a matrix and adjacency list.
+
+    Args:
+        nodes (List[str]): Names of the vertices.
+        acyclic (bool): Only add edges that lead to later vertices.
+
+    Returns:
+        tuple: A MatrixGraph and an AdjacencyGraph holding the same edges.
+    """
+    graphs = MatrixGraph(capacity=1), AdjacencyGraph()
+    for graph in graphs:
+        for node in nodes:
+            graph[node] = None
+
+    for i, src in enumerate(nodes):
+        for j, dest in enumerate(nodes):
+            if (acyclic and j <= i) or randint(0, 3):
+                continue
+            weight = randint(0, 10)
+            for graph in graphs:
+                graph.add_edge(src, dest, weight)
+
+    return graphs
+
+
+class TestMatrixGraph:
+    def test_storage(self, sized_node_list: List[str]) -> None:
+        """Tests that the matrix reports the same edges as an adjacency list.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        matrix, adjacency = random_graphs(sized_node_list)
+        assert len(matrix) == len(sized_node_list)
+        assert sorted(matrix.edges()) == sorted(adjacency.edges())
+        for node in sized_node_list:
+            assert sorted(matrix.get_neighbors(node)) == sorted(
+                adjacency.get_neighbors(node)
+            )
+
+        with pytest.raises(KeyError):
+            matrix.add_edge(sized_node_list[0], "missing")
+        with pytest.raises(KeyError):
+            list(matrix.get_neighbors("missing"))
+
+    def test_delete_and_reuse(self, sized_node_list: List[str]) -> None:
+        """Tests that deleted vertices take their edges with them.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        matrix, _ = random_graphs(sized_node_list)
+        first = sized_node_list[0]
+        del matrix[first]
+        for edge in matrix.edges():
+            assert first not in (edge.source, edge.destination)
+
+        matrix["new"] = None
+        assert list(matrix.get_neighbors("new")) == []
+        assert all(edge.destination != "new" for edge in matrix.edges())
+
+        matrix.add_edge("new", "new", 2)
+        matrix.remove_edge("new", "new")
+        with pytest.raises(KeyError):
+            matrix.remove_edge("new", "new")
+
+    def test_unweighted(self) -> None:
+        """Tests that unweighted graphs refuse weights."""
+        matrix = MatrixGraph(weighted=False)
+        matrix["A"] = None
+        matrix.add_edge("A", "A")
+        assert list(matrix.edges()) == [GraphEdge("A", "A", 0)]
+        with pytest.raises(ValueError):
+            matrix.add_edge("A", "A", 1)
+
+    def test_transitive_closure(self, sized_node_list: List[str]) -> None:
+        """Tests the closure against a breadth-first reachability search.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        matrix, adjacency = random_graphs(sized_node_list)
+        closure = matrix.transitive_closure()
+        assert closure is matrix.transitive_closure()
+        assert not closure.flags.writeable
+
+        nodes = list(matrix)
+        for i, node in enumerate(nodes):
+            reachable = Reachability.reachable(adjacency, node) - {node}
+            row = {nodes[j] for j in np.flatnonzero(closure[i])} - {node}
+            assert row == reachable
+
+        cyclic = DefaultCycleCheck.detect_cycles(adjacency)
+        assert matrix.has_cycle() == cyclic
+
+    def test_acyclic(self, sized_node_list: List[str]) -> None:
+        """Tests that forward-only graphs are reported as acyclic.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        matrix, _ = random_graphs(sized_node_list, acyclic=True)
+        for i in range(1, len(sized_node_list)):
+            matrix.add_edge(sized_node_list[i - 1], sized_node_list[i])
+        assert not matrix.has_cycle()
+
+        matrix.add_edge(sized_node_list[-1], sized_node_list[0])
+        assert matrix.has_cycle()
+
+    def test_shortest_paths(self, sized_node_list: List[str]) -> None:
+        """Tests Floyd-Warshall against Bellman-Ford style relaxation.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        matrix, adjacency = random_graphs(sized_node_list)
+        distance = matrix.shortest_paths()
+        nodes = list(matrix)
+        for i, source in enumerate(nodes):
+            expected = {source: 0}
+            for _ in nodes:
+                for edge in adjacency.edges():
+                    if edge.source in expected:
+                        length = expected[edge.source] + (edge.value or 1)
+                        if length < expected.get(edge.destination, np.inf):
+                            expected[edge.destination] = length
+            for j, dest in enumerate(nodes):
+                assert distance[i, j] == expected.get(dest, np.inf)
+
+    def test_cache_invalidation(self) -> None:
+        """Tests that analyses are recomputed after a mutation."""
+        matrix = MatrixGraph()
+        matrix["A"] = None
+        matrix["B"] = None
+        assert not matrix.transitive_closure().any()
+
+        matrix.add_edge("A", "B", 3)
+        assert matrix.transitive_closure()[0, 1]
+        assert matrix.shortest_paths()[0, 1] == 3
+
+    def test_replay(self, sized_node_list: List[str]) -> None:
+        """Tests that a matrix graph can be rebuilt from its change feed.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        source = MatrixGraph()
+        events = []
+        source.subscribe(events.extend)
+        for node in sized_node_list:
+            source[node] = None
+        for i in range(1, len(sized_node_list)):
+            source.add_edge(sized_node_list[i - 1], sized_node_list[i], i)
+        source.delete_edges(sized_node_list[0])
+
+        replica = MatrixGraph()
+        replica.replay(events)
+        assert sorted(replica.edges()) == sorted(source.edges())
@@ -0,0 +1,204 @@
+from typing import List
+
+import pytest
+
+from pyaestro.structures.constants import EdgeProperty
+from pyaestro.structures.graphs import MultiGraph
+from pyaestro.structures.graphs.algorithms import BreadthFirstSearch
+
+
+class TestEdgeProperty:
+    @pytest.mark.parametrize(
+        "properties, expected",
+        [
+            ([], {EdgeProperty.FORWARD}),
+            ([EdgeProperty.BACKWARD], {EdgeProperty.BACKWARD}),
+            (
+                [EdgeProperty.FORWARD, EdgeProperty.BACKWARD],
+                {EdgeProperty.BIDIRECTION},
+            ),
+            (
+                [EdgeProperty.ACYCLIC, EdgeProperty.WEIGHTED],
+                {
+                    EdgeProperty.ACYCLIC,
+                    EdgeProperty.FORWARD,
+                    EdgeProperty.WEIGHTED,
+                },
+            ),
+        ],
+    )
+    def test_reconcile(self, properties: List, expected: set) -> None:
+        """Tests that properties reduce to a single edge direction.
+
+        Args:
+            properties (List): Properties to reconcile.
+            expected (set): The expected reconciled properties.
+        """
+        assert EdgeProperty.reconile_properties(properties) == expected
+
+    def test_reconcile_conflict(self) -> None:
+        """Tests that acyclic bidirectional edges are rejected."""
+        with pytest.raises(ValueError):
+            EdgeProperty.reconile_properties(
+                [EdgeProperty.BIDIRECTION, EdgeProperty.ACYCLIC]
+            )
+
+
+class TestMultiGraph:
+    @pytest.fixture
+    def layered_graph(self, sized_node_list: List[str]) -> MultiGraph:
+        """Creates a graph with acyclic data and bidirectional control layers.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+
+        Returns:
+            MultiGraph: A graph where the data layer is a chain of the nodes.
+        """
+        g = MultiGraph()
+        g.add_layer("data", [EdgeProperty.ACYCLIC, EdgeProperty.WEIGHTED])
+        g.add_layer("control", [EdgeProperty.BIDIRECTION])
+        for i, node in enumerate(sized_node_list):
+            g[node] = i
+            if i > 0:
+                g.add_edge(sized_node_list[i - 1], node, i, layer="data")
+
+        return g
+
+    def test_shared_vertices(
+        self, layered_graph: MultiGraph, sized_node_list: List[str]
+    ) -> None:
+        """Tests that vertex values are shared between layers.
+
+        Args:
+            layered_graph (MultiGraph): A populated layered graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        assert len(layered_graph) == len(sized_node_list)
+        assert layered_graph.layers == ("data", "control")
+        for i, node in enumerate(sized_node_list):
+            assert layered_graph[node] == i
+
+    def test_layer_queries(
+        self, layered_graph: MultiGraph, sized_node_list: List[str]
+    ) -> None:
+        """Tests that neighbors are queryable per layer and together.
+
+        Args:
+            layered_graph (MultiGraph): A populated layered graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        g = layered_graph
+        first, last = sized_node_list[0], sized_node_list[-1]
+        g.add_edge(first, last, layer="control")
+
+        control = list(g.get_neighbors(last, layers="control"))
+        assert [edge.destination for edge in control] == [first]
+        assert list(g.get_neighbors(last, layers="data")) == []
+
+        together = {edge.destination for edge in g.get_neighbors(first)}
+        expected = {last}
+        if len(sized_node_list) > 1:
+            expected.add(sized_node_list[1])
+        assert together == expected
+
+        data_edges = list(g.edges(layers=["data"]))
+        assert len(data_edges) == len(sized_node_list) - 1
+
+        visited = [node for node, _ in BreadthFirstSearch.search(g, last)]
+        assert sorted(visited) == sorted(sized_node_list)
+
+    def test_acyclic_layer(
+        self, layered_graph: MultiGraph, sized_node_list: List[str]
+    ) -> None:
+        """Tests that acyclic layers reject cycles without being modified.
+
+        Args:
+            layered_graph (MultiGraph): A populated layered graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        g = layered_graph
+        first, last = sized_node_list[0], sized_node_list[-1]
+        num_edges = len(list(g.edges()))
+
+        with pytest.raises(RuntimeError):
+            g.add_edge(last, first, layer="data")
+
+        assert len(list(g.edges())) == num_edges
+        # The control layer has no such restriction.
+        g.add_edge(last, first, layer="control")
+
+    def test_unweighted_layer(self, layered_graph: MultiGraph) -> None:
+        """Tests that unweighted layers refuse weights.
+
+        Args:
+            layered_graph (MultiGraph): A populated layered graph.
+        """
+        node = next(iter(layered_graph))
+        with pytest.raises(ValueError):
+            layered_graph.add_edge(node, node, 1, layer="control")
+
+    def test_ambiguous_layer(self, layered_graph: MultiGraph) -> None:
+        """Tests that edges must name a layer when there are several.
+
+        Args:
+            layered_graph (MultiGraph): A populated layered graph.
+        """
+        node = next(iter(layered_graph))
+        with pytest.raises(ValueError):
+            layered_graph.add_edge(node, node)
+
+        with pytest.raises(KeyError) as excinfo:
+            layered_graph.add_edge(node, node, layer="missing")
+        assert "not found in graph" in str(excinfo)
+
+        with pytest.raises(ValueError):
+            layered_graph.add_layer("data")
+
+    def test_remove_and_delete(
+        self, layered_graph: MultiGraph, sized_node_list: List[str]
+    ) -> None:
+        """Tests removal of single edges and all edges of a vertex.
+
+        Args:
+            layered_graph (MultiGraph): A populated layered graph.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        g = layered_graph
+        first, last = sized_node_list[0], sized_node_list[-1]
+        g.add_edge(first, last, layer="control")
+
+        g.remove_edge(last, first)
+        assert list(g.edges(layers="control")) == []
+        with pytest.raises(KeyError):
+            g.remove_edge(last, first)
+
+        if len(sized_node_list) > 1:
+            middle = sized_node_list[len(sized_node_list) // 2]
+            del g[middle]
+            assert middle not in g
+            for edge in g.edges():
+                assert middle not in (edge.source, edge.destination)
+
+    def test_delete_reverse_index(self) -> None:
+        """Tests that deleting a vertex drops its edges from every layer."""
+        g = MultiGraph()
+        g.add_layer("data", [EdgeProperty.WEIGHTED])
+        g.add_layer("control", [EdgeProperty.BIDIRECTION])
+        for node in "ABCD":
+            g[node] = None
+        g.add_edge("A", "C", 1, layer="data")
+        g.add_edge("B", "C", 2, layer="data")
+        g.add_edge("C", "D", 3, layer="data")
+        g.add_edge("C", "C", 4, layer="data")
+        g.add_edge("A", "C", layer="control")
+
+        del g["C"]
+        assert list(g.edges()) == []
+        for layer in g._layers.values():
+            assert layer._adj_table == {}
+            assert layer._rev_table == {}
+
+        g["C"] = None
+        g.add_edge("A", "C", 5, layer="data")
+        assert [e.destination for e in g.get_neighbors("A")] == ["C"]
@@ -0,0 +1,196 @@
+from typing import List, Type
+
+import pytest
+
+from pyaestro.abstracts.graphs import Graph
+from pyaestro.structures.graphs import (
+    AcyclicAdjGraph,
+    AdjacencyGraph,
+    BidirectionalAdjGraph,
+)
+from pyaestro.structures.graphs.algorithms import DefaultCycleCheck
+from pyaestro.structures.graphs.partition import MultilevelPartitioner
+
+
+def build_grid(graph_type: Type[Graph], side: int) -> Graph:
+    """Builds a square grid whose edges point right and down.
+
+    Args:
+        graph_type (Type[Graph]): A Graph class name to build.
+        side (int): Number of vertices along each side of the grid.
+
+    Returns:
+        Graph: A grid-structured graph.
+    """
+    g = graph_type()
+    for i in range(side * side):
+        g[i] = None
+
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                g.add_edge(node, node + 1)
+            if row + 1 < side:
+                g.add_edge(node, node + side)
+
+    return g
+
+
+class TestMultilevelPartitioner:
+    def test_two_clusters(self) -> None:
+        """Tests that two dense clusters joined by one edge are separated.
+
+        Passing condition is that the only cut edge is the bridge between
+        the clusters.
+        """
+        g = BidirectionalAdjGraph()
+        clusters = [[f"a{i}" for i in range(8)], [f"b{i}" for i in range(8)]]
+        for cluster in clusters:
+            for node in cluster:
+                g[node] = None
+            for start, node in enumerate(cluster, start=1):
+                for neighbor in cluster[start:]:
+                    g.add_edge(node, neighbor)
+        g.add_edge("a0", "b0")
+
+        parts = MultilevelPartitioner.partition(g, 2, seed=0)
+
+        assert len({parts[node] for node in clusters[0]}) == 1
+        assert len({parts[node] for node in clusters[1]}) == 1
+        # The bridge is stored in both directions.
+        assert MultilevelPartitioner.cut_weight(g, parts) == 2
+
+    @pytest.mark.parametrize("k", [1, 2, 3, 4, 8])
+    def test_balance(self, k: int) -> None:
+        """Tests that parts stay within the allowed imbalance.
+
+        Args:
+            k (int): Number of parts.
+        """
+        g = build_grid(AdjacencyGraph, 40)
+        parts = MultilevelPartitioner.partition(g, k, seed=k)
+
+        sizes = [0] * k
+        for part in parts.values():
+            sizes[part] += 1
+
+        assert sorted(parts) == sorted(g)
+        assert max(sizes) <= 1.03 * len(g) / k + 1
+        # A naive split along rows cuts 40 edges per boundary, so a sane
+        # partitioner should never be far worse.
+        assert MultilevelPartitioner.cut_weight(g, parts) <= 100 * (k - 1)
+
+    def test_vertex_weights(self, sized_node_list: List[str]) -> None:
+        """Tests that parts are balanced by vertex weight, not count.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        g = AdjacencyGraph()
+        for i, node in enumerate(sized_node_list):
+            g[node] = 10 if i == 0 else 1
+        for i in range(1, len(sized_node_list)):
+            g.add_edge(sized_node_list[i - 1], sized_node_list[i])
+
+        parts = MultilevelPartitioner.partition(
+            g, 2, vertex_weight=lambda key, value: value, seed=0
+        )
+
+        part_weights = [0, 0]
+        for node, part in parts.items():
+            part_weights[part] += g[node]
+
+        # Unit weighted vertices allow the parts to balance within one.
+        total = sum(part_weights)
+        assert max(part_weights) <= max(1.03 * total / 2 + 1, 10)
+
+    @pytest.mark.parametrize("acyclic", [False, True])
+    def test_zero_weights(self, acyclic: bool) -> None:
+        """Tests that graphs without vertex weight are balanced by count.
+
+        Args:
+            acyclic (bool): Whether to request an acyclic partition.
+        """
+        g = AdjacencyGraph()
+        for i in range(20):
+            g[i] = 0
+            if i:
+                g.add_edge(i - 1, i)
+
+        parts = MultilevelPartitioner.partition(
+            g, 4, vertex_weight=lambda key, value: value, acyclic=acyclic
+        )
+        sizes = [list(parts.values()).count(part) for part in range(4)]
+        assert max(sizes) <= 6
+
+    @pytest.mark.parametrize("k", [2, 3, 5])
+    def test_acyclic(self, k: int) -> None:
+        """Tests that acyclic partitions keep the graph of parts acyclic.
+
+        Args:
+            k (int): Number of parts.
+        """
+        g = build_grid(AcyclicAdjGraph, 20)
+        parts = MultilevelPartitioner.partition(g, k, acyclic=True)
+
+        quotient = AdjacencyGraph()
+        for part in range(k):
+            quotient[part] = None
+        for edge in g.edges():
+            src, dest = parts[edge.source], parts[edge.destination]
+            assert src <= dest
+            if src != dest:
+                quotient.add_edge(src, dest)
+
+        assert not DefaultCycleCheck.detect_cycles(quotient)
+
+    def test_acyclic_coarsened(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tests that acyclic partitions are refined over coarsened levels.
+
+        Args:
+            monkeypatch (MonkeyPatch): Fixture used to record contractions.
+        """
+        levels = []
+        match_order = MultilevelPartitioner._match_order.__func__
+
+        def recording_match(cls, adj_table, weights, order, max_weight):
+            mapping, num_coarse = match_order(
+                cls, adj_table, weights, order, max_weight
+            )
+            levels.append((order, mapping))
+            return mapping, num_coarse
+
+        monkeypatch.setattr(
+            MultilevelPartitioner, "_match_order", classmethod(recording_match)
+        )
+        g = build_grid(AdjacencyGraph, 40)
+        parts = MultilevelPartitioner.partition(g, 4, acyclic=True)
+
+        assert len(levels) > 1
+        for order, mapping in levels:
+            # Coarse vertices are contiguous runs of the topological order.
+            coarse = [mapping[u] for u in order]
+            assert coarse == sorted(coarse)
+        for edge in g.edges():
+            assert parts[edge.source] <= parts[edge.destination]
+        sizes = [list(parts.values()).count(part) for part in range(4)]
+        assert max(sizes) <= 1.03 * 400
+
+    def test_acyclic_cycle(self) -> None:
+        """Tests that acyclic partitioning rejects cyclic graphs."""
+        g = AdjacencyGraph()
+        g["A"] = None
+        g["B"] = None
+        g.add_edge("A", "B")
+        g.add_edge("B", "A")
+
+        with pytest.raises(RuntimeError):
+            MultilevelPartitioner.partition(g, 2, acyclic=True)
+
+    def test_invalid(self) -> None:
+        """Tests degenerate inputs."""
+        with pytest.raises(ValueError):
+            MultilevelPartitioner.partition(AdjacencyGraph(), 0)
+
+        assert MultilevelPartitioner.partition(AdjacencyGraph(), 2) == {}
@@ -0,0 +1,172 @@
+import os
+from typing import Dict, List, Type
+
+import pytest
+
+from pyaestro.abstracts.graphs import Graph
+from pyaestro.structures.graphs import (
+    AcyclicAdjGraph,
+    AdjacencyGraph,
+    BidirectionalAdjGraph,
+)
+from pyaestro.structures.graphs.algorithms import BreadthFirstSearch
+from pyaestro.structures.graphs.payloads import SpillingPayloadStore
+
+
+def descriptor(i: int) -> Dict:
+    """Creates a task descriptor style payload.
+
+    Args:
+        i (int): Index of the task.
+
+    Returns:
+        Dict: A payload with a command, environment and parameters.
+    """
+    return {
+        "cmd": f"echo {i}",
+        "env": {"STEP": str(i)},
+        "params": {"index": i, "values": list(range(i % 5))},
+    }
+
+
+class TestSpillingPayloadStore:
+    def test_mapping(self, sized_node_list: List[str]) -> None:
+        """Tests that the store behaves like a dict while spilling.
+
+        Args:
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        store = SpillingPayloadStore(capacity=2)
+        expected = {}
+        for i, node in enumerate(sized_node_list):
+            store[node] = expected[node] = descriptor(i)
+
+        assert len(store) == len(expected)
+        assert list(store) == list(expected)
+        assert store.spilled == max(0, len(expected) - 2)
+        assert dict(store.items()) == expected
+        assert store.spilled == max(0, len(expected) - 2)
+
+        first = sized_node_list[0]
+        store[first] = "replaced"
+        assert store[first] == "replaced"
+        del store[first]
+        assert first not in store
+        with pytest.raises(KeyError):
+            store[first]
+        with pytest.raises(KeyError):
+            del store[first]
+
+    def test_lru_order(self) -> None:
+        """Tests that reads keep values in memory."""
+        store = SpillingPayloadStore(capacity=2)
+        store["a"] = 1
+        store["b"] = 2
+        assert store["a"] == 1
+        store["c"] = 3
+        # "b" was least recently used and is the only value on disk.
+        assert store.spilled == 1
+        assert store["a"] == 1 and store["c"] == 3 and store.spilled == 1
+        assert store["b"] == 2
+        assert store.spilled == 1
+
+    def test_file(self, tmp_path) -> None:
+        """Tests spilling to a named database and temporary file cleanup.
+
+        Args:
+            tmp_path (Path): A temporary directory for the database.
+        """
+        path = str(tmp_path / "payloads.sqlite")
+        store = SpillingPayloadStore(capacity=0, path=path)
+        store["a"] = descriptor(1)
+        assert store.spilled == 1
+        assert store["a"] == descriptor(1)
+        store.close()
+        assert os.path.exists(path)
+
+        temporary = SpillingPayloadStore(capacity=0)
+        temporary["a"] = 1
+        temp_path = temporary._connection.execute(
+            "PRAGMA database_list"
+        ).fetchone()[2]
+        assert os.path.exists(temp_path)
+        temporary.close()
+        assert not os.path.exists(temp_path)
+
+        with pytest.raises(ValueError):
+            SpillingPayloadStore(capacity=-1)
+
+    def test_delete_cold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tests that deleting a spilled vertex does not load its value.
+
+        Args:
+            monkeypatch (MonkeyPatch): Fixture used to count value loads.
+        """
+        loads = []
+        load = SpillingPayloadStore.__getitem__
+
+        def counting_load(store, key):
+            loads.append(key)
+            return load(store, key)
+
+        store = SpillingPayloadStore(capacity=0)
+        graph = AdjacencyGraph(payloads=store)
+        graph["a"] = descriptor(1)
+        graph["b"] = descriptor(2)
+        monkeypatch.setattr(SpillingPayloadStore, "__getitem__", counting_load)
+        del graph["a"]
+        assert loads == []
+
+        with graph.transaction():
+            del graph["b"]
+        assert loads == ["b"]
+        assert "b" not in graph and store.spilled == 0
+
+
+@pytest.mark.parametrize(
+    "graph_type", (AcyclicAdjGraph, AdjacencyGraph, BidirectionalAdjGraph)
+)
+class TestGraphPayloads:
+    def test_graph(
+        self, graph_type: Type[Graph], sized_node_list: List[str]
+    ) -> None:
+        """Tests graphs whose vertex values spill to disk.
+
+        Passing condition is that values round trip, traversals do not load
+        spilled values, and rollbacks restore spilled values.
+
+        Args:
+            graph_type (Type[Graph]): A Graph class name to test.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        store = SpillingPayloadStore(capacity=1)
+        graph = graph_type(payloads=store)
+        plain = graph_type()
+        for g in (graph, plain):
+            for i, node in enumerate(sized_node_list):
+                g[node] = descriptor(i)
+                if i > 0:
+                    g.add_edge(sized_node_list[i - 1], node)
+
+        spilled = store.spilled
+        source = sized_node_list[0]
+        assert list(BreadthFirstSearch.search(graph, source)) == list(
+            BreadthFirstSearch.search(plain, source)
+        )
+        assert store.spilled == spilled
+
+        for i, node in enumerate(sized_node_list):
+            assert graph[node] == descriptor(i)
+
+        with pytest.raises(ValueError):
+            with graph.transaction():
+                graph[source] = "changed"
+                del graph[sized_node_list[-1]]
+                raise ValueError("Abort")
+        for i, node in enumerate(sized_node_list):
+            assert graph[node] == descriptor(i)
+
+        if graph_type is AcyclicAdjGraph:
+            assert dict(graph.get_fingerprints()) == dict(
+                plain.get_fingerprints()
+            )
@@ -0,0 +1,207 @@
+from random import randint
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from pyaestro.structures.graphs import AdjacencyGraph, ShardedAdjGraph
+from pyaestro.structures.graphs.algorithms import (
+    DefaultCycleCheck,
+    Reachability,
+)
+
+
+@pytest.fixture
+def graphs(
+    sized_node_list: List[str],
+) -> Iterator[Tuple[ShardedAdjGraph, AdjacencyGraph]]:
+    """Creates the same random acyclic graph sharded and in memory.
+
+    Args:
+        sized_node_list (List[str]): A list of unique node names.
+
+    Returns:
+        Iterator[Tuple[ShardedAdjGraph, AdjacencyGraph]]: A sharded graph
+        and an AdjacencyGraph holding the same vertices and edges.
+    """
+    sharded, local = ShardedAdjGraph(workers=3), AdjacencyGraph()
+    for graph in (sharded, local):
+        for i, node in enumerate(sized_node_list):
+            graph[node] = i
+
+    for start, src in enumerate(sized_node_list, start=1):
+        for dest in sized_node_list[start:]:
+            if randint(0, 2) == 0:
+                weight = randint(0, 10)
+                sharded.add_edge(src, dest, weight)
+                local.add_edge(src, dest, weight)
+
+    yield sharded, local
+    sharded.close()
+
+
+class TestShardedAdjGraph:
+    def test_interface(
+        self,
+        graphs: Tuple[ShardedAdjGraph, AdjacencyGraph],
+        sized_node_list: List[str],
+    ) -> None:
+        """Tests that a sharded graph holds the same data as a local one.
+
+        Args:
+            graphs (Tuple[ShardedAdjGraph, AdjacencyGraph]): Equivalent
+            sharded and local graphs.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        sharded, local = graphs
+        assert sharded.workers == 3
+        assert len(sharded) == len(local)
+        assert sorted(sharded) == sorted(local)
+        assert set(sharded.edges()) == set(local.edges())
+        for node in sized_node_list:
+            assert sharded[node] == local[node]
+            assert set(sharded.get_neighbors(node)) == set(
+                local.get_neighbors(node)
+            )
+
+        first = sized_node_list[0]
+        del sharded[first]
+        assert first not in sharded
+        with pytest.raises(KeyError):
+            sharded[first]
+        with pytest.raises(KeyError):
+            sharded.add_edge(first, first)
+        with pytest.raises(KeyError):
+            list(sharded.get_neighbors(first))
+
+    def test_search(
+        self,
+        graphs: Tuple[ShardedAdjGraph, AdjacencyGraph],
+        sized_node_list: List[str],
+    ) -> None:
+        """Tests that a distributed search reaches the same vertices.
+
+        Passing condition is that every vertex is reached once, from a
+        parent that has an edge to it, in non-decreasing distance order.
+
+        Args:
+            graphs (Tuple[ShardedAdjGraph, AdjacencyGraph]): Equivalent
+            sharded and local graphs.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        sharded, local = graphs
+        source = sized_node_list[0]
+        visited = list(sharded.search(source))
+
+        nodes = [node for node, _ in visited]
+        assert len(nodes) == len(set(nodes))
+        assert set(nodes) == Reachability.reachable(local, source)
+
+        depth = {source: 0}
+        for node, parent in visited[1:]:
+            assert node in {e.destination for e in local.get_neighbors(parent)}
+            depth[node] = depth[parent] + 1
+        depths = [depth[node] for node in nodes]
+        assert depths == sorted(depths)
+
+        # Abandoned searches do not affect later ones.
+        next(sharded.search(source))
+        assert list(sharded.search(source)) == visited
+
+        with pytest.raises(KeyError):
+            list(sharded.search("missing"))
+
+    def test_detect_cycles(
+        self,
+        graphs: Tuple[ShardedAdjGraph, AdjacencyGraph],
+        sized_node_list: List[str],
+    ) -> None:
+        """Tests distributed cycle detection against the serial check.
+
+        Args:
+            graphs (Tuple[ShardedAdjGraph, AdjacencyGraph]): Equivalent
+            sharded and local graphs.
+            sized_node_list (List[str]): A list of unique node names.
+        """
+        sharded, local = graphs
+        assert not sharded.detect_cycles()
+
+        last, first = sized_node_list[-1], sized_node_list[0]
+        for graph in (sharded, local):
+            for i in range(1, len(sized_node_list)):
+                graph.add_edge(sized_node_list[i - 1], sized_node_list[i])
+            graph.add_edge(last, first)
+
+        assert sharded.detect_cycles()
+        assert DefaultCycleCheck.detect_cycles(local)
+
+    def test_merge(
+        self, graphs: Tuple[ShardedAdjGraph, AdjacencyGraph]
+    ) -> None:
+        """Tests bulk merges of local graphs into a sharded graph.
+
+        Args:
+            graphs (Tuple[ShardedAdjGraph, AdjacencyGraph]): Equivalent
+            sharded and local graphs.
+        """
+        _, local = graphs
+        sharded = ShardedAdjGraph(workers=2)
+        try:
+            sharded.merge(local, local, key_remap=["a.", "b."])
+            expected = AdjacencyGraph()
+            expected.merge(local, local, key_remap=["a.", "b."])
+            assert set(sharded.edges()) == set(expected.edges())
+            assert {key: sharded[key] for key in sharded} == {
+                key: expected[key] for key in expected
+            }
+        finally:
+            sharded.close()
+
+    def test_failed_merge(
+        self, graphs: Tuple[ShardedAdjGraph, AdjacencyGraph]
+    ) -> None:
+        """Tests that a merge that cannot be sent leaves the workers in sync.
+
+        Args:
+            graphs (Tuple[ShardedAdjGraph, AdjacencyGraph]): Equivalent
+            sharded and local graphs.
+        """
+        sharded, local = graphs
+        unpicklable = AdjacencyGraph()
+        for i in range(10 * sharded.workers):
+            unpicklable[f"new.{i}"] = i
+        # Fail on the last worker, after the others have been sent to.
+        last = next(
+            key
+            for key in unpicklable
+            if sharded._owner(key) == sharded.workers - 1
+        )
+        unpicklable[last] = lambda: None
+
+        with pytest.raises(Exception):
+            sharded.merge(unpicklable)
+        assert not any(key in sharded for key in unpicklable)
+        for key in local:
+            assert sharded[key] == local[key]
+        assert set(sharded.edges()) == set(local.edges())
+
+    def test_replay(
+        self, graphs: Tuple[ShardedAdjGraph, AdjacencyGraph]
+    ) -> None:
+        """Tests that a sharded graph can be rebuilt from a change feed.
+
+        Args:
+            graphs (Tuple[ShardedAdjGraph, AdjacencyGraph]): Equivalent
+            sharded and local graphs.
+        """
+        sharded, local = graphs
+        events = []
+        sharded.subscribe(events.extend)
+        sharded.merge(local, key_remap=["copy."])
+        for key in local:
+            sharded.delete_edges(key)
+
+        replica = AdjacencyGraph()
+        replica.replay(events)
+        assert set(replica.edges()) == set(sharded.edges()) - set(
+            local.edges()
+        )
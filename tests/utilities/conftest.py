@@ -1,6 +1,11 @@
 import os
+import stat
+
 import pytest
 
+from pyaestro.metaclasses import Singleton
+from pyaestro.utilities.executor import Executor
+
 
 @pytest.fixture
 def script_path():
@@ -9,6 +14,53 @@ def script_path():
         return os.path.join(mod_dir, "scripts", script_name)
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope="module")
 def max_workers():
     return 4
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    """Write executable success and failure scripts into a temporary path."""
+    paths = {}
+    for name, body in (
+        ("sleep.sh", "#!/bin/bash\n\nsleep $1\n"),
+        ("fail.sh", "#!/bin/bash\n\nsleep $1\nexit 1\n"),
+        (
+            "spin.sh",
+            "#!/bin/bash\n\n"
+            "spin() { end=$((SECONDS + $1)); while ((SECONDS < end)); do :; "
+            "done; }\n"
+            "spin $1 &\nhead -c 1048576 /dev/zero > spin.dat\nwait\n",
+        ),
+        (
+            "count.sh",
+            "#!/bin/bash\n\nseq $1\necho error >&2\nprintf partial\n"
+            "sleep $2\n",
+        ),
+    ):
+        path = tmp_path / name
+        path.write_text(body)
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+        paths[name] = str(path)
+    return paths
+
+
+@pytest.fixture
+def local_executor(max_workers):
+    """Create a new Executor in place of the process-wide singleton."""
+    Singleton._instances.pop(Executor, None)
+    executor = Executor(max_workers, cores=max_workers)
+    yield executor
+    executor.shutdown()
+    Singleton._instances.pop(Executor, None)
+
+
+@pytest.fixture
+def sampling_executor(max_workers):
+    """Create a new Executor that samples the resource usage of tasks."""
+    Singleton._instances.pop(Executor, None)
+    executor = Executor(max_workers, cores=max_workers, sample_usage=True)
+    yield executor
+    executor.shutdown()
+    Singleton._instances.pop(Executor, None)
@@ -1,7 +1,6 @@
 import os
 from pprint import pprint
 from random import randint, random
-from time import sleep
 
 from pyaestro.utilities.executor import Executor, ExecTaskState
 
@@ -44,7 +43,6 @@ for uuid, state in executor.get_all_status():
     if state == ExecTaskState.RUNNING:
         executor.cancel(uuid)
 
-while True:
-    print("Waiting...")
-    print(executor.get_all_status())
-    sleep(30)
+print("Waiting...")
+executor.wait(jobids)
+pprint(dict(executor.get_all_status()))
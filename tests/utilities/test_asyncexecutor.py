@@ -0,0 +1,98 @@
+import asyncio
+import os
+import threading
+
+from psutil import Process
+
+from pyaestro.utilities.asyncexecutor import AsyncExecutor
+from pyaestro.utilities.executor import ExecCancel, ExecTaskState
+
+
+class TestAsyncExecutor:
+    def test_states(self, scripts, tmp_path):
+        async def run():
+            executor = AsyncExecutor(2)
+            ok = executor.submit(scripts["sleep.sh"], str(tmp_path), "0")
+            bad = executor.submit(scripts["fail.sh"], str(tmp_path), "0")
+            raw = executor.submit(
+                scripts["sleep.sh"], str(tmp_path), "0", shell=False
+            )
+            assert executor.get_status(ok) == ExecTaskState.PENDING
+
+            states = await asyncio.gather(
+                *(executor.get_task(t) for t in (ok, bad, raw))
+            )
+            assert states == [
+                ExecTaskState.SUCCESS,
+                ExecTaskState.FAILED,
+                ExecTaskState.SUCCESS,
+            ]
+            assert dict(executor.get_all_status())[bad] == states[1]
+            assert os.path.exists(tmp_path / f"local-{ok}.out")
+
+        asyncio.run(run())
+
+    def test_concurrency(self, scripts, tmp_path):
+        async def run():
+            executor = AsyncExecutor(2)
+            ids = [
+                executor.submit(scripts["sleep.sh"], str(tmp_path), "0.2")
+                for _ in range(4)
+            ]
+            await asyncio.sleep(0.1)
+            states = [executor.get_status(t) for t in ids]
+            assert states.count(ExecTaskState.RUNNING) == 2
+            assert states.count(ExecTaskState.PENDING) == 2
+            await asyncio.gather(*(executor.get_task(t) for t in ids))
+
+        asyncio.run(run())
+
+    def test_cancel(self, scripts, tmp_path):
+        async def run():
+            executor = AsyncExecutor(1)
+            running = executor.submit(scripts["sleep.sh"], str(tmp_path), "30")
+            pending = executor.submit(scripts["sleep.sh"], str(tmp_path), "30")
+            await asyncio.sleep(0.1)
+
+            assert await executor.cancel("missing") == ExecCancel.JOBNOTFOUND
+            await executor.cancel_all()
+            states = await asyncio.gather(
+                executor.get_task(running), executor.get_task(pending)
+            )
+            assert states == [ExecTaskState.CANCELLED] * 2
+            assert await executor.cancel(running) == ExecCancel.SUCCESS
+
+        asyncio.run(asyncio.wait_for(run(), 10))
+
+    def test_many_processes(self, scripts, tmp_path):
+        async def run():
+            executor = AsyncExecutor(300)
+            ids = [
+                executor.submit(scripts["sleep.sh"], str(tmp_path), "0.5")
+                for _ in range(300)
+            ]
+            await asyncio.sleep(0.3)
+            states = [executor.get_status(t) for t in ids]
+            assert states.count(ExecTaskState.RUNNING) == 300
+            if hasattr(asyncio, "PidfdChildWatcher"):
+                # Children are not reaped by a thread each.
+                assert threading.active_count() < 10
+            states = await asyncio.gather(*(executor.get_task(t) for t in ids))
+            assert states == [ExecTaskState.SUCCESS] * 300
+
+        asyncio.run(asyncio.wait_for(run(), 30))
+
+    def test_cancel_spawning(self, scripts, tmp_path):
+        async def run():
+            executor = AsyncExecutor(1)
+            taskid = executor.submit(scripts["sleep.sh"], str(tmp_path), "30")
+            record = executor._records[taskid]
+            # Cancel once the child exists but before it is handed back.
+            while not Process().children():
+                await asyncio.sleep(0)
+            assert record.process is None
+            assert await executor.cancel(taskid) == ExecCancel.SUCCESS
+            assert await executor.get_task(taskid) == ExecTaskState.CANCELLED
+            assert record.process.returncode is not None
+
+        asyncio.run(asyncio.wait_for(run(), 10))
@@ -0,0 +1,121 @@
+"""
+Benchmarks of the Executor.
+
+Each benchmark runs a scaled down workload along with the rest of the suite
+so that it keeps working, and prints what it measured. To run the full
+workloads, set PYAESTRO_BENCHMARK_SCALE to 1:
+
+    PYAESTRO_BENCHMARK_SCALE=1 pytest -s tests/utilities/test_benchmarks.py
+"""
+
+import os
+from random import Random
+from threading import Event, Thread
+from time import perf_counter
+
+import pytest
+
+from pyaestro.metaclasses import Singleton
+from pyaestro.utilities.executor import ExecTaskState, Executor
+
+#: Fraction of the full size of each workload to run.
+SCALE = float(os.environ.get("PYAESTRO_BENCHMARK_SCALE", "0.02"))
+
+
+def percentile(samples, fraction):
+    """Get the value below which a fraction of the samples fall."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@pytest.fixture
+def make_executor():
+    """Create Executors in place of the singleton, shutting them down."""
+    created = []
+
+    def make(workers):
+        Singleton._instances.pop(Executor, None)
+        created.append(Executor(workers, cores=workers))
+        return created[-1]
+
+    yield make
+    for executor in created:
+        executor.shutdown()
+    Singleton._instances.pop(Executor, None)
+
+
+def test_status_latency(make_executor, scripts, tmp_path):
+    """
+    Time get_status while tasks finish and are cancelled around it.
+
+    The full workload runs 4,000 tasks of 0-0.9 s sleeps on 256 slots and
+    queries statuses for 5 s, while another thread cancels running tasks.
+    """
+    executor = make_executor(256)
+    rng = Random(43)
+    taskids = [
+        executor.submit(
+            scripts["sleep.sh"], str(tmp_path), f"{rng.random() * 0.9:.2f}"
+        )
+        for _ in range(max(1, int(4000 * SCALE)))
+    ]
+
+    stop = Event()
+
+    def cancel():
+        picker = Random(44)
+        while not stop.is_set():
+            taskid = picker.choice(taskids)
+            if executor.get_status(taskid) == ExecTaskState.RUNNING:
+                executor.cancel(taskid)
+            stop.wait(0.01)
+
+    canceller = Thread(target=cancel, daemon=True)
+    canceller.start()
+    latencies = []
+    deadline = perf_counter() + 5 * SCALE
+    while perf_counter() < deadline:
+        taskid = rng.choice(taskids)
+        start = perf_counter()
+        executor.get_status(taskid)
+        latencies.append(perf_counter() - start)
+    stop.set()
+    canceller.join()
+
+    print(
+        f"\nget_status over {len(latencies)} calls: "
+        f"p50 {percentile(latencies, 0.5) * 1e6:.1f} us, "
+        f"p99 {percentile(latencies, 0.99) * 1e6:.1f} us, "
+        f"max {max(latencies) * 1e3:.2f} ms"
+    )
+    assert latencies
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_submission_rate(make_executor, scripts, tmp_path, batched):
+    """
+    Time submitting tasks one at a time and in a single batch.
+
+    The full workload submits 100,000 tasks to an Executor whose only slot
+    is busy, so that none of them start.
+    """
+    executor = make_executor(1)
+    workspace = str(tmp_path)
+    executor.submit(scripts["sleep.sh"], workspace, "30")
+    specs = [(scripts["sleep.sh"], workspace, ("0",))] * max(
+        1, int(100000 * SCALE)
+    )
+
+    start = perf_counter()
+    if batched:
+        taskids = executor.submit_many(specs)
+    else:
+        taskids = [
+            executor.submit(script, path, *args)
+            for script, path, args in specs
+        ]
+    elapsed = perf_counter() - start
+
+    method = "submit_many" if batched else "submit"
+    print(f"\n{method}: {len(specs) / elapsed:,.0f} tasks/s")
+    assert len(set(taskids)) == len(specs)
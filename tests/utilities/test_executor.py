@@ -1,12 +1,619 @@
+import gc
+import os
+from random import Random
+from threading import Thread
+import time
+
 import pytest
 
+from pyaestro.metaclasses import Singleton
 import pyaestro.utilities.executor as executor
+from pyaestro.structures.graphs import AcyclicAdjGraph
+from pyaestro.structures.graphs.algorithms import DefaultCycleCheck
+from pyaestro.utilities.executor import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    ExecCancel,
+    ExecTaskState,
+    _TaskQueue,
+)
+
+
+def wait_for(local_executor, taskids, timeout=10):
+    """Wait until every task has reached a final state."""
+    done = {
+        ExecTaskState.SUCCESS,
+        ExecTaskState.FAILED,
+        ExecTaskState.CANCELLED,
+    }
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        states = [local_executor.get_status(t) for t in taskids]
+        if all(state in done for state in states):
+            return states
+        time.sleep(0.01)
+    raise TimeoutError(f"Tasks did not finish: {states}")
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope="function")
 def configure_executor(max_workers, num_ok, num_run, num_fail, num_total):
     executor.Executor(max_workers)
 
 
 class TestExecutor:
-    pass
+    def test_states(self, local_executor, scripts, tmp_path):
+        ok = local_executor.submit(scripts["sleep.sh"], str(tmp_path), "0")
+        bad = local_executor.submit(scripts["fail.sh"], str(tmp_path), "0")
+        missing = local_executor.submit(str(tmp_path / "no.sh"), str(tmp_path))
+
+        states = wait_for(local_executor, [ok, bad, missing])
+        assert states == [
+            ExecTaskState.SUCCESS,
+            ExecTaskState.FAILED,
+            ExecTaskState.FAILED,
+        ]
+        assert dict(local_executor.get_all_status())[ok] == states[0]
+
+    def test_concurrency(self, local_executor, scripts, tmp_path, max_workers):
+        taskids = [
+            local_executor.submit(scripts["sleep.sh"], str(tmp_path), "0.3")
+            for _ in range(2 * max_workers)
+        ]
+        time.sleep(0.15)
+        states = [local_executor.get_status(t) for t in taskids]
+        assert states.count(ExecTaskState.RUNNING) == max_workers
+        assert states.count(ExecTaskState.PENDING) == max_workers
+
+        states = wait_for(local_executor, taskids)
+        assert states == [ExecTaskState.SUCCESS] * len(taskids)
+
+    def test_cancel(self, local_executor, scripts, tmp_path, max_workers):
+        taskids = [
+            local_executor.submit(scripts["sleep.sh"], str(tmp_path), "30")
+            for _ in range(max_workers + 1)
+        ]
+        time.sleep(0.15)
+        assert local_executor.cancel("missing") == ExecCancel.JOBNOTFOUND
+        assert local_executor.cancel(taskids[-1]) == ExecCancel.SUCCESS
+        assert (
+            local_executor.get_status(taskids[-1]) == ExecTaskState.CANCELLED
+        )
+
+        local_executor.cancel_all()
+        states = wait_for(local_executor, taskids)
+        assert states == [ExecTaskState.CANCELLED] * len(taskids)
+
+    def test_subscribe(self, local_executor, scripts, tmp_path):
+        events = []
+
+        def callback(taskid, state):
+            events.append((taskid, state))
+
+        local_executor.subscribe(callback)
+        ok = local_executor.submit(scripts["sleep.sh"], str(tmp_path), "0")
+        local_executor.wait([ok], timeout=10)
+        local_executor.unsubscribe(callback)
+
+        assert events == [
+            (ok, ExecTaskState.PENDING),
+            (ok, ExecTaskState.RUNNING),
+            (ok, ExecTaskState.SUCCESS),
+        ]
+        with pytest.raises(ValueError):
+            local_executor.unsubscribe(callback)
+
+    def test_wait(self, local_executor, scripts, tmp_path):
+        fast = local_executor.submit(scripts["fail.sh"], str(tmp_path), "0")
+        slow = local_executor.submit(scripts["sleep.sh"], str(tmp_path), "30")
+
+        start = time.time()
+        done, pending = local_executor.wait(
+            [fast, slow], return_when=FIRST_COMPLETED, timeout=10
+        )
+        assert (done, pending) == ({fast}, {slow})
+        assert time.time() - start < 5
+
+        done, pending = local_executor.wait([fast, slow], timeout=0.1)
+        assert (done, pending) == ({fast}, {slow})
+
+        local_executor.cancel(slow)
+        done, pending = local_executor.wait(
+            [fast, slow], return_when=ALL_COMPLETED
+        )
+        assert (done, pending) == ({fast, slow}, set())
+
+        with pytest.raises(KeyError):
+            local_executor.wait(["missing"])
+        with pytest.raises(ValueError):
+            local_executor.wait([fast], return_when="SOMETIMES")
+
+    def test_cancel_race(self, local_executor, scripts, tmp_path):
+        events = {}
+
+        def callback(taskid, state):
+            events.setdefault(taskid, []).append(state)
+
+        local_executor.subscribe(callback)
+        rng = Random(43)
+        taskids = [
+            local_executor.submit(
+                scripts["sleep.sh"], str(tmp_path), f"{rng.random() / 10:.3f}"
+            )
+            for _ in range(60)
+        ]
+        final = set(executor.FINAL_STATES)
+        observed = {taskid: [] for taskid in taskids}
+        cancelled = {}
+
+        def cancel():
+            for taskid in rng.sample(taskids, 30):
+                cancelled[taskid] = local_executor.cancel(taskid)
+                time.sleep(0.005)
+
+        def poll():
+            while not all(
+                states and states[-1] in final for states in observed.values()
+            ):
+                for taskid in taskids:
+                    observed[taskid].append(local_executor.get_status(taskid))
+
+        threads = [
+            Thread(target=cancel, daemon=True),
+            Thread(target=poll, daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+            assert not thread.is_alive()
+        done, pending = local_executor.wait(taskids, timeout=10)
+        local_executor.unsubscribe(callback)
+
+        assert pending == set()
+        assert set(cancelled.values()) == {ExecCancel.SUCCESS}
+        for taskid in taskids:
+            state = local_executor.get_status(taskid)
+            assert state in (ExecTaskState.SUCCESS, ExecTaskState.CANCELLED)
+            if taskid not in cancelled:
+                assert state == ExecTaskState.SUCCESS
+            # A task reaches one final state, is reported once, and is never
+            # seen to leave it.
+            states = observed[taskid]
+            first = next(i for i, s in enumerate(states) if s in final)
+            assert set(states[first:]) == {state}
+            assert events[taskid][-1] == state
+            assert [s for s in events[taskid] if s in final] == [state]
+
+    def test_wait_race(self, local_executor, scripts, tmp_path, monkeypatch):
+        taskid = local_executor.submit(
+            scripts["sleep.sh"], str(tmp_path), "0.1"
+        )
+
+        class SlowWaiter(executor._Waiter):
+            __slots__ = ()
+
+            def __init__(self, pending, done):
+                # The task finishes after wait has read its state but before
+                # the waiter is registered.
+                deadline = time.time() + 5
+                while time.time() < deadline:
+                    state = local_executor.get_status(taskid)
+                    if state in executor.FINAL_STATES:
+                        break
+                    time.sleep(0.01)
+                super().__init__(pending, done)
+
+        monkeypatch.setattr(executor, "_Waiter", SlowWaiter)
+        start = time.time()
+        done, pending = local_executor.wait([taskid], timeout=5)
+        assert (done, pending) == ({taskid}, set())
+        assert time.time() - start < 4
+
+    def test_submit_many(self, local_executor, scripts, tmp_path):
+        workspace = str(tmp_path)
+        taskids = local_executor.submit_many(
+            [
+                (scripts["sleep.sh"], workspace, ("0",)),
+                (scripts["fail.sh"], workspace, ("0",)),
+                (scripts["sleep.sh"], workspace, ["0"], {"stdout": "x.out"}),
+                (scripts["sleep.sh"], workspace),
+            ]
+        )
+        assert len(set(taskids)) == 4
+        done, pending = local_executor.wait(taskids, timeout=10)
+        assert pending == set()
+        assert [local_executor.get_status(t) for t in taskids] == [
+            ExecTaskState.SUCCESS,
+            ExecTaskState.FAILED,
+            ExecTaskState.SUCCESS,
+            # Without arguments, sleep exits with an error.
+            ExecTaskState.FAILED,
+        ]
+        assert (tmp_path / "x.out").exists()
+        assert local_executor.submit_many([]) == []
+
+    def test_submit_pending(self, local_executor, scripts, tmp_path):
+        workspace = str(tmp_path)
+        seen = []
+
+        def callback(taskid, state):
+            if state == ExecTaskState.PENDING:
+                seen.append((taskid, local_executor.get_status(taskid)))
+
+        local_executor.subscribe(callback)
+        taskids = [local_executor.submit(scripts["sleep.sh"], workspace, "0")]
+        taskids += local_executor.submit_many(
+            [(scripts["sleep.sh"], workspace, ("0",))] * 3
+        )
+        local_executor.wait(taskids, timeout=10)
+        local_executor.unsubscribe(callback)
+
+        assert [taskid for taskid, _ in seen] == taskids
+        assert {state for _, state in seen} <= {
+            ExecTaskState.PENDING,
+            ExecTaskState.RUNNING,
+            ExecTaskState.SUCCESS,
+        }
+
+    def test_submit_many_invalid(self, local_executor, scripts, tmp_path):
+        workspace = str(tmp_path)
+        events = []
+        local_executor.subscribe(lambda *event: events.append(event))
+        with pytest.raises(ValueError):
+            local_executor.submit_many(
+                [
+                    (scripts["sleep.sh"], workspace, ("0",)),
+                    (scripts["sleep.sh"], workspace, ("0",), {"cores": 1e9}),
+                    (scripts["sleep.sh"], workspace, ("0",)),
+                ]
+            )
+        assert events == []
+        assert list(local_executor.get_all_status()) == []
+
+    def test_resources(self, local_executor, scripts, tmp_path, max_workers):
+        workspace = str(tmp_path)
+        assert local_executor.capacity[:2] == (max_workers, max_workers)
+
+        # A task using every core runs alone, and a task that cannot fit
+        # behind it is passed by small tasks that can.
+        wide = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0.3", cores=max_workers
+        )
+        time.sleep(0.1)
+        big = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0.3", cores=max_workers - 1
+        )
+        small = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0.3", cores=1
+        )
+        time.sleep(0.1)
+        assert local_executor.get_status(wide) == ExecTaskState.RUNNING
+        assert local_executor.get_status(big) == ExecTaskState.PENDING
+        assert local_executor.get_status(small) == ExecTaskState.PENDING
+
+        local_executor.wait([wide], timeout=10)
+        time.sleep(0.1)
+        assert local_executor.get_status(big) == ExecTaskState.RUNNING
+        assert local_executor.get_status(small) == ExecTaskState.RUNNING
+        local_executor.wait([big, small], timeout=10)
+
+        with pytest.raises(ValueError):
+            local_executor.submit(
+                scripts["sleep.sh"], workspace, "0", cores=max_workers + 1
+            )
+        with pytest.raises(ValueError):
+            local_executor.submit(scripts["sleep.sh"], workspace, memory=-1)
+
+    def test_backfill(self, local_executor, scripts, tmp_path, max_workers):
+        workspace = str(tmp_path)
+        half = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0.5", cores=max_workers // 2
+        )
+        time.sleep(0.1)
+        wide = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0", cores=max_workers
+        )
+        small = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0.5", cores=1
+        )
+        time.sleep(0.1)
+        assert local_executor.get_status(half) == ExecTaskState.RUNNING
+        assert local_executor.get_status(wide) == ExecTaskState.PENDING
+        assert local_executor.get_status(small) == ExecTaskState.RUNNING
+        local_executor.wait([half, wide, small], timeout=10)
+
+    def test_usage(self, sampling_executor, scripts, tmp_path):
+        taskid = sampling_executor.submit(
+            scripts["spin.sh"], str(tmp_path), "2"
+        )
+        sampling_executor.wait([taskid], timeout=10)
+
+        usage = sampling_executor.get_usage(taskid)
+        assert usage.samples > 1
+        assert usage.cpu_time > 0.2
+        assert usage.peak_rss > 0
+        assert usage.write_bytes >= 0
+
+    def test_usage_disabled(self, local_executor, scripts, tmp_path):
+        taskid = local_executor.submit(scripts["sleep.sh"], str(tmp_path), "0")
+        local_executor.wait([taskid], timeout=10)
+        assert local_executor.get_usage(taskid) is None
+
+    def test_descriptors(self, local_executor, scripts, tmp_path):
+        opened = len(os.listdir("/proc/self/fd"))
+        taskids = local_executor.submit_many(
+            (scripts["count.sh"], str(tmp_path), ("3", "0"), {"capture": n})
+            for n in (0, 5) * 20
+        )
+        local_executor.wait(taskids, timeout=10)
+        assert len(os.listdir("/proc/self/fd")) <= opened + 2
+
+    def test_tail(self, local_executor, scripts, tmp_path):
+        workspace = str(tmp_path)
+        taskid = local_executor.submit(
+            scripts["count.sh"],
+            workspace,
+            "5",
+            "30",
+            capture=3,
+            stdout="count.out",
+        )
+        deadline = time.time() + 10
+        while local_executor.tail(taskid, 1) != ["partial"]:
+            assert time.time() < deadline
+            time.sleep(0.01)
+
+        assert local_executor.tail(taskid) == ["3", "4", "5", "partial"]
+        assert local_executor.tail(taskid, 2) == ["5", "partial"]
+        assert local_executor.tail(taskid, 0) == []
+        assert local_executor.tail(taskid, stream="stderr") == ["error"]
+        with pytest.raises(ValueError):
+            local_executor.tail(taskid, stream="stdin")
+
+        local_executor.cancel(taskid)
+        local_executor.wait([taskid], timeout=10)
+        # A task is cancelled before its output has been drained and its
+        # log files closed.
+        capture = local_executor._statuses[taskid].record.capture
+        deadline = time.time() + 10
+        while not all(handle.closed for handle in capture.files):
+            assert time.time() < deadline
+            time.sleep(0.01)
+        with open(os.path.join(workspace, "count.out")) as out:
+            assert out.read() == "1\n2\n3\n4\n5\npartial"
+
+        plain = local_executor.submit(scripts["sleep.sh"], workspace, "0")
+        with pytest.raises(ValueError):
+            local_executor.tail(plain)
+
+    # A single worker starts queued tasks one at a time, in queue order.
+    @pytest.mark.parametrize("max_workers", [1])
+    def test_priority(self, local_executor, scripts, tmp_path, max_workers):
+        workspace = str(tmp_path)
+        started = []
+
+        def callback(taskid, state):
+            if state == ExecTaskState.RUNNING:
+                started.append(taskid)
+
+        local_executor.subscribe(callback)
+        blockers = [
+            local_executor.submit(scripts["sleep.sh"], workspace, "0.3")
+            for _ in range(max_workers)
+        ]
+        time.sleep(0.1)
+        low = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0", priority=-1
+        )
+        default = local_executor.submit(scripts["sleep.sh"], workspace, "0")
+        high = local_executor.submit(
+            scripts["sleep.sh"], workspace, "0", priority=1
+        )
+        local_executor.wait(blockers + [low, default, high], timeout=10)
+        local_executor.unsubscribe(callback)
+
+        assert started[max_workers:] == [high, default, low]
+
+    def diamond(self, scripts, tail="sleep.sh"):
+        graph = AcyclicAdjGraph(DefaultCycleCheck)
+        graph["root"] = {"script": scripts["sleep.sh"], "args": ["0"]}
+        graph["left"] = {"script": scripts[tail], "args": ["0"]}
+        graph["right"] = {"script": scripts["sleep.sh"], "args": ["0"]}
+        graph["join"] = {"script": scripts["sleep.sh"], "args": ["0"]}
+        graph["after"] = {"script": scripts["sleep.sh"], "args": ["0"]}
+        graph.add_edge("root", "left")
+        graph.add_edge("root", "right")
+        graph.add_edge("left", "join")
+        graph.add_edge("right", "join")
+        graph.add_edge("join", "after")
+        return graph
+
+    def test_run_graph(self, local_executor, scripts, tmp_path):
+        started = {}
+
+        def callback(taskid, state):
+            if state == ExecTaskState.RUNNING:
+                started[taskid] = time.monotonic()
+
+        local_executor.subscribe(callback)
+        run = local_executor.run_graph(self.diamond(scripts), str(tmp_path))
+        assert run.wait(timeout=10)
+        local_executor.unsubscribe(callback)
+
+        assert run.done()
+        assert run.get_all_status() == dict.fromkeys(
+            ("root", "left", "right", "join", "after"), ExecTaskState.SUCCESS
+        )
+        assert run.progress()[ExecTaskState.SUCCESS] == 5
+        order = sorted(started, key=started.get)
+        taskids = {node: run.get_taskid(node) for node in run.get_all_status()}
+        assert order.index(taskids["root"]) == 0
+        assert order.index(taskids["join"]) == 3
+        assert order.index(taskids["after"]) == 4
+        assert local_executor._subscribers == []
+
+    def test_run_graph_failure(self, local_executor, scripts, tmp_path):
+        graph = self.diamond(scripts, tail="fail.sh")
+        run = local_executor.run_graph(graph, str(tmp_path))
+        assert run.wait(timeout=10)
+
+        assert run.get_all_status() == {
+            "root": ExecTaskState.SUCCESS,
+            "left": ExecTaskState.FAILED,
+            "right": ExecTaskState.SUCCESS,
+            "join": ExecTaskState.CANCELLED,
+            "after": ExecTaskState.CANCELLED,
+        }
+        assert run.get_taskid("join") is None
+
+    def test_run_graph_cancel(self, local_executor, scripts, tmp_path):
+        graph = self.diamond(scripts)
+        graph["root"] = {"script": scripts["sleep.sh"], "args": ["30"]}
+        run = local_executor.run_graph(graph, str(tmp_path))
+        time.sleep(0.1)
+        progress = run.progress()
+        assert progress[ExecTaskState.RUNNING] == 1
+        assert progress[ExecTaskState.INITIALIZED] == 4
+
+        run.cancel()
+        assert run.wait(timeout=10)
+        assert set(run.get_all_status().values()) == {ExecTaskState.CANCELLED}
+
+    def test_run_graph_cancel_race(
+        self, local_executor, scripts, tmp_path, monkeypatch
+    ):
+        graph = AcyclicAdjGraph(DefaultCycleCheck)
+        graph["a"] = {"script": scripts["sleep.sh"], "args": ["0.3"]}
+        graph["b"] = {"script": scripts["sleep.sh"], "args": ["0"]}
+        graph.add_edge("a", "b")
+        run = local_executor.run_graph(graph, str(tmp_path))
+        time.sleep(0.1)
+
+        # Let "a" succeed after "b" is cancelled, as if it had finished
+        # before its own cancellation reached the Executor.
+        monkeypatch.setattr(local_executor, "cancel", lambda taskid: None)
+        run.cancel()
+        local_executor.wait([run.get_taskid("a")], timeout=10)
+        assert run.wait(timeout=10)
+        assert run.get_all_status() == {
+            "a": ExecTaskState.SUCCESS,
+            "b": ExecTaskState.CANCELLED,
+        }
+        assert run.get_taskid("b") is None
+        assert run.progress()[ExecTaskState.CANCELLED] == 1
+
+    def test_shutdown(self, scripts, tmp_path):
+        Singleton._instances.pop(executor.Executor, None)
+        opened = len(os.listdir("/proc/self/fd"))
+        local = executor.Executor(2, cores=2, sample_usage=True)
+        workspace = str(tmp_path)
+        taskids = [
+            local.submit(scripts["count.sh"], workspace, "3", "30", capture=5),
+            local.submit(scripts["sleep.sh"], workspace, "30"),
+            local.submit(scripts["sleep.sh"], workspace, "30"),
+        ]
+        # Each thread starts once the first task it watches has launched.
+        helpers = (local._reaper, local._sampler, local._pump)
+        deadline = time.time() + 10
+        while any(helper._thread is None for helper in helpers):
+            assert time.time() < deadline
+            time.sleep(0.01)
+        threads = [helper._thread for helper in helpers]
+
+        local.shutdown()
+        Singleton._instances.pop(executor.Executor, None)
+        assert all(not thread.is_alive() for thread in threads)
+        assert [local.get_status(t) for t in taskids] == [
+            ExecTaskState.CANCELLED
+        ] * len(taskids)
+        assert len(os.listdir("/proc/self/fd")) <= opened
+        with pytest.raises(RuntimeError):
+            local.submit(scripts["sleep.sh"], workspace, "0")
+        local.shutdown()
+
+    def test_collected(self, scripts, tmp_path):
+        Singleton._instances.pop(executor.Executor, None)
+        opened = len(os.listdir("/proc/self/fd"))
+        local = executor.Executor(1)
+        taskid = local.submit(scripts["sleep.sh"], str(tmp_path), "0")
+        local.wait([taskid], timeout=10)
+        thread = local._reaper._thread
+
+        Singleton._instances.pop(executor.Executor, None)
+        del local
+        gc.collect()
+        thread.join(10)
+        assert not thread.is_alive()
+        assert len(os.listdir("/proc/self/fd")) <= opened
+
+    def test_shutdown_without_cancel(self, scripts, tmp_path):
+        Singleton._instances.pop(executor.Executor, None)
+        local = executor.Executor(1)
+        taskid = local.submit(scripts["sleep.sh"], str(tmp_path), "0.5")
+        deadline = time.time() + 10
+        while local.get_status(taskid) != ExecTaskState.RUNNING:
+            assert time.time() < deadline
+            time.sleep(0.01)
+        process = local._statuses[taskid].record.process
+
+        Singleton._instances.pop(executor.Executor, None)
+        local.shutdown(cancel=False)
+        assert process.poll() is None
+        assert process.wait(10) == 0
+
+
+class TestTaskQueue:
+    def drain(self, queue):
+        items = []
+        while len(queue):
+            entry = queue.pop()
+            queue.charge(entry, 1)
+            items.append(entry[2])
+        return items
+
+    def test_priority(self):
+        queue = _TaskQueue(aging=0, fair_share=False)
+        for item, priority in (("a", 0), ("b", 2), ("c", 1), ("d", 2)):
+            queue.push(item, priority, None, 0)
+        assert self.drain(queue) == ["b", "d", "c", "a"]
+        assert queue.pop() is None
+
+    def test_aging(self):
+        queue = _TaskQueue(aging=1, fair_share=False)
+        queue.push("old", 0, None, 0)
+        queue.push("new", 5, None, 10)
+        queue.push("urgent", 20, None, 10)
+        assert self.drain(queue) == ["urgent", "old", "new"]
+
+    def test_restore(self):
+        queue = _TaskQueue(aging=0, fair_share=False)
+        for item, priority in (("a", 1), ("b", 0)):
+            queue.push(item, priority, None, 0)
+        queue.restore(queue.pop())
+        assert self.drain(queue) == ["a", "b"]
+
+    def test_fair_share(self):
+        queue = _TaskQueue(aging=0, fair_share=True)
+        queue.set_share("b", 2)
+        for i in range(6):
+            queue.push(f"a{i}", 1, "a", 0)
+        for i in range(6):
+            queue.push(f"b{i}", 0, "b", 0)
+
+        first = self.drain(queue)[:6]
+        assert sum(item.startswith("b") for item in first) == 4
+        with pytest.raises(ValueError):
+            queue.set_share("a", 0)
+
+    def test_fair_share_idle_group(self):
+        queue = _TaskQueue(aging=0, fair_share=True)
+        for i in range(4):
+            queue.push(f"a{i}", 0, "a", 0)
+        assert self.drain(queue) == ["a0", "a1", "a2", "a3"]
+
+        # An idle group does not bank credit while another group runs.
+        queue.push("a4", 0, "a", 0)
+        queue.push("a5", 0, "a", 0)
+        queue.push("b0", 0, "b", 0)
+        queue.push("b1", 0, "b", 0)
+        assert self.drain(queue)[:2] in (["a4", "b0"], ["b0", "a4"])